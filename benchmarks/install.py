@@ -0,0 +1,277 @@
+"""Install pipeline benchmark for DevKit CLI.
+
+Generates synthetic template packs (many tiny files, a few multi-MB files,
+deep nesting) and times each stage of the install pipeline against them:
+manifest loading, conflict detection, installs (fresh, overwrite, no-op
+sync), backups, hook configuration, and end-to-end ``devkit init`` in a
+fresh interpreter on cold and warm caches. Results are written as JSON so
+they can be compared across commits.
+
+Usage:
+    python benchmarks/install.py
+    python benchmarks/install.py --scenarios tiny-1k deep --runs 5 --output install.json
+    python benchmarks/install.py --workdir /mnt/nfs/tmp   # Benchmark another filesystem
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from devkit_cli import manifest as manifest_module  # noqa: E402
+from devkit_cli import render as render_module  # noqa: E402
+from devkit_cli.backup import BackupStore  # noqa: E402
+from devkit_cli.config import AGENT_CONFIG, DEVKIT_DIR, SETTINGS_FILE, SETTINGS_REGISTRY  # noqa: E402
+from devkit_cli.core import TemplateManager  # noqa: E402
+from devkit_cli.models import AgentType  # noqa: E402
+from devkit_cli.sources import DirectorySource  # noqa: E402
+
+
+AGENT = AGENT_CONFIG[AgentType.CLAUDE_CODE]
+
+# Synthetic template packs: file count, bytes per file, directory depth
+SCENARIOS = {
+    "tiny-10": {"files": 10, "size": 512, "depth": 1},
+    "tiny-1k": {"files": 1_000, "size": 512, "depth": 2},
+    "tiny-10k": {"files": 10_000, "size": 512, "depth": 3},
+    "large-files": {"files": 8, "size": 4 * 1024 * 1024, "depth": 1},
+    "deep": {"files": 500, "size": 2048, "depth": 24},
+    "templated-1k": {"files": 1_000, "size": 512, "depth": 2, "templated": True},
+}
+DEFAULT_SCENARIOS = ["tiny-10", "tiny-1k", "large-files", "deep"]
+
+# Layout of a synthetic pack: files are spread across these subdirectories
+SUBDIRS = ["agents", "commands", "hooks", "skills"]
+HOOK_COUNT = 3
+
+
+def generate_pack(
+    root: Path, files: int, size: int, depth: int, templated: bool = False, seed: int = 0,
+) -> None:
+    """
+    Write a synthetic template pack with a settings registry.
+
+    Args:
+        root: Pack root to create
+        files: Number of template files
+        size: Bytes per file
+        depth: Directory nesting below each subdirectory
+        templated: Write text with {{ devkit.* }} placeholders instead of random bytes
+        seed: Seed for file contents, so packs are reproducible
+    """
+    rng = random.Random(seed)
+    for i in range(files):
+        subdir = SUBDIRS[i % len(SUBDIRS)]
+        nesting = [f"d{(i // len(SUBDIRS)) % 7}-{level}" for level in range(depth - 1)]
+        path = root.joinpath(subdir, *nesting, f"file-{i:05d}.md")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if templated:
+            line = f"{rng.random():.6f} {{{{ devkit.project_name }}}} in {{{{ devkit.agent_folder }}}}\n"
+            path.write_text((line * (size // len(line) + 1))[:size], encoding="utf-8")
+        else:
+            path.write_bytes(rng.randbytes(size))
+
+    hooks = []
+    for i in range(HOOK_COUNT):
+        script = root / "hooks" / f"hook-{i}.sh"
+        script.parent.mkdir(parents=True, exist_ok=True)
+        script.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        script.chmod(0o755)
+        hooks.append({
+            "hooks": [{
+                "type": "command",
+                "command": f"\"$CLAUDE_PROJECT_DIR\"/{AGENT.folder}/hooks/hook-{i}.sh",
+            }],
+        })
+
+    registry = {"hooks": {"SessionStart": hooks}}
+    (root / SETTINGS_REGISTRY).write_text(json.dumps(registry, indent=2), encoding="utf-8")
+
+
+def clear_caches() -> None:
+    """Forget manifests and compiled templates cached in this process."""
+    manifest_module._MANIFEST_CACHE.clear()
+    render_module._COMPILED_CACHE.clear()
+
+
+def timed(func, runs: int, setup=None) -> dict[str, float]:
+    """
+    Time ``func`` over several runs, calling ``setup`` untimed before each.
+
+    Returns:
+        Median, min and max wall-clock time in milliseconds
+    """
+    samples = []
+    for _ in range(runs):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def _reset_dir(path: Path) -> None:
+    """Remove a directory tree if present."""
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def bench_scenario(pack: Path, work: Path, runs: int) -> dict[str, dict[str, float]]:
+    """Time each pipeline stage against one synthetic pack."""
+    source = DirectorySource(pack)
+    results = {}
+
+    def manager() -> TemplateManager:
+        return TemplateManager(AGENT, source)
+
+    # Manifest: cold walks and hashes the pack, warm hits the in-process cache
+    results["get_template_files_cold"] = timed(lambda: manager().get_template_files(), runs, setup=clear_caches)
+    results["get_template_files_warm"] = timed(lambda: manager().get_template_files(), runs)
+
+    # Install into a new project each run
+    fresh = work / "fresh"
+    results["install_templates_fresh"] = timed(
+        lambda: manager().install_templates(fresh, show_progress=False),
+        runs, setup=lambda: (_reset_dir(fresh), fresh.mkdir()),
+    )
+
+    # A project that already has every template installed
+    installed = work / "installed"
+    _reset_dir(installed)
+    installed.mkdir()
+    manager().install_templates(installed, show_progress=False)
+    agent_folder = installed / AGENT.folder
+    template_files = manager().get_template_files()
+
+    results["detect_conflicts"] = timed(lambda: manager().detect_conflicts(installed), runs)
+    results["install_templates_sync_noop"] = timed(
+        lambda: manager().install_templates(installed, sync=True, show_progress=False), runs,
+    )
+
+    # Overwrite everything: every file is a conflict and gets backed up
+    results["install_templates_overwrite"] = timed(
+        lambda: manager().install_templates(installed, show_progress=False),
+        runs, setup=lambda: _reset_dir(installed / DEVKIT_DIR),
+    )
+
+    # Backups: an empty store stores every blob, a warm one dedupes them all
+    results["create_backup_cold"] = timed(
+        lambda: BackupStore(installed).create(agent_folder, template_files),
+        runs, setup=lambda: _reset_dir(installed / DEVKIT_DIR),
+    )
+    results["create_backup_warm"] = timed(
+        lambda: BackupStore(installed).create(agent_folder, template_files), runs,
+    )
+
+    # Hooks: first write into an empty folder, then the write-free repeat
+    settings_file = agent_folder / SETTINGS_FILE
+    results["configure_hooks_new"] = timed(
+        lambda: manager()._configure_hooks(agent_folder),
+        runs, setup=lambda: settings_file.unlink(missing_ok=True),
+    )
+    results["configure_hooks_repeat"] = timed(lambda: manager()._configure_hooks(agent_folder), runs)
+
+    results.update(bench_cli(pack, work, runs))
+    return results
+
+
+def bench_cli(pack: Path, work: Path, runs: int) -> dict[str, dict[str, float]]:
+    """
+    Time ``devkit --plain init --claude`` in a fresh interpreter.
+
+    Cold runs use an empty cache directory and a new project; warm runs reuse
+    the cache and repeat the install (``--sync``) into the same project.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), env.get("PYTHONPATH")]))
+    cache_dir = work / "cache"
+    env["DEVKIT_CACHE_DIR"] = str(cache_dir)
+    project = work / "cli-project"
+
+    def init(*extra: str) -> None:
+        subprocess.run(
+            [sys.executable, "-m", "devkit_cli.cli", "--plain", "init", str(project),
+             "--claude", "--source", str(pack), *extra],
+            env=env, check=True, capture_output=True,
+        )
+
+    def cold_setup() -> None:
+        _reset_dir(cache_dir)
+        _reset_dir(project)
+
+    results = {"e2e_init_cold": timed(init, runs, setup=cold_setup)}
+    init()
+    results["e2e_init_warm_sync"] = timed(lambda: init("--sync"), runs)
+    return results
+
+
+def git_revision() -> str | None:
+    """Commit of the checkout being benchmarked, if available."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def main() -> int:
+    """Run the install benchmark and return a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=DEFAULT_SCENARIOS,
+                        help="Synthetic packs to benchmark (tiny-10k is slow)")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per measurement")
+    parser.add_argument("--workdir", type=Path, default=None,
+                        help="Directory for generated packs and projects (defaults to the system temp dir)")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "revision": git_revision(),
+        "runs": args.runs,
+        "scenarios": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="devkit-bench-", dir=args.workdir) as tmp:
+        for name in args.scenarios:
+            params = SCENARIOS[name]
+            scenario_dir = Path(tmp) / name
+            pack = scenario_dir / "pack"
+            generate_pack(pack, **params)
+            print(f"{name}: {params['files']} files x {params['size']} bytes, depth {params['depth']}",
+                  file=sys.stderr)
+            results["scenarios"][name] = {
+                **params,
+                "timings": bench_scenario(pack, scenario_dir, args.runs),
+            }
+            clear_caches()
+
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
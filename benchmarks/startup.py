@@ -0,0 +1,134 @@
+"""Startup benchmark for DevKit CLI.
+
+Measures the import cost of the CLI with ``python -X importtime`` and checks
+that plain/quiet runs never load rich or readchar. Results are written as
+JSON so they can be compared across commits.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --max-import-ms 150 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay out of non-interactive runs
+HEAVY_MODULES = ["rich", "readchar"]
+
+# Commands timed end to end (arguments after "devkit")
+COMMANDS = {
+    "version_plain": ["--plain", "version"],
+    "help": ["--help"],
+}
+
+CHECK_SCRIPT = """
+import json, sys
+sys.argv = ["devkit", *{argv!r}]
+from devkit_cli.cli import app
+try:
+    app()
+except SystemExit:
+    pass
+loaded = sorted({{m.split(".")[0] for m in sys.modules}} & set({heavy!r}))
+print(json.dumps(loaded), file=sys.stderr)
+"""
+
+
+def _env() -> dict[str, str]:
+    """Environment that imports devkit_cli from this checkout."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_import_us(module: str) -> dict[str, int]:
+    """
+    Run ``python -X importtime -c "import <module>"`` once.
+
+    Returns:
+        Mapping of imported module name to cumulative import time in microseconds
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum.strip())
+    return cumulative
+
+
+def measure_command_ms(args: list[str]) -> float:
+    """Wall-clock time of one ``devkit`` invocation in a fresh interpreter."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "devkit_cli.cli", *args],
+        capture_output=True, env=_env(),
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def heavy_modules_loaded(args: list[str]) -> list[str]:
+    """Which of HEAVY_MODULES a command imports."""
+    proc = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT.format(argv=args, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=_env(),
+    )
+    return json.loads(proc.stderr.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the startup benchmark and return a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Repetitions per measurement")
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Fail if the median import time of devkit_cli.cli exceeds this")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    import_samples = [measure_import_us("devkit_cli.cli") for _ in range(args.runs)]
+    cli_import_ms = statistics.median(s["devkit_cli.cli"] for s in import_samples) / 1000
+    top_modules = sorted(import_samples[-1].items(), key=lambda item: item[1], reverse=True)[:15]
+
+    results = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "cli_import_ms": round(cli_import_ms, 2),
+        "top_imports_ms": {name: round(us / 1000, 2) for name, us in top_modules},
+        "commands_ms": {
+            name: round(statistics.median(measure_command_ms(argv) for _ in range(args.runs)), 2)
+            for name, argv in COMMANDS.items()
+        },
+        "plain_heavy_imports": heavy_modules_loaded(["--plain", "version"]),
+    }
+
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+
+    failed = False
+    if results["plain_heavy_imports"]:
+        print(f"FAIL: plain mode imported {results['plain_heavy_imports']}", file=sys.stderr)
+        failed = True
+    if args.max_import_ms is not None and cli_import_ms > args.max_import_ms:
+        print(f"FAIL: devkit_cli.cli import took {cli_import_ms:.1f}ms (limit {args.max_import_ms}ms)", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 """Agent resolution and management utilities."""
 
-from devkit_cli.config import AGENT_CONFIG
+from devkit_cli.config import AGENT_ALIASES, AGENT_CONFIG
 from devkit_cli.models import Agent, AgentType
 
 
@@ -54,6 +54,53 @@ def get_agent_by_flag(claude: bool, cursor: bool) -> tuple[Agent | None, str | N
     return None, "Unknown agent flag"
 
 
+def get_agents_by_flags(
+    claude: bool, cursor: bool, names: str | None = None,
+) -> tuple[list[Agent], str | None]:
+    """
+    Resolve one or more agents from command-line flags.
+
+    Unlike ``get_agent_by_flag``, several agents may be selected, for
+    commands that install every agent's templates in one run.
+
+    Args:
+        claude: --claude flag value
+        cursor: --cursor flag value
+        names: --agents value, comma-separated (e.g. "claude,cursor")
+
+    Returns:
+        Tuple of (agents in the order given, error message or None); an
+        empty list with no error means no agent was chosen (will prompt)
+
+    Examples:
+        >>> get_agents_by_flags(False, False, "claude,cursor")
+        ([Agent(CLAUDE_CODE), Agent(CURSOR)], None)
+
+        >>> get_agents_by_flags(False, False, "vim")
+        ([], "Unknown agent 'vim' (choose from claude, claude-code, cursor)")
+    """
+    requested = []
+    if claude:
+        requested.append(AgentType.CLAUDE_CODE)
+    if cursor:
+        requested.append(AgentType.CURSOR)
+    for name in (names or "").split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in AGENT_ALIASES:
+            return [], f"Unknown agent '{name}' (choose from {', '.join(AGENT_ALIASES)})"
+        requested.append(AGENT_ALIASES[name])
+
+    agents = []
+    for agent_type in dict.fromkeys(requested):
+        agent = AGENT_CONFIG[agent_type]
+        if not agent.supported:
+            return [], f"{agent.display_name} is not supported yet"
+        agents.append(agent)
+    return agents, None
+
+
 def get_supported_agents() -> list[Agent]:
     """
     Get list of supported agents only.
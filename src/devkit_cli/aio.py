@@ -0,0 +1,210 @@
+"""asyncio API for installing templates, for services that embed DevKit.
+
+``AsyncTemplateManager`` runs the same install phases as
+``TemplateManager.install_templates`` and returns the same InstallResult,
+without blocking the event loop:
+
+    result = await AsyncTemplateManager(agent).install_templates(project_path)
+
+File operations run on a thread pool. Up to ``max_concurrency`` files are
+staged at once, and the backup of conflicting files runs alongside the
+staging (it only reads the agent folder). The commit and the hook merge run
+once both are done.
+
+Cancelling the install rolls it back: work already running on a thread is
+allowed to finish, the staged files are discarded, and the agent folder is
+left as it was. Once the commit has started it is completed instead
+(together with the hook merge), so the project is never half-updated;
+the cancellation is still raised to the caller.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, TypeVar
+from devkit_cli.core import InstallPlan, TemplateManager
+from devkit_cli.events import get_events
+from devkit_cli.manifest import FileFilter
+from devkit_cli.models import Agent, InstallResult, LinkMode
+from devkit_cli.sources import TemplateSource
+from devkit_cli.timing import get_tracer
+from devkit_cli.transaction import InstallLock, InstallTransaction
+
+
+# Files staged at once by default
+DEFAULT_IO_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+class AsyncTemplateManager:
+    """Installs templates from asyncio code; see the module docstring."""
+
+    def __init__(
+        self,
+        agent: Agent,
+        source: TemplateSource | None = None,
+        file_filter: FileFilter | None = None,
+        variables: dict[str, str] | None = None,
+        max_concurrency: int = DEFAULT_IO_CONCURRENCY,
+        executor: Executor | None = None,
+    ):
+        """
+        Initialize an async template manager.
+
+        Args:
+            agent: Agent configuration to use
+            source: Template pack to install from (defaults to the bundled templates)
+            file_filter: Which template files to install (defaults to all)
+            variables: Template variables, as for TemplateManager
+            max_concurrency: Maximum number of file operations in flight
+            executor: Thread pool to run file operations on (a private pool
+                of ``max_concurrency`` threads is used per install if omitted)
+        """
+        self.manager = TemplateManager(agent, source, file_filter, variables)
+        self.max_concurrency = max(1, max_concurrency)
+        self.executor = executor
+
+    @property
+    def agent(self) -> Agent:
+        """Agent templates are installed for."""
+        return self.manager.agent
+
+    async def install_templates(
+        self,
+        project_path: Path,
+        sync: bool = False,
+        link_mode: LinkMode = LinkMode.COPY,
+    ) -> InstallResult:
+        """
+        Install templates to a project directory.
+
+        Args:
+            project_path: Target project directory
+            sync: Copy only files whose content differs from the templates
+            link_mode: How files are materialized; files DevKit merges into
+                later (MERGED_FILES) are always copied
+
+        Returns:
+            InstallResult with details of the operation
+
+        Raises:
+            DevKitError: If the install fails (nothing is committed)
+            asyncio.CancelledError: If cancelled (rolled back unless the
+                commit had already started)
+        """
+        executor = self.executor or ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="devkit-io",
+        )
+        try:
+            return await self._install(executor, project_path, sync, link_mode)
+        finally:
+            if self.executor is None:
+                # Every submitted call has finished by now
+                executor.shutdown(wait=False)
+
+    async def _install(
+        self,
+        executor: Executor,
+        project_path: Path,
+        sync: bool,
+        link_mode: LinkMode,
+    ) -> InstallResult:
+        """Run the install phases on an executor, holding the project's install lock."""
+        lock = InstallLock(project_path)
+        await _offload(executor, lock.acquire)
+        try:
+            return await self._install_locked(executor, project_path, sync, link_mode)
+        finally:
+            lock.release()
+
+    async def _install_locked(
+        self,
+        executor: Executor,
+        project_path: Path,
+        sync: bool,
+        link_mode: LinkMode,
+    ) -> InstallResult:
+        """Plan, stage and commit an install (see ``_install``)."""
+        manager = self.manager
+        plan = await _offload(executor, partial(manager.plan_install, project_path, sync=sync))
+        if plan is None:
+            return manager.no_templates_result(project_path)
+
+        transaction = InstallTransaction(project_path, plan.agent_folder, plan.files_to_copy, scan=plan.scan)
+        try:
+            await _offload(executor, transaction.begin)
+            start = time.perf_counter()
+            try:
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(_offload(executor, partial(manager.backup_conflicts, plan)))
+                    pending = iter(plan.files_to_copy)
+                    for _ in range(min(self.max_concurrency, len(plan.files_to_copy))):
+                        group.create_task(self._stage_worker(executor, plan, transaction, pending, link_mode))
+            except ExceptionGroup as errors:
+                # Surface the first failure as TemplateManager would
+                raise errors.exceptions[0] from None
+            # Spans nest per thread, and coroutines share the loop's thread,
+            # so the stage is recorded once it is over
+            get_tracer().add_span(
+                "install.stage", start, time.perf_counter(),
+                files=len(plan.files_to_copy), bytes=plan.bytes_to_copy,
+                workers=self.max_concurrency, link_mode=str(link_mode),
+            )
+            get_events().emit(
+                "phase", project=str(project_path), phase="stage",
+                files=len(plan.files_to_copy), bytes=plan.bytes_to_copy,
+            )
+        except BaseException:
+            await _offload(executor, transaction.rollback)
+            raise
+
+        # Past this point the install is completed even if cancelled
+        return await _offload(executor, partial(self._commit, plan, transaction))
+
+    async def _stage_worker(
+        self,
+        executor: Executor,
+        plan: InstallPlan,
+        transaction: InstallTransaction,
+        pending,
+        link_mode: LinkMode,
+    ) -> None:
+        """Stage files from a shared iterator until it is exhausted."""
+        manager = self.manager
+        events = get_events()
+        for rel_path in pending:
+            await _offload(executor, partial(manager.stage_file, plan, transaction, rel_path, link_mode))
+            if events.enabled:
+                manager.emit_file(plan, "copied", rel_path)
+
+    def _commit(self, plan: InstallPlan, transaction: InstallTransaction) -> InstallResult:
+        """Commit staged files and merge hooks (runs on the executor)."""
+        try:
+            self.manager.commit_install(plan, transaction)
+        finally:
+            if not transaction.committed:
+                transaction.rollback()
+        return self.manager.finish_install(plan)
+
+
+async def _offload(executor: Executor, func: Callable[[], T]) -> T:
+    """
+    Run a blocking call on the executor and wait for it.
+
+    A thread cannot be interrupted, so if the caller is cancelled while the
+    call runs, the call is still waited for before the cancellation
+    propagates. Nothing is left running behind the caller's back.
+    """
+    future = asyncio.get_running_loop().run_in_executor(executor, func)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait([future])
+            except asyncio.CancelledError:
+                continue
+        raise
@@ -0,0 +1,260 @@
+"""Content-addressed backup store for DevKit CLI."""
+
+import json
+import os
+import shutil
+import stat
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from devkit_cli.config import BACKUP_DIR, BACKUP_KEEP, BACKUP_MAX_AGE_DAYS
+from devkit_cli.destination import DestinationScan
+from devkit_cli.utils import DevKitError, copy_file, ensure_devkit_dir, ensure_directory, hash_file, write_text_atomic
+
+
+class BackupNotFoundError(DevKitError):
+    """Error when a backup id does not exist in the store."""
+    pass
+
+
+@dataclass(frozen=True)
+class BackupFile:
+    """A single file captured in a backup."""
+    path: Path
+    sha256: str
+    mode: int
+
+
+@dataclass
+class Backup:
+    """A snapshot of the files an install was about to overwrite."""
+    id: str
+    created: datetime
+    agent_folder: str
+    files: list[BackupFile]
+
+
+class BackupStore:
+    """
+    Stores backups as deduplicated blobs plus one small snapshot per backup.
+
+    Layout under ``<project>/.devkit/backups``::
+
+        objects/<sha[:2]>/<sha>     file contents, stored once per unique blob
+        snapshots/<backup-id>.json  paths, hashes and modes for one backup
+    """
+
+    def __init__(self, project_path: Path):
+        """
+        Initialize backup store for a project.
+
+        Args:
+            project_path: Project directory the backups belong to
+        """
+        self.project_path = project_path
+        self.root = project_path / BACKUP_DIR
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+
+    def create(
+        self,
+        agent_folder: Path,
+        rel_paths: list[Path],
+        scan: DestinationScan | None = None,
+    ) -> Backup | None:
+        """
+        Back up only the given files, reusing blobs already in the store.
+
+        Args:
+            agent_folder: Agent folder the paths are relative to
+            rel_paths: Files about to be overwritten
+            scan: Destination scan of agent_folder, to reuse its stat results
+
+        Returns:
+            The new Backup, or None if none of the files exist
+        """
+        files = []
+        if rel_paths:
+            ensure_devkit_dir(self.project_path)
+        for rel_path in rel_paths:
+            source = agent_folder / rel_path
+            if scan is not None:
+                st = scan.stat(rel_path)
+            else:
+                try:
+                    st = source.stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                continue
+            sha256 = hash_file(source)
+            self._store_blob(source, sha256)
+            files.append(BackupFile(path=rel_path, sha256=sha256, mode=stat.S_IMODE(st.st_mode)))
+
+        if not files:
+            return None
+
+        backup = Backup(
+            id=self._new_backup_id(),
+            created=datetime.now(),
+            agent_folder=agent_folder.name,
+            files=files,
+        )
+        write_text_atomic(self.snapshot_path(backup.id), json.dumps(_backup_to_dict(backup), indent=2))
+        return backup
+
+    def list_backups(self) -> list[Backup]:
+        """
+        List all backups in the store.
+
+        Returns:
+            Backups sorted newest first
+        """
+        if not self.snapshots_dir.exists():
+            return []
+        backups = [self._read_snapshot(path) for path in self.snapshots_dir.glob("*.json")]
+        return sorted(backups, key=lambda b: (b.created, b.id), reverse=True)
+
+    def get(self, backup_id: str) -> Backup:
+        """
+        Load a backup by id.
+
+        Args:
+            backup_id: Backup identifier (e.g., 20251107-120530)
+
+        Returns:
+            The Backup
+
+        Raises:
+            BackupNotFoundError: If the backup does not exist
+        """
+        snapshot = self.snapshot_path(backup_id)
+        if Path(backup_id).name != backup_id or not snapshot.is_file():
+            raise BackupNotFoundError(f"Backup not found: {backup_id}")
+        return self._read_snapshot(snapshot)
+
+    def restore(self, backup_id: str) -> tuple[list[Path], Backup | None]:
+        """
+        Restore a backup's files into the project.
+
+        The current versions of the files are backed up first, so a restore
+        can itself be undone.
+
+        Args:
+            backup_id: Backup identifier
+
+        Returns:
+            Tuple of (restored relative paths, backup of the replaced files or None)
+
+        Raises:
+            BackupNotFoundError: If the backup does not exist
+            DevKitError: If a file cannot be restored
+        """
+        backup = self.get(backup_id)
+        agent_folder = self.project_path / backup.agent_folder
+        undo = self.create(agent_folder, [f.path for f in backup.files])
+
+        for backup_file in backup.files:
+            dest = agent_folder / backup_file.path
+            # Replaces symlinked and hardlinked files instead of writing
+            # through them into the template pack they share data with
+            copy_file(self._blob_path(backup_file.sha256), dest)
+            os.chmod(dest, backup_file.mode)
+
+        return [f.path for f in backup.files], undo
+
+    def prune(
+        self,
+        keep: int = BACKUP_KEEP,
+        max_age_days: int | None = BACKUP_MAX_AGE_DAYS,
+    ) -> list[str]:
+        """
+        Apply the retention policy and drop blobs no snapshot references.
+
+        The newest backup is always kept.
+
+        Args:
+            keep: Maximum number of backups to keep
+            max_age_days: Remove backups older than this (None disables)
+
+        Returns:
+            Ids of the removed backups
+        """
+        backups = self.list_backups()
+        cutoff = datetime.now() - timedelta(days=max_age_days) if max_age_days is not None else None
+
+        removed = []
+        for idx, backup in enumerate(backups):
+            if idx == 0:
+                continue
+            if idx >= keep or (cutoff is not None and backup.created < cutoff):
+                self.snapshot_path(backup.id).unlink(missing_ok=True)
+                removed.append(backup.id)
+
+        if removed:
+            self._collect_garbage()
+        return removed
+
+    def snapshot_path(self, backup_id: str) -> Path:
+        """Path of the snapshot file for a backup id."""
+        return self.snapshots_dir / f"{backup_id}.json"
+
+    def _blob_path(self, sha256: str) -> Path:
+        """Path of the blob holding content with the given hash."""
+        return self.objects_dir / sha256[:2] / sha256
+
+    def _store_blob(self, source: Path, sha256: str) -> None:
+        """Copy a file into the object store unless the blob already exists."""
+        blob = self._blob_path(sha256)
+        if blob.exists():
+            return
+        ensure_directory(blob.parent)
+        tmp = blob.with_name(f".{blob.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, blob)
+
+    def _new_backup_id(self) -> str:
+        """Timestamped backup id, suffixed if one already exists this second."""
+        base = datetime.now().strftime("%Y%m%d-%H%M%S")
+        backup_id = base
+        counter = 1
+        while self.snapshot_path(backup_id).exists():
+            backup_id = f"{base}-{counter}"
+            counter += 1
+        return backup_id
+
+    def _read_snapshot(self, path: Path) -> Backup:
+        """Parse a snapshot file."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return Backup(
+            id=data["id"],
+            created=datetime.fromisoformat(data["created"]),
+            agent_folder=data["agent_folder"],
+            files=[
+                BackupFile(path=Path(item["path"]), sha256=item["sha256"], mode=item["mode"])
+                for item in data["files"]
+            ],
+        )
+
+    def _collect_garbage(self) -> None:
+        """Delete blobs that no remaining snapshot references."""
+        referenced = {f.sha256 for backup in self.list_backups() for f in backup.files}
+        if not self.objects_dir.exists():
+            return
+        for blob in self.objects_dir.glob("*/*"):
+            if blob.name not in referenced:
+                blob.unlink(missing_ok=True)
+
+
+def _backup_to_dict(backup: Backup) -> dict:
+    """Serialize a backup to a JSON-compatible dict."""
+    return {
+        "id": backup.id,
+        "created": backup.created.isoformat(),
+        "agent_folder": backup.agent_folder,
+        "files": [
+            {"path": f.path.as_posix(), "sha256": f.sha256, "mode": f.mode}
+            for f in backup.files
+        ],
+    }
@@ -0,0 +1,175 @@
+"""Packed template bundles: a whole template pack in one indexed file."""
+
+import json
+import mmap
+import stat
+import struct
+import zipfile
+from pathlib import Path
+from devkit_cli import __version__
+from devkit_cli.config import SETTINGS_REGISTRY
+from devkit_cli.manifest import TemplateManifest, load_manifest
+from devkit_cli.utils import DevKitError, TemplateNotFoundError, ensure_directory
+
+
+# Conventional file extension for bundles
+BUNDLE_SUFFIX = ".dkpack"
+
+# Member holding the serialized manifest inside a bundle
+BUNDLE_MANIFEST = ".devkit-manifest.json"
+
+# Fixed-size part of a zip local file header (see APPNOTE.TXT 4.3.7)
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+
+class BundleError(DevKitError):
+    """Error when a template bundle is malformed."""
+    pass
+
+
+class TemplateBundle:
+    """
+    Template source backed by a packed bundle file.
+
+    A bundle is an uncompressed zip archive: its central directory is the
+    index, and each member is stored verbatim. The file is memory-mapped
+    once, and every template read is a slice at a precomputed offset, so an
+    install costs one open no matter how many templates the pack has. The
+    manifest (sizes, modes, hashes) is embedded, so nothing is rehashed.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and index a bundle.
+
+        Args:
+            path: Bundle file created by ``devkit pack``
+
+        Raises:
+            TemplateNotFoundError: If the file does not exist
+            BundleError: If the file is not a valid bundle
+        """
+        self.path = path
+        self.label = str(path)
+        try:
+            self._file = open(path, "rb")
+        except FileNotFoundError as e:
+            raise TemplateNotFoundError(f"Template bundle not found: {path}") from e
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._offsets = self._index()
+            self._manifest = self._load_manifest()
+        except BundleError:
+            self._file.close()
+            raise
+        except (ValueError, OSError, KeyError, zipfile.BadZipFile) as e:
+            self._file.close()
+            raise BundleError(f"Not a valid template bundle: {path} ({e})") from e
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "TemplateBundle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get_manifest(self) -> TemplateManifest:
+        """Manifest embedded in the bundle."""
+        return self._manifest
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """
+        Read one template file straight out of the memory map.
+
+        Raises:
+            TemplateNotFoundError: If the bundle has no such file
+        """
+        try:
+            offset, size = self._offsets[rel_path.as_posix()]
+        except KeyError:
+            raise TemplateNotFoundError(f"{rel_path} not found in bundle {self.path}") from None
+        return self._mmap[offset:offset + size]
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """Bundled files have no path of their own; they are always written from memory."""
+        return None
+
+    def read_settings_registry(self) -> dict:
+        """Load the pack's devkit-settings.json, if it was packed."""
+        if SETTINGS_REGISTRY not in self._offsets:
+            return {}
+        return json.loads(self.read_bytes(Path(SETTINGS_REGISTRY)))
+
+    def _index(self) -> dict[str, tuple[int, int]]:
+        """Map each member name to the offset and size of its data."""
+        offsets = {}
+        with zipfile.ZipFile(self._mmap) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise BundleError(f"{info.filename} is compressed; bundles must be stored")
+                header = _LOCAL_HEADER.unpack_from(self._mmap, info.header_offset)
+                if header[0] != _LOCAL_HEADER_MAGIC:
+                    raise BundleError(f"Bad local header for {info.filename}")
+                name_len, extra_len = header[-2], header[-1]
+                data_offset = info.header_offset + _LOCAL_HEADER.size + name_len + extra_len
+                offsets[info.filename] = (data_offset, info.file_size)
+        return offsets
+
+    def _load_manifest(self) -> TemplateManifest:
+        """Read the embedded manifest."""
+        if BUNDLE_MANIFEST not in self._offsets:
+            raise BundleError(f"Bundle has no manifest: {self.path}")
+        data = json.loads(self.read_bytes(Path(BUNDLE_MANIFEST)))
+        return TemplateManifest.from_dict(self.path, data)
+
+
+def pack_templates(template_dir: Path, output: Path) -> TemplateManifest:
+    """
+    Pack a template directory into a single bundle file.
+
+    Args:
+        template_dir: Template root (e.g., templates/claude-code)
+        output: Bundle file to write
+
+    Returns:
+        Manifest of the packed files
+
+    Raises:
+        TemplateNotFoundError: If template_dir doesn't exist
+    """
+    if not template_dir.is_dir():
+        raise TemplateNotFoundError(f"Template directory not found: {template_dir}")
+
+    manifest = load_manifest(template_dir, refresh=True)
+    ensure_directory(output.parent)
+    tmp_output = output.with_name(f".{output.name}.tmp")
+
+    with zipfile.ZipFile(tmp_output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for entry in manifest.entries:
+            _write_member(archive, entry.path.as_posix(), (template_dir / entry.path).read_bytes(), entry.mode)
+
+        registry = template_dir / SETTINGS_REGISTRY
+        if registry.is_file():
+            _write_member(archive, SETTINGS_REGISTRY, registry.read_bytes(), 0o644)
+
+        packed = TemplateManifest(root=output, version=__version__, entries=manifest.entries)
+        _write_member(archive, BUNDLE_MANIFEST, json.dumps(packed.to_dict()).encode("utf-8"), 0o644)
+
+    tmp_output.replace(output)
+    return packed
+
+
+def _write_member(archive: zipfile.ZipFile, name: str, data: bytes, mode: int) -> None:
+    """Add one stored member, keeping its permission bits."""
+    info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = (stat.S_IFREG | mode) << 16
+    archive.writestr(info, data)
@@ -1,17 +1,78 @@
 """CLI commands for DevKit."""
 
+import time
+
+# Taken before the heavier imports so --timings can report CLI startup
+_STARTED = time.perf_counter()
+
 import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Optional
 import typer
 from devkit_cli import __version__
-from devkit_cli.config import AGENT_CONFIG
+from devkit_cli.config import (
+    AGENT_CONFIG,
+    COMPONENT_KINDS,
+    DEFAULT_COPY_WORKERS,
+    DEFAULT_PROFILE,
+    INSTALL_PROFILES,
+    DEFAULT_WATCH_DEBOUNCE,
+    PACK_TEMPLATES_DIR,
+)
 from devkit_cli.core import TemplateManager
-from devkit_cli.ui import select_agent, show_result, show_version, show_error, show_main_menu, prompt_project_path, show_banner, console
-from devkit_cli.config import UI_THEME
-from rich.panel import Panel
-from devkit_cli.utils import get_project_path, ensure_directory, ProjectPathError
-from devkit_cli.agent_utils import get_agent_by_flag
+from devkit_cli.fleet import DEFAULT_FLEET_WORKERS, resolve_fleet_paths, run_fleet
+from devkit_cli.utils import get_project_path, ensure_directory, DevKitError, ProjectPathError, TemplateNotFoundError
+from devkit_cli.agent_utils import get_agent_by_flag, get_agents_by_flags
+from devkit_cli.backup import BackupStore
+from devkit_cli.bundle import BUNDLE_SUFFIX, pack_templates
+from devkit_cli.events import OUTPUT_FORMATS, emitting, open_sink
+from devkit_cli.models import AgentType, LinkMode
+from devkit_cli.manifest import FileFilter
+from devkit_cli.render import parse_variable_options
+from devkit_cli.overlay import open_layered_source
+from devkit_cli.sources import CachedSource, DirectorySource, TemplateSource, open_template_source
+from devkit_cli.timing import instrument
+
+
+# Output mode, set by the global --plain/--quiet/--output options
+_output = {"plain": False, "format": "text"}
+
+
+def get_ui() -> ModuleType:
+    """
+    Return the display module for the current output mode.
+
+    The rich-based ``ui`` module (rich, readchar) is only imported when it is
+    actually needed; plain mode never imports it.
+
+    Returns:
+        ``devkit_cli.machine`` for --output json/ndjson, ``devkit_cli.plain``
+        in plain/quiet mode, otherwise ``devkit_cli.ui``
+    """
+    if _output["format"] != "text":
+        from devkit_cli import machine
+        return machine
+    if _output["plain"]:
+        from devkit_cli import plain
+        return plain
+    from devkit_cli import ui
+    return ui
+
+
+def open_templates(source: Path | None, overlays: list[Path] | None) -> TemplateSource:
+    """
+    Open the template pack a command installs from.
+
+    Args:
+        source: --source value (defaults to the bundled templates)
+        overlays: --overlay values, stacked over the layers in overlays.json
+
+    Returns:
+        The pack, or an OverlaySource when overlay layers are configured
+    """
+    base = open_template_source(source) if source else DirectorySource(PACK_TEMPLATES_DIR)
+    return open_layered_source(base, overlays)
 
 
 app = typer.Typer(
@@ -22,19 +83,63 @@ app = typer.Typer(
 
 
 @app.callback(invoke_without_command=True)
-def main_callback(ctx: typer.Context) -> None:
+def main_callback(
+    ctx: typer.Context,
+    plain: bool = typer.Option(
+        False,
+        "--plain",
+        help="Plain text output without colors, banner, progress or prompts"
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Print only errors (implies --plain)"
+    ),
+    output: str = typer.Option(
+        "text",
+        "--output",
+        help="Output format: text, json (one array at the end) or ndjson (one event per line, as it happens)"
+    ),
+) -> None:
     """
     Main callback - shows interactive menu when no command is specified.
 
     Args:
         ctx: Typer context
+        plain: Use plain text output
+        quiet: Print only errors
+        output: Output format (see ``devkit_cli.events``)
     """
+    if output not in OUTPUT_FORMATS:
+        raise typer.BadParameter(
+            f"'{output}' is not one of {', '.join(OUTPUT_FORMATS)}", param_hint="--output"
+        )
+
+    if plain or quiet:
+        from devkit_cli import plain as plain_ui
+        _output["plain"] = True
+        plain_ui.set_quiet(quiet)
+
+    if output != "text":
+        # Machine output implies plain mode: no banner, progress or prompts
+        _output["plain"] = True
+        _output["format"] = output
+        ctx.with_resource(emitting(open_sink(output)))
+
     if ctx.invoked_subcommand is None:
+        if _output["plain"]:
+            get_ui().show_error("No command given (the interactive menu is disabled in plain mode)")
+            sys.exit(1)
+
+        from devkit_cli.ui import show_main_menu, show_version, console
+        from devkit_cli.config import UI_THEME
+
         while True:
             action = show_main_menu()
 
             if action == "init":
-                init(project_name=None, here=False, claude=False, cursor=False)
+                init(project_name=None, here=False, claude=False, cursor=False, agents=None, sync=False, copy_workers=DEFAULT_COPY_WORKERS, link_mode=LinkMode.COPY, source=None, overlay=None, profile=None, include=None, exclude=None, var=None, timings=False, trace=None, cprofile=None, verbose=False)
                 # Exit after init completes, don't return to menu
                 break
             elif action == "version":
@@ -70,6 +175,79 @@ def init(
         "--cursor",
         help="Use Cursor agent (skip interactive selection)"
     ),
+    agents: Optional[str] = typer.Option(
+        None,
+        "--agents",
+        help="Install for several agents in one run, comma-separated: claude,cursor"
+    ),
+    sync: bool = typer.Option(
+        False,
+        "--sync",
+        help="Copy only new or changed files (compares content hashes)"
+    ),
+    copy_workers: int = typer.Option(
+        DEFAULT_COPY_WORKERS,
+        "--copy-workers",
+        min=1,
+        help="Number of template files copied concurrently"
+    ),
+    link_mode: LinkMode = typer.Option(
+        LinkMode.COPY,
+        "--link-mode",
+        case_sensitive=False,
+        help="How files are materialized: copy, hardlink, reflink, symlink, or auto (reflink when supported, else copy)"
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="Install from a template directory or a bundle built with 'devkit pack'"
+    ),
+    overlay: Optional[list[Path]] = typer.Option(
+        None,
+        "--overlay",
+        help="Template directory or bundle layered over the source (repeatable, lowest first)"
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help=f"Named install profile: {', '.join(INSTALL_PROFILES)} (default: {DEFAULT_PROFILE})"
+    ),
+    include: Optional[list[str]] = typer.Option(
+        None,
+        "--include",
+        help="Install only template files matching this glob (repeatable), e.g. 'commands/*'"
+    ),
+    exclude: Optional[list[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Skip template files matching this glob (repeatable), e.g. 'skills/*/assets'"
+    ),
+    var: Optional[list[str]] = typer.Option(
+        None,
+        "--var",
+        help="Set a template variable, NAME=VALUE (repeatable); used by {{ devkit.NAME }} placeholders"
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print how long each install phase took"
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write phase timings as a Chrome trace JSON file (open in ui.perfetto.dev)"
+    ),
+    cprofile: Optional[Path] = typer.Option(
+        None,
+        "--cprofile",
+        help="Write a cProfile dump of the command (view with 'python -m pstats')"
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="List every installed file instead of a per-directory summary"
+    ),
 ) -> None:
     """
     Initialize a project with AI coding agent templates.
@@ -77,88 +255,782 @@ def init(
     Examples:
         devkit init my-project --claude    # Direct execution, no prompts
         devkit init --here --claude        # Install in current dir
+        devkit init --here --claude --sync # Copy only what changed
+        devkit init app --agents claude,cursor
+        devkit init app --claude --overlay ~/org-templates --overlay ./team-templates
+        devkit init ci --claude --profile minimal
+        devkit init app --claude --exclude 'skills/*/assets'
+        devkit init app --claude --timings --trace init.json
         devkit init my-project             # Prompt for agent selection
         devkit init --claude               # Prompt for project path
         devkit init                        # Prompt for both
     """
+    command_started = time.perf_counter()
+    ui = get_ui()
+
     # Show banner at command start
-    show_banner()
+    ui.show_banner()
+
+    with instrument(timings, trace, cprofile, origin=_STARTED) as tracer:
+        tracer.add_span("cli.startup", _STARTED, command_started)
+        try:
+            # Step 1: Resolve agents from flags (or prompt if missing)
+            selected_agents, error = get_agents_by_flags(claude, cursor, agents)
+
+            if error:
+                # Unknown or unsupported agent
+                ui.show_error(error)
+                sys.exit(1)
+
+            if not selected_agents:
+                # No flags provided - prompt user
+                agent = ui.select_agent(list(AGENT_CONFIG.values()))
+
+                if not agent:
+                    ui.show_warning("No agent selected. Exiting.")
+                    sys.exit(0)
+                selected_agents = [agent]
+
+            # Step 2: Resolve project path (prompt if missing)
+            try:
+                project_path = get_project_path(project_name, here)
+            except ProjectPathError:
+                # Path info missing - prompt user
+                path_input = ui.prompt_project_path()
+                # Re-parse with the user input
+                if path_input == ".":
+                    project_path = Path.cwd()
+                else:
+                    project_path = Path(path_input).resolve()
+
+            # Open the template source and resolve the file selection against
+            # its index before touching the project
+            with tracer.span("resolve", agents=len(selected_agents)):
+                template_source = open_templates(source, overlay)
+                if len(selected_agents) > 1:
+                    # Every agent installs from the same pack: read each file once
+                    template_source = CachedSource(template_source)
+                file_filter = FileFilter.from_options(profile, include, exclude)
+                variables = parse_variable_options(var)
+                template_managers = [
+                    TemplateManager(agent, template_source, file_filter, variables)
+                    for agent in selected_agents
+                ]
+                for template_manager in template_managers:
+                    template_manager.get_manifest()
+                if len(template_managers) > 1 and link_mode is LinkMode.COPY:
+                    for template_manager in template_managers:
+                        template_manager.preload_contents()
+
+            # Create project directory if it doesn't exist
+            if not project_path.exists():
+                ensure_directory(project_path)
+                ui.show_hint(f"Created directory: {project_path}\n")
+
+            # Step 3: Install templates and show each agent's result
+            results = []
+            for template_manager in template_managers:
+                with tracer.span("install", agent=str(template_manager.agent.name)):
+                    result = template_manager.install_templates(
+                        project_path,
+                        sync=sync,
+                        show_progress=not _output["plain"],
+                        copy_workers=copy_workers,
+                        link_mode=link_mode,
+                    )
+                ui.show_result(result, verbose=verbose)
+                results.append(result)
+
+            # Step 4: Show next steps
+            if all(result.success for result in results):
+                ui.show_next_steps(project_path.name if not here else '.')
+
+            if timings:
+                ui.show_timings(tracer)
+
+        except DevKitError as e:
+            ui.show_error(str(e))
+            sys.exit(1)
+        except KeyboardInterrupt:
+            ui.show_warning("\nOperation cancelled by user.")
+            sys.exit(0)
+        except Exception as e:
+            ui.show_error(str(e), prefix="Unexpected error")
+            sys.exit(1)
+
+
+@app.command()
+def fleet(
+    paths: Optional[list[str]] = typer.Argument(
+        None,
+        help="Project directories to initialize or update"
+    ),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        "-f",
+        help="File listing one project directory per line"
+    ),
+    pattern: Optional[str] = typer.Option(
+        None,
+        "--glob",
+        "-g",
+        help="Glob pattern matching project directories (quote it)"
+    ),
+    claude: bool = typer.Option(
+        False,
+        "--claude",
+        help="Use Claude Code agent (skip interactive selection)"
+    ),
+    cursor: bool = typer.Option(
+        False,
+        "--cursor",
+        help="Use Cursor agent (skip interactive selection)"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_FLEET_WORKERS,
+        "--workers",
+        "-j",
+        min=1,
+        help="Number of projects to install concurrently"
+    ),
+    sync: bool = typer.Option(
+        False,
+        "--sync",
+        help="Copy only new or changed files (compares content hashes)"
+    ),
+    link_mode: LinkMode = typer.Option(
+        LinkMode.COPY,
+        "--link-mode",
+        case_sensitive=False,
+        help="How files are materialized: copy, hardlink, reflink, symlink, or auto (reflink when supported, else copy)"
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="Install from a template directory or a bundle built with 'devkit pack'"
+    ),
+    overlay: Optional[list[Path]] = typer.Option(
+        None,
+        "--overlay",
+        help="Template directory or bundle layered over the source (repeatable, lowest first)"
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help=f"Named install profile: {', '.join(INSTALL_PROFILES)} (default: {DEFAULT_PROFILE})"
+    ),
+    include: Optional[list[str]] = typer.Option(
+        None,
+        "--include",
+        help="Install only template files matching this glob (repeatable), e.g. 'commands/*'"
+    ),
+    exclude: Optional[list[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Skip template files matching this glob (repeatable), e.g. 'skills/*/assets'"
+    ),
+    var: Optional[list[str]] = typer.Option(
+        None,
+        "--var",
+        help="Set a template variable, NAME=VALUE (repeatable); used by {{ devkit.NAME }} placeholders"
+    ),
+) -> None:
+    """
+    Initialize or update many project directories in one process.
+
+    Examples:
+        devkit fleet repo-a repo-b --claude --sync
+        devkit fleet -f checkouts.txt --claude -j 16
+        devkit fleet --glob "~/src/*" --claude --sync
+    """
+    ui = get_ui()
 
     try:
-        # Step 1: Resolve agent from flags (or prompt if missing)
         agent, error = get_agent_by_flag(claude, cursor)
 
         if error:
-            # Conflicting flags or unsupported agent
-            show_error(error)
+            ui.show_error(error)
             sys.exit(1)
 
         if agent is None:
-            # No flags provided - prompt user
-            agents = list(AGENT_CONFIG.values())
-            agent = select_agent(agents)
+            agent = ui.select_agent(list(AGENT_CONFIG.values()))
 
             if not agent:
-                console.print(f"[{UI_THEME['warning']}]No agent selected. Exiting.[/{UI_THEME['warning']}]")
+                ui.show_warning("No agent selected. Exiting.")
                 sys.exit(0)
 
-        # Step 2: Resolve project path (prompt if missing)
-        try:
-            project_path = get_project_path(project_name, here)
-        except ProjectPathError:
-            # Path info missing - prompt user
-            path_input = prompt_project_path()
-            # Re-parse with the user input
-            if path_input == ".":
-                project_path = Path.cwd()
-            else:
-                project_path = Path(path_input).resolve()
-
-        # Create project directory if it doesn't exist
-        if not project_path.exists():
-            ensure_directory(project_path)
-            console.print(f"[{UI_THEME['text_hint']}]Created directory: {project_path}[/{UI_THEME['text_hint']}]\n")
-
-        # Step 3: Install templates
-        template_manager = TemplateManager(agent)
-        result = template_manager.install_templates(project_path)
-
-        # Step 4: Show result
-        show_result(result)
-
-        # Step 5: Show next steps
-        if result.success:
-            next_steps_text = (
-                f"[{UI_THEME['text_secondary']}]1. Navigate to your project:[/{UI_THEME['text_secondary']}] [{UI_THEME['primary']}]cd {project_path.name if not here else '.'}[/{UI_THEME['primary']}]\n"
-                f"[{UI_THEME['text_secondary']}]2. Use the installed templates in your coding agent[/{UI_THEME['text_secondary']}]"
-            )
-            next_steps_panel = Panel(
-                next_steps_text,
-                title=f"[bold {UI_THEME['text_primary']}]Next Steps[/bold {UI_THEME['text_primary']}]",
-                border_style=UI_THEME["border"],
-                padding=(1, 2)
-            )
-            console.print(next_steps_panel)
-
-    except ProjectPathError as e:
-        show_error(str(e))
+        project_paths = resolve_fleet_paths(paths or [], from_file, pattern)
+        template_manager = TemplateManager(
+            agent,
+            open_templates(source, overlay),
+            FileFilter.from_options(profile, include, exclude),
+            parse_variable_options(var),
+        )
+        result = run_fleet(
+            template_manager, project_paths,
+            workers=workers, sync=sync, link_mode=link_mode,
+            show_progress=not _output["plain"],
+        )
+        ui.show_fleet_result(result)
+
+        if result.failed:
+            sys.exit(1)
+
+    except DevKitError as e:
+        ui.show_error(str(e))
         sys.exit(1)
     except KeyboardInterrupt:
-        console.print(f"\n[{UI_THEME['warning']}]Operation cancelled by user.[/{UI_THEME['warning']}]")
+        ui.show_warning("\nOperation cancelled by user.")
         sys.exit(0)
     except Exception as e:
-        show_error(str(e), prefix="Unexpected error")
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command()
+def watch(
+    paths: list[str] = typer.Argument(
+        ...,
+        help="Project directories to keep in sync"
+    ),
+    claude: bool = typer.Option(
+        False,
+        "--claude",
+        help="Use Claude Code agent (skip interactive selection)"
+    ),
+    cursor: bool = typer.Option(
+        False,
+        "--cursor",
+        help="Use Cursor agent (skip interactive selection)"
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="Template directory to watch (defaults to the bundled templates)"
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help=f"Named install profile: {', '.join(INSTALL_PROFILES)} (default: {DEFAULT_PROFILE})"
+    ),
+    include: Optional[list[str]] = typer.Option(
+        None,
+        "--include",
+        help="Sync only template files matching this glob (repeatable)"
+    ),
+    exclude: Optional[list[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Skip template files matching this glob (repeatable)"
+    ),
+    var: Optional[list[str]] = typer.Option(
+        None,
+        "--var",
+        help="Set a template variable, NAME=VALUE (repeatable); used by {{ devkit.NAME }} placeholders"
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll for changes instead of using inotify (e.g. on network filesystems)"
+    ),
+    debounce: float = typer.Option(
+        DEFAULT_WATCH_DEBOUNCE,
+        "--debounce",
+        min=0.0,
+        help="Seconds of quiet that end a burst of changes"
+    ),
+    link_mode: LinkMode = typer.Option(
+        LinkMode.COPY,
+        "--link-mode",
+        case_sensitive=False,
+        help="How files are materialized: copy, hardlink, reflink, symlink, or auto (reflink when supported, else copy)"
+    ),
+) -> None:
+    """
+    Watch a template directory and push changed files into projects.
+
+    Projects are synced once at start, then each burst of template edits is
+    pushed as a sync install of just the changed files. Stop with Ctrl+C.
+
+    Examples:
+        devkit watch ../demo-a ../demo-b --claude
+        devkit watch ../demo --claude --source ./templates/claude-code --poll
+    """
+    ui = get_ui()
+
+    try:
+        agent, error = get_agent_by_flag(claude, cursor)
+
+        if error:
+            ui.show_error(error)
+            sys.exit(1)
+
+        if agent is None:
+            agent = ui.select_agent(list(AGENT_CONFIG.values()))
+
+            if not agent:
+                ui.show_warning("No agent selected. Exiting.")
+                sys.exit(0)
+
+        root = (source or PACK_TEMPLATES_DIR).resolve()
+        if not root.is_dir():
+            raise TemplateNotFoundError(f"Template directory not found: {root} (bundles cannot be watched)")
+
+        file_filter = FileFilter.from_options(profile, include, exclude)
+        variables = parse_variable_options(var)
+        project_paths = resolve_fleet_paths(paths, None, None)
+
+        # Bring every project up to date before watching
+        ui.show_fleet_result(run_fleet(
+            TemplateManager(agent, DirectorySource(root), file_filter, variables), project_paths,
+            sync=True, show_progress=not _output["plain"], link_mode=link_mode,
+        ))
+        ui.show_hint(f"Watching {root} for changes (Ctrl+C to stop)")
+
+        # Imported here: ctypes and select are only needed by this command
+        from devkit_cli.watch import watch_templates
+        watch_templates(
+            agent, root, project_paths, ui.show_watch_push,
+            file_filter=file_filter, variables=variables,
+            polling=poll, debounce=debounce, link_mode=link_mode,
+            on_fallback=lambda e: ui.show_warning(f"{e}; polling for changes instead"),
+        )
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        ui.show_hint("\nStopped watching.")
+        sys.exit(0)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command()
+def restore(
+    backup_id: Optional[str] = typer.Argument(
+        None,
+        help="Backup to restore (omit to list available backups)"
+    ),
+    project_name: Optional[str] = typer.Option(
+        None,
+        "--project",
+        "-p",
+        help="Project directory (defaults to the current directory)"
+    ),
+) -> None:
+    """
+    Restore files from a backup created by init, or list backups.
+
+    Examples:
+        devkit restore                       # List backups in current dir
+        devkit restore 20251107-120530       # Restore a backup
+        devkit restore 20251107-120530 -p my-project
+    """
+    ui = get_ui()
+
+    try:
+        project_path = get_project_path(project_name, here=project_name is None)
+        store = BackupStore(project_path)
+
+        if backup_id is None:
+            ui.show_backups(store.list_backups())
+            return
+
+        backup = store.get(backup_id)
+        restored, undo = store.restore(backup_id)
+        ui.show_restore_result(backup, restored, undo)
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command()
+def status(
+    project_name: Optional[str] = typer.Option(
+        None,
+        "--project",
+        "-p",
+        help="Project directory (defaults to the current directory)"
+    ),
+    claude: bool = typer.Option(
+        False,
+        "--claude",
+        help="Check only the Claude Code folder"
+    ),
+    cursor: bool = typer.Option(
+        False,
+        "--cursor",
+        help="Check only the Cursor folder"
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="Template directory or bundle to check for newer templates"
+    ),
+    overlay: Optional[list[Path]] = typer.Option(
+        None,
+        "--overlay",
+        help="Template directory or bundle layered over the source (repeatable, lowest first)"
+    ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Exit with status 1 if any installed file was modified or deleted"
+    ),
+) -> None:
+    """
+    Show which installed template files were modified, deleted or have newer templates.
+
+    Uses the ledger each install writes into the agent folder: every file
+    is stat'ed, and only files whose stat changed are hashed.
+
+    Examples:
+        devkit status                        # Every agent folder in current dir
+        devkit status -p my-project --claude
+        devkit status --check                # Fail CI if templates were edited
+    """
+    ui = get_ui()
+
+    try:
+        project_path = get_project_path(project_name, here=project_name is None)
+        selected_agents, error = get_agents_by_flags(claude, cursor)
+        if error:
+            ui.show_error(error)
+            sys.exit(1)
+
+        from devkit_cli.ledger import check_drift, read_ledger
+        if not selected_agents:
+            selected_agents = list(AGENT_CONFIG.values())
+        template_source = open_templates(source, overlay)
+        reports = []
+        for agent in selected_agents:
+            entries = read_ledger(project_path / agent.folder)
+            if not entries:
+                continue
+            manifest = TemplateManager(agent, template_source).get_manifest()
+            reports.append(check_drift(project_path, agent, entries, manifest))
+        if not reports:
+            folders = ", ".join(f"{agent.folder}/" for agent in selected_agents)
+            raise DevKitError(f"No DevKit install found in {project_path} (no ledger in {folders})")
+
+        ui.show_status(reports)
+        if check and not all(report.clean for report in reports):
+            sys.exit(1)
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command()
+def pack(
+    template_dir: Path = typer.Argument(
+        ...,
+        help="Template pack directory (containing agents/, commands/, ...)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Bundle file to write (defaults to <template_dir>.dkpack)"
+    ),
+) -> None:
+    """
+    Pack a template directory into a single indexed bundle file.
+
+    Examples:
+        devkit pack ./my-templates                  # Writes my-templates.dkpack
+        devkit pack ./my-templates -o team.dkpack
+        devkit init my-project --claude --source team.dkpack
+    """
+    ui = get_ui()
+
+    try:
+        template_dir = template_dir.resolve()
+        output_path = (output or template_dir.with_suffix(BUNDLE_SUFFIX)).resolve()
+        manifest = pack_templates(template_dir, output_path)
+        total_bytes = sum(entry.size for entry in manifest.entries)
+        ui.show_hint(f"Packed {len(manifest.entries)} file(s) ({total_bytes} bytes) into {output_path}")
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command("list")
+def list_components(
+    claude: bool = typer.Option(
+        False,
+        "--claude",
+        help="List the bundled Claude Code templates (the default)"
+    ),
+    cursor: bool = typer.Option(
+        False,
+        "--cursor",
+        help="List the templates as installed for Cursor (as rules and commands)"
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="List a template directory or a bundle built with 'devkit pack'"
+    ),
+    overlay: Optional[list[Path]] = typer.Option(
+        None,
+        "--overlay",
+        help="Template directory or bundle layered over the source (repeatable, lowest first)"
+    ),
+    kind: Optional[str] = typer.Option(
+        None,
+        "--kind",
+        "-k",
+        help="Only list one kind of component: agent, command or skill"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Rebuild the component index from scratch"
+    ),
+) -> None:
+    """
+    List the agents, commands and skills in a template pack.
+
+    Shows each component's name, description, tools and model, read from the
+    frontmatter of its markdown file.
+
+    Examples:
+        devkit list
+        devkit list --kind agent
+        devkit list --cursor
+        devkit list --source team.dkpack
+    """
+    ui = get_ui()
+
+    try:
+        if kind is not None and kind not in COMPONENT_KINDS:
+            raise DevKitError(f"Unknown component kind '{kind}' (choose from {', '.join(COMPONENT_KINDS)})")
+
+        agent, error = get_agent_by_flag(claude, cursor)
+        if error:
+            ui.show_error(error)
+            sys.exit(1)
+
+        from devkit_cli.components import ComponentIndex, components_for_agent
+        from devkit_cli.transforms import get_transform
+        components = ComponentIndex(open_templates(source, overlay)).components(refresh=refresh)
+        if agent is not None:
+            components = components_for_agent(components, get_transform(agent))
+        if kind is not None:
+            components = [component for component in components if component.kind == kind]
+        ui.show_components(components)
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+plugins_app = typer.Typer(
+    name="plugins",
+    help="Browse and install plugins from a plugin marketplace",
+    no_args_is_help=True,
+)
+app.add_typer(plugins_app)
+
+MARKETPLACE_OPTION_HELP = "Marketplace directory (defaults to the nearest one at or above the current directory)"
+
+
+def _open_catalog(marketplace: Optional[Path]):
+    """Open the plugin catalog for a marketplace (lazy import keeps startup lean)."""
+    from devkit_cli.plugins import PluginCatalog, find_marketplace
+    return PluginCatalog(find_marketplace(marketplace or Path.cwd()))
+
+
+@plugins_app.command("list")
+def plugins_list(
+    marketplace: Optional[Path] = typer.Option(None, "--marketplace", "-m", help=MARKETPLACE_OPTION_HELP),
+    refresh: bool = typer.Option(False, "--refresh", help="Rebuild the plugin index from scratch"),
+    components: bool = typer.Option(False, "--components", "-c", help="Also list each plugin's agents, commands and skills"),
+) -> None:
+    """
+    List the plugins in a marketplace.
+
+    Examples:
+        devkit plugins list
+        devkit plugins list -c -m ~/src/my-marketplace
+    """
+    ui = get_ui()
+
+    try:
+        catalog = _open_catalog(marketplace)
+        ui.show_plugins(catalog.plugins(refresh=refresh), show_components=components)
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@plugins_app.command("search")
+def plugins_search(
+    query: str = typer.Argument(..., help="Text to look for in plugin and component names and descriptions"),
+    marketplace: Optional[Path] = typer.Option(None, "--marketplace", "-m", help=MARKETPLACE_OPTION_HELP),
+) -> None:
+    """
+    Search plugins and their components.
+
+    Examples:
+        devkit plugins search review
+    """
+    ui = get_ui()
+
+    try:
+        catalog = _open_catalog(marketplace)
+        ui.show_plugins(catalog.search(query), show_components=True)
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@plugins_app.command("install")
+def plugins_install(
+    name: str = typer.Argument(..., help="Plugin to install"),
+    project_name: Optional[str] = typer.Argument(
+        None,
+        help="Project directory to install into (or use --here)"
+    ),
+    here: bool = typer.Option(False, "--here", help="Install into the current directory"),
+    marketplace: Optional[Path] = typer.Option(None, "--marketplace", "-m", help=MARKETPLACE_OPTION_HELP),
+    sync: bool = typer.Option(False, "--sync", help="Copy only new or changed files (compares content hashes)"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="List every installed file instead of a per-directory summary"),
+) -> None:
+    """
+    Install a plugin's agents, commands and skills into a project's .claude/ folder.
+
+    Files are installed like templates: staged, committed atomically, and
+    backed up first when they would overwrite existing files.
+
+    Examples:
+        devkit plugins install spec-dev --here
+        devkit plugins install spec-dev my-project --sync
+    """
+    ui = get_ui()
+
+    try:
+        plugin = _open_catalog(marketplace).get(name)
+        if not plugin.installable:
+            raise DevKitError(f"Plugin '{name}' has a remote source ({plugin.source}); only local plugins can be installed")
+
+        project_path = get_project_path(project_name, here)
+        if not project_path.is_dir():
+            raise ProjectPathError(f"Project directory not found: {project_path}")
+
+        template_manager = TemplateManager(AGENT_CONFIG[AgentType.CLAUDE_CODE], DirectorySource(plugin.path))
+        result = template_manager.install_templates(
+            project_path, sync=sync, show_progress=not _output["plain"],
+        )
+        ui.show_result(result, verbose=verbose)
+
+        if not result.success:
+            sys.exit(1)
+
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        ui.show_warning("\nOperation cancelled by user.")
+        sys.exit(0)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
+        sys.exit(1)
+
+
+@app.command()
+def serve(
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the running daemon"
+    ),
+    idle_timeout: Optional[float] = typer.Option(
+        None,
+        "--idle-timeout",
+        min=1.0,
+        help="Exit after this many seconds without requests"
+    ),
+) -> None:
+    """
+    Run a background daemon that keeps DevKit warm for fast repeat commands.
+
+    While it runs, non-interactive commands (plain/quiet output, or output
+    that is not a terminal) are forwarded to it over a Unix socket instead of
+    starting Python and loading templates again. Set DEVKIT_NO_DAEMON=1 to
+    bypass it.
+
+    Examples:
+        devkit serve &                 # Start the daemon
+        devkit serve --idle-timeout 600
+        devkit serve --stop
+    """
+    ui = get_ui()
+
+    from devkit_cli.client import request_shutdown, socket_path
+    if stop:
+        if request_shutdown():
+            ui.show_hint("Daemon stopped.")
+        else:
+            ui.show_warning(f"No daemon is running on {socket_path()}")
+        return
+
+    try:
+        from devkit_cli.daemon import serve as run_daemon
+        run_daemon(
+            idle_timeout=idle_timeout,
+            on_ready=lambda path: ui.show_hint(f"DevKit daemon listening on {path} (Ctrl+C to stop)"),
+            on_warning=ui.show_warning,
+        )
+    except DevKitError as e:
+        ui.show_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        ui.show_hint("\nDaemon stopped.")
+        sys.exit(0)
+    except Exception as e:
+        ui.show_error(str(e), prefix="Unexpected error")
         sys.exit(1)
 
 
 @app.command()
 def version() -> None:
     """Show version information."""
-    show_version(__version__)
+    get_ui().show_version(__version__)
 
 
 def main() -> None:
-    """Main entry point for CLI."""
+    """
+    Run the CLI in this process.
+
+    The ``devkit`` console script enters through ``devkit_cli.client.main``,
+    which forwards to a running daemon when it can and calls this otherwise.
+    """
     app()
 
 
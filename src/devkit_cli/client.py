@@ -0,0 +1,182 @@
+"""Thin client for the DevKit daemon (``devkit serve``).
+
+This is the console entry point, and it starts on the hot path of every
+command, so it only imports modules that are built into the interpreter
+(``_socket`` and ``marshal`` instead of ``socket`` and ``json``, which pull
+in enum, re and selectors). It tries to hand the command to a running
+daemon over a Unix socket; if no daemon is running, or the command cannot
+be forwarded, it falls back to running the CLI in-process.
+
+Requests and responses are ``marshal``-encoded dicts. The daemon rejects
+clients running a different DevKit or Python version, so both sides always
+agree on the format.
+"""
+
+import _socket
+import marshal
+import os
+import sys
+from devkit_cli import __version__
+
+
+# Commands the daemon can run; everything else (prompts, watch, serve) runs locally
+FORWARDED_COMMANDS = {"init", "fleet", "list", "restore", "status", "pack", "version"}
+
+# Global options that may precede the command
+GLOBAL_FLAGS = {"--plain", "--quiet", "-q"}
+
+# Environment forwarded with each request, since it changes where DevKit
+# keeps its state and configuration (HOME: "~" paths and default locations)
+FORWARDED_ENV_PREFIXES = ("DEVKIT_", "XDG_CACHE_HOME", "XDG_CONFIG_HOME")
+FORWARDED_ENV_NAMES = {"HOME"}
+
+# Set to run every command in-process even when a daemon is running
+NO_DAEMON_ENV = "DEVKIT_NO_DAEMON"
+
+
+def socket_path() -> str:
+    """
+    Location of the daemon socket for the current user.
+
+    ``DEVKIT_SOCKET`` overrides it; otherwise it lives in ``XDG_RUNTIME_DIR``
+    (or the temp directory), in a directory only the user can access.
+    """
+    override = os.environ.get("DEVKIT_SOCKET")
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "devkit", "daemon.sock")
+    return os.path.join("/tmp", f"devkit-{os.getuid()}", "daemon.sock")
+
+
+def is_forwarded_env(name: str) -> bool:
+    """Whether an environment variable is sent to the daemon with each request."""
+    return name.startswith(FORWARDED_ENV_PREFIXES) or name in FORWARDED_ENV_NAMES
+
+
+def protocol_version() -> str:
+    """Identifies compatible client/daemon pairs."""
+    return f"{__version__}/{sys.version_info[0]}.{sys.version_info[1]}/{marshal.version}"
+
+
+def peer_uid(sock: "_socket.socket", path: str) -> int:
+    """
+    User id of the process listening on a connected Unix socket.
+
+    Uses the kernel's peer credentials (SO_PEERCRED, a struct of pid, uid
+    and gid) where available, else the owner of the socket file.
+    """
+    if hasattr(_socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(_socket.SOL_SOCKET, _socket.SO_PEERCRED, 12)
+        return int.from_bytes(creds[4:8], sys.byteorder)
+    return os.stat(path).st_uid
+
+
+def call(message: dict) -> dict:
+    """
+    Send one message to the daemon and wait for its reply.
+
+    Nothing is sent unless the daemon runs as the current user, so a socket
+    planted by someone else never sees the command, its working directory
+    or its environment.
+
+    Raises:
+        OSError: If no daemon is listening, or it runs as another user
+        ValueError: If the reply is malformed
+    """
+    path = socket_path()
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        uid = peer_uid(sock, path)
+        if uid != os.getuid():
+            raise PermissionError(f"Daemon socket {path} is served by uid {uid}")
+        sock.sendall(marshal.dumps(message))
+        sock.shutdown(_socket.SHUT_WR)
+        chunks = []
+        while chunk := sock.recv(64 * 1024):
+            chunks.append(chunk)
+    finally:
+        sock.close()
+
+    response = marshal.loads(b"".join(chunks))
+    if not isinstance(response, dict):
+        raise ValueError("Malformed daemon response")
+    return response
+
+
+def forward(argv: list[str]) -> int | None:
+    """
+    Run a command on the daemon, if one is running and the command allows it.
+
+    Only non-interactive runs are forwarded: the command must be in
+    FORWARDED_COMMANDS, and output must be plain (``--plain``/``--quiet``)
+    or not going to a terminal. The daemon always runs in plain mode.
+    Machine output (``--output``) always runs in-process, since its events
+    are streamed to stdout as they happen rather than returned at the end.
+
+    Args:
+        argv: Command-line arguments after the program name
+
+    Returns:
+        The command's exit code, or None if it must run in-process
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(_socket, "AF_UNIX"):
+        return None
+
+    if any(arg.startswith("--output") for arg in argv):
+        return None
+
+    command = next((arg for arg in argv if arg not in GLOBAL_FLAGS), None)
+    if command not in FORWARDED_COMMANDS or "--help" in argv:
+        return None
+    if sys.stdout.isatty() and not GLOBAL_FLAGS & set(argv):
+        return None
+
+    request = {
+        "version": protocol_version(),
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {k: v for k, v in os.environ.items() if is_forwarded_env(k)},
+    }
+
+    try:
+        response = call(request)
+    except (OSError, ValueError, EOFError, TypeError):
+        # No daemon (or it went away, or is not ours): run locally
+        return None
+
+    if "error" in response:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("exit", 0)
+
+
+def request_shutdown() -> bool:
+    """
+    Ask a running daemon to exit.
+
+    Returns:
+        True if a daemon was running and acknowledged
+    """
+    try:
+        return bool(call({"op": "shutdown"}).get("ok"))
+    except (OSError, ValueError, EOFError, TypeError):
+        return False
+
+
+def main() -> None:
+    """Console entry point: forward to the daemon, else run the CLI."""
+    code = forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    from devkit_cli.cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
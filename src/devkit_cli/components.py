@@ -0,0 +1,203 @@
+"""Component index: the agents, commands and skills in a template pack.
+
+Listing a pack means reading the frontmatter of every component file. Only
+headers are read, and the parsed metadata is kept in an index under the
+user cache directory, keyed by DevKit version. An indexed file is only
+re-parsed once it changes: for template directories that is a change in
+size or mtime, for bundles a change in the content hash recorded in the
+bundle's manifest.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+from devkit_cli import __version__
+from devkit_cli.frontmatter import (
+    component_kind,
+    frontmatter_from_bytes,
+    make_component,
+    read_frontmatter,
+)
+from devkit_cli.models import Component
+from devkit_cli.sources import DirectorySource, TemplateSource
+from devkit_cli.transforms import AgentTransform
+from devkit_cli.utils import TemplateNotFoundError, get_cache_dir, write_text_atomic
+
+
+# Subdirectories of a template pack or plugin that hold components
+COMPONENT_DIRS = ["agents", "commands", "skills"]
+
+# Bump when the on-disk index layout changes
+INDEX_FORMAT = 1
+
+
+class ComponentIndex:
+    """Indexed view of the components in one template source."""
+
+    def __init__(self, source: TemplateSource):
+        """
+        Initialize an index.
+
+        Args:
+            source: Template directory or bundle to index
+        """
+        self.source = source
+        self.index_file = _index_file(source.label)
+        self.files_parsed = 0
+
+    def components(self, refresh: bool = False) -> list[Component]:
+        """
+        List every component, refreshing the on-disk index as needed.
+
+        Args:
+            refresh: Ignore the index and re-parse everything
+
+        Returns:
+            Components sorted by path (agents, then commands, then skills)
+
+        Raises:
+            TemplateNotFoundError: If the source does not exist
+        """
+        old = {} if refresh else _read_index(self.index_file)
+        cached = old.get("files", {})
+
+        if isinstance(self.source, DirectorySource):
+            if not self.source.root.is_dir():
+                raise TemplateNotFoundError(f"Template directory not found: {self.source.root}")
+            files, self.files_parsed = index_directory(self.source.root, cached)
+        else:
+            files, self.files_parsed = self._index_manifest(cached)
+
+        index = {"format": INDEX_FORMAT, "version": __version__, "files": files}
+        if index != old:
+            try:
+                write_text_atomic(self.index_file, json.dumps(index))
+            except OSError:
+                # A read-only cache only costs us the next re-parse
+                pass
+
+        return components_from_index(files)
+
+    def _index_manifest(self, cached: dict) -> tuple[dict, int]:
+        """Index a source through its manifest, keyed by content hash."""
+        files = {}
+        parsed = 0
+        for entry in self.source.get_manifest().entries:
+            key = entry.path.as_posix()
+            if component_kind(key) is None:
+                continue
+            previous = cached.get(key)
+            if previous and previous.get("sha256") == entry.sha256:
+                files[key] = previous
+                continue
+            parsed += 1
+            meta = frontmatter_from_bytes(self.source.read_bytes(entry.path))
+            files[key] = {"sha256": entry.sha256, "meta": meta}
+        return files, parsed
+
+
+def index_directory(root: Path, cached: dict) -> tuple[dict, int]:
+    """
+    Index the component files under a directory.
+
+    Args:
+        root: Template pack or plugin root
+        cached: Entries from a previous index of the same root
+
+    Returns:
+        Entries by POSIX relative path, and the number of files parsed
+    """
+    files = {}
+    parsed = 0
+    for key, stat_key in component_files(root):
+        previous = cached.get(key)
+        if previous and previous.get("stat") == stat_key:
+            files[key] = previous
+            continue
+        try:
+            meta = read_frontmatter(root / key)
+        except OSError:
+            continue
+        parsed += 1
+        files[key] = {"stat": stat_key, "meta": meta}
+    return files, parsed
+
+
+def components_from_index(files: dict) -> list[Component]:
+    """Build Components from index entries, sorted by path."""
+    return [
+        make_component(component_kind(key), key, item["meta"])
+        for key, item in sorted(files.items())
+    ]
+
+
+def components_for_agent(components: list[Component], transform: AgentTransform | None) -> list[Component]:
+    """
+    Components as they are installed for an agent.
+
+    Args:
+        components: Components of a template pack
+        transform: The agent's transform (``get_transform``), or None
+
+    Returns:
+        The components the transform installs, with their paths in the
+        agent folder (e.g. a Cursor rule); all of them unchanged without a
+        transform
+    """
+    if transform is None:
+        return components
+    installed = []
+    for component in components:
+        mapped = transform.target(component.path)
+        if mapped is not None:
+            installed.append(replace(component, path=mapped[0]))
+    return installed
+
+
+def component_files(root: Path) -> list[tuple[str, list[int]]]:
+    """
+    Every component file under a root with its (mtime_ns, size) key.
+
+    Works on strings from os.scandir rather than Path objects, since this
+    runs over every file on each listing.
+    """
+    found = []
+    base = str(root) + os.sep
+    stack = [os.path.join(root, name) for name in COMPONENT_DIRS]
+    while stack:
+        directory = stack.pop()
+        try:
+            scanner = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with scanner:
+            for item in scanner:
+                if item.is_dir(follow_symlinks=False):
+                    stack.append(item.path)
+                    continue
+                rel_path = item.path[len(base):].replace(os.sep, "/")
+                if component_kind(rel_path) is None:
+                    continue
+                st = item.stat()
+                found.append((rel_path, [st.st_mtime_ns, st.st_size]))
+    return found
+
+
+def _index_file(label: str) -> Path:
+    """Index location for a template source."""
+    digest = hashlib.sha256(str(Path(label).resolve()).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / "components" / f"{digest}.json"
+
+
+def _read_index(index_file: Path) -> dict:
+    """Read a previously written index, or {} if missing or stale."""
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("format") != INDEX_FORMAT or data.get("version") != __version__:
+        return {}
+    return data
@@ -17,16 +17,85 @@ AGENT_CONFIG: dict[AgentType, Agent] = {
         name=AgentType.CURSOR,
         display_name="Cursor",
         folder=".cursor",
-        supported=False,
-        description="AI-powered code editor (not supported yet)"
+        supported=True,
+        description="AI-powered code editor (rules and commands converted from the Claude Code templates)"
     ),
 }
 
 # Path to bundled templates
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Template packs are written in Claude Code's layout; other agents install a
+# converted view of the same pack (see transforms.py)
+PACK_TEMPLATES_DIR = TEMPLATES_DIR / AgentType.CLAUDE_CODE
+
+# Names accepted by `devkit init --agents`
+AGENT_ALIASES: dict[str, AgentType] = {
+    "claude": AgentType.CLAUDE_CODE,
+    "claude-code": AgentType.CLAUDE_CODE,
+    "cursor": AgentType.CURSOR,
+}
+
 # Template structure
-TEMPLATE_SUBDIRS = ["agents", "commands", "hooks"]
+TEMPLATE_SUBDIRS = ["agents", "commands", "hooks", "skills"]
+
+# Kinds of component `devkit list` reports (from agents/, commands/ and skills/*/SKILL.md)
+COMPONENT_KINDS = ["agent", "command", "skill"]
+
+# Named install profiles: glob filters applied to the template manifest.
+# An empty include list selects every template file.
+INSTALL_PROFILES: dict[str, dict[str, list[str]]] = {
+    "full": {"include": [], "exclude": []},
+    "core": {"include": ["agents", "commands", "hooks"], "exclude": []},
+    "minimal": {"include": ["commands/commit-msg.md", "commands/onboard.md"], "exclude": []},
+}
+DEFAULT_PROFILE = "full"
+
+# Number of template files copied concurrently during install
+DEFAULT_COPY_WORKERS = 4
+
+# Shortest interval (seconds) between progress bar updates
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+# Files listed per directory in the collapsed install result (--verbose lists all)
+RESULT_FILES_PER_DIR = 5
+
+# Quiet period (seconds) that ends a burst of template edits in `devkit watch`
+DEFAULT_WATCH_DEBOUNCE = 0.3
+
+# Settings file DevKit merges hooks into, and the registry each pack ships
+SETTINGS_FILE = "settings.local.json"
+SETTINGS_REGISTRY = "devkit-settings.json"
+
+# Overlay layers: the user's layer list (in the config directory), and the
+# suffix of the marker files that delete a path from the layers below
+OVERLAYS_FILE = "overlays.json"
+DELETE_MARKER_SUFFIX = ".devkit-delete"
+
+# Files DevKit merges into after install; always copied, never linked
+MERGED_FILES = {SETTINGS_FILE}
+
+# Install ledger, written into the agent folder after each install
+LEDGER_FILE = ".devkit-ledger.json"
+
+# DevKit's own state directory inside each project
+DEVKIT_DIR = Path(".devkit")
+
+# Template variables file, read from the user config directory and from
+# DEVKIT_DIR in each project (project values win)
+VARIABLES_FILE = "variables.json"
+
+# Install staging area and journal (relative to the project)
+STAGING_DIR = DEVKIT_DIR / "staging"
+INSTALL_JOURNAL = DEVKIT_DIR / "install-journal.json"
+
+# Held by the install running in a project (relative to the project)
+INSTALL_LOCK = DEVKIT_DIR / "install.lock"
+
+# Backup store (relative to the project) and retention policy
+BACKUP_DIR = DEVKIT_DIR / "backups"
+BACKUP_KEEP = 10
+BACKUP_MAX_AGE_DAYS = 30
 
 # UI Theme - Nordic Literary: Low-saturation ice blue with sophisticated greyscale
 # Design philosophy: Calm, professional, easy on eyes, literary elegance
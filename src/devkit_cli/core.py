@@ -1,30 +1,262 @@
 """Core template management logic for DevKit CLI."""
 
-import json
+import hashlib
+import os
+import stat
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from devkit_cli.config import TEMPLATES_DIR, TEMPLATE_SUBDIRS, UI_THEME
-from devkit_cli.models import Agent, InstallResult
+from devkit_cli.backup import BackupStore
+from devkit_cli.config import (
+    DEFAULT_COPY_WORKERS,
+    DEVKIT_DIR,
+    MERGED_FILES,
+    PROGRESS_UPDATE_INTERVAL,
+    PACK_TEMPLATES_DIR,
+    SETTINGS_FILE,
+    UI_THEME,
+    VARIABLES_FILE,
+)
+from devkit_cli.destination import DestinationScan, scan_destination
+from devkit_cli.events import get_events
+from devkit_cli.ledger import ledger_entry, read_ledger, write_ledger
+from devkit_cli.manifest import FileFilter, TemplateManifest
+from devkit_cli.models import Agent, ConflictKind, InstallResult, LedgerEntry, LinkMode
+from devkit_cli.render import builtin_variables, compile_template, load_variables_file, render_template, render_value
+from devkit_cli.settings import apply_settings, drop_hooks_for
+from devkit_cli.sources import DirectorySource, TemplateSource
+from devkit_cli.timing import get_tracer
+from devkit_cli.transaction import InstallLock, InstallTransaction, recover_install
+from devkit_cli.transforms import TransformedSource, get_transform
 from devkit_cli.utils import (
     ensure_directory,
     copy_file,
-    create_backup,
-    TemplateNotFoundError,
+    DevKitError,
+    get_config_dir,
+    hash_file,
+    run_file_jobs,
+    summarize_existing,
+    write_file,
+    write_text_atomic,
 )
 
 
+def make_progress(enabled: bool):
+    """
+    Create the install progress bar, or a null context when disabled.
+
+    rich is imported here rather than at module level so that plain and
+    quiet runs never load it. Output that is not a terminal (CI logs, pipes)
+    never gets a progress bar, since a live display cannot redraw there.
+    """
+    if not enabled or not sys.stdout.isatty():
+        return nullcontext()
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    return Progress(
+        SpinnerColumn(style=UI_THEME["primary"]),
+        TextColumn("[bold {color}]{{task.description}}[/bold {color}]".format(color=UI_THEME["primary"])),
+        BarColumn(complete_style=UI_THEME["success"], finished_style=UI_THEME["success"]),
+        TaskProgressColumn(),
+        transient=True  # Remove progress bar when done
+    )
+
+
+class BatchedAdvance:
+    """
+    Advance a progress task in batches instead of once per item.
+
+    Each ``Progress.update`` takes rich's lock and records a speed sample, so
+    on packs with thousands of files per-file updates cost more than the
+    copies. Completed items are counted here and sent at most once per
+    interval; ``flush`` sends the remainder.
+    """
+
+    def __init__(self, progress, task, interval: float = PROGRESS_UPDATE_INTERVAL):
+        """
+        Wrap a progress task.
+
+        Args:
+            progress: rich Progress instance
+            task: Task ID returned by ``progress.add_task``
+            interval: Shortest time between updates, in seconds
+        """
+        self.progress = progress
+        self.task = task
+        self.interval = interval
+        self._pending = 0
+        self._last_update = time.monotonic()
+
+    def __call__(self, _item=None) -> None:
+        """Count one completed item."""
+        self._pending += 1
+        if time.monotonic() - self._last_update >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send any counted items to the progress bar."""
+        if self._pending:
+            self.progress.update(self.task, advance=self._pending)
+            self._pending = 0
+        self._last_update = time.monotonic()
+
+
+@dataclass
+class InstallPlan:
+    """What an install will do, worked out before anything is written."""
+    project_path: Path
+    agent_folder: Path
+    sync: bool
+    rendered: dict[Path, bytes]           # Rendered contents of templated files
+    scan: DestinationScan                 # Agent folder as found before the install
+    existing: dict[Path, ConflictKind]
+    files_added: list[Path]
+    files_updated: list[Path]
+    files_unchanged: list[Path]
+    conflicts: list[Path]                 # Existing files someone changed (backed up)
+    files_to_copy: list[Path]             # Manifest order
+    modes: dict[Path, int]
+    bytes_to_copy: int
+    backup_id: str | None = None
+    backup_path: Path | None = None
+    ledger: dict[str, LedgerEntry] = field(default_factory=dict)  # Agent folder's ledger before the install
+
+
 class TemplateManager:
     """Manages template operations for DevKit CLI."""
 
-    def __init__(self, agent: Agent):
+    def __init__(
+        self,
+        agent: Agent,
+        source: TemplateSource | None = None,
+        file_filter: FileFilter | None = None,
+        variables: dict[str, str] | None = None,
+    ):
         """
         Initialize template manager.
 
         Args:
             agent: Agent configuration to use
+            source: Template pack to install from (defaults to the bundled
+                templates; may be a directory or a packed bundle). Packs are
+                in Claude Code's layout and are converted for other agents
+                (see ``devkit_cli.transforms``)
+            file_filter: Which template files to install (defaults to all)
+            variables: Template variables from the command line; these
+                override the variables files
         """
         self.agent = agent
-        self.template_path = TEMPLATES_DIR / agent.name
+        self.source = source or DirectorySource(PACK_TEMPLATES_DIR)
+        self.file_filter = file_filter or FileFilter()
+        self.variables = variables or {}
+        self.transform = get_transform(agent)
+        # Template files as installed for the agent: the pack, or the pack
+        # seen through the agent's transform (set up by get_manifest)
+        self._files: TemplateSource = self.source
+        self._pack_manifest: TemplateManifest | None = None
+        self._manifest: TemplateManifest | None = None
+        self._contents: dict[Path, bytes] | None = None
+        self._user_variables: dict[str, str] | None = None
+
+    def get_manifest(self) -> TemplateManifest:
+        """
+        Get the template manifest for the agent, loading it once per manager.
+
+        The file filter is applied here, against the index, so files left out
+        of the install are never read, hashed, or stat'ed in the project.
+        Filters match pack paths; for agents with a transform the selected
+        files are then converted, and the manifest lists them as installed.
+
+        Returns:
+            Manifest listing every selected template file with size, mode and hash
+
+        Raises:
+            TemplateNotFoundError: If the template source doesn't exist
+            DevKitError: If an include pattern matches no template file
+        """
+        if self._manifest is None:
+            with get_tracer().span("manifest", source=self.source.label) as span:
+                manifest = self.source.get_manifest()
+                if not self.file_filter.is_empty:
+                    manifest = manifest.select(self.file_filter)
+                self._pack_manifest = manifest
+                if self.transform is not None:
+                    self._files = TransformedSource(self.source, self.transform, manifest)
+                    manifest = self._files.get_manifest()
+                    span.set(transform=self.transform.name)
+                span.set(files=len(manifest.entries))
+            self._manifest = manifest
+        return self._manifest
+
+    def preload_contents(self) -> None:
+        """
+        Read every template file into memory once.
+
+        After preloading, installs write from memory instead of re-reading the
+        template source, so one manager can be shared by many projects.
+        """
+        if self._contents is not None:
+            return
+        manifest = self.get_manifest()
+        self._contents = {
+            entry.path: self._files.read_bytes(entry.path)
+            for entry in manifest.entries
+        }
+
+    def template_variables(self, project_path: Path) -> dict[str, str]:
+        """
+        Variables for rendering templates into one project.
+
+        Later sources win: the user's variables file, the project's
+        ``.devkit/variables.json``, ``--var`` values, then DevKit's
+        built-ins (project_name, project_dir, agent_folder, agent_name).
+
+        Raises:
+            RenderError: If a variables file is malformed
+        """
+        if self._user_variables is None:
+            self._user_variables = load_variables_file(get_config_dir() / VARIABLES_FILE)
+        return {
+            **self._user_variables,
+            **load_variables_file(project_path / DEVKIT_DIR / VARIABLES_FILE),
+            **self.variables,
+            **builtin_variables(self.agent, project_path),
+        }
+
+    def render_templates(self, project_path: Path) -> dict[Path, bytes]:
+        """
+        Render the selected templates that contain placeholders.
+
+        Files were flagged when the manifest was built, so templates without
+        placeholders are never looked at here. Each template is compiled once
+        per content hash and reused for every project.
+
+        Args:
+            project_path: Project the templates are rendered for
+
+        Returns:
+            Rendered contents by relative path (empty if no file is templated)
+
+        Raises:
+            RenderError: If a template uses an undefined variable
+        """
+        templated = [entry for entry in self.get_manifest().entries if entry.templated]
+        if not templated:
+            return {}
+
+        variables = self.template_variables(project_path)
+        rendered = {}
+        for entry in templated:
+            compiled = compile_template(entry.sha256, lambda path=entry.path: self._read_template(path))
+            rendered[entry.path] = render_template(compiled, variables, entry.path)
+        return rendered
+
+    def _read_template(self, rel_path: Path) -> bytes:
+        """Contents of a template file, from the preload cache if present."""
+        if self._contents is not None:
+            return self._contents[rel_path]
+        return self._files.read_bytes(rel_path)
 
     def get_template_files(self) -> list[Path]:
         """
@@ -36,203 +268,565 @@ class TemplateManager:
         Raises:
             TemplateNotFoundError: If template directory doesn't exist
         """
-        if not self.template_path.exists():
-            raise TemplateNotFoundError(
-                f"Template directory not found: {self.template_path}"
-            )
-
-        template_files = []
-        for subdir in TEMPLATE_SUBDIRS:
-            subdir_path = self.template_path / subdir
-            if subdir_path.exists():
-                for file_path in subdir_path.rglob("*"):
-                    if file_path.is_file():
-                        # Store path relative to template root
-                        rel_path = file_path.relative_to(self.template_path)
-                        template_files.append(rel_path)
-
-        return template_files
+        return self.get_manifest().paths
 
-    def detect_conflicts(self, project_path: Path) -> list[Path]:
+    def detect_conflicts(
+        self,
+        project_path: Path,
+        template_files: list[Path] | None = None,
+        scan: DestinationScan | None = None,
+    ) -> list[Path]:
         """
         Detect files that would be overwritten.
 
         Args:
             project_path: Target project directory
+            template_files: Template files to check (defaults to all)
+            scan: Destination scan to reuse (scanned here if omitted)
 
         Returns:
             List of files that already exist in project
         """
-        agent_folder = project_path / self.agent.folder
-        if not agent_folder.exists():
-            return []
+        if template_files is None:
+            template_files = self.get_template_files()
+        if scan is None:
+            scan = scan_destination(project_path / self.agent.folder, template_files)
+        return [p for p in template_files if scan.stat(p) is not None or scan.is_dir(p)]
 
-        conflicts = []
-        template_files = self.get_template_files()
+    def classify_existing(
+        self,
+        project_path: Path,
+        rendered: dict[Path, bytes] | None = None,
+        scan: DestinationScan | None = None,
+        ledger: dict[str, LedgerEntry] | None = None,
+    ) -> dict[Path, ConflictKind]:
+        """
+        Compare the template files already in the project with the templates.
 
-        for rel_path in template_files:
-            dest_file = agent_folder / rel_path
-            if dest_file.exists():
-                conflicts.append(rel_path)
+        Type, size and mode come from the destination scan. Files whose stat
+        matches the ledger are as DevKit wrote them, so their contents are
+        known without reading them: identical, or outdated if the template
+        has changed since. Of the rest, only regular files whose size and
+        mode match are hashed. Templated files are compared against their
+        rendered contents.
 
-        return conflicts
+        Args:
+            project_path: Target project directory
+            rendered: Output of ``render_templates`` (rendered here if omitted)
+            scan: Destination scan to reuse (scanned here if omitted)
+            ledger: The agent folder's ledger (``read_ledger``), if any
 
-    def install_templates(self, project_path: Path) -> InstallResult:
+        Returns:
+            ConflictKind by relative path for each template file present, in
+            manifest order
+        """
+        agent_folder = project_path / self.agent.folder
+        if scan is None:
+            scan = scan_destination(agent_folder, self.get_template_files())
+        if rendered is None:
+            rendered = self.render_templates(project_path)
+        ledger = ledger or {}
+        existing = {}
+        hashed = 0
+        trusted = 0
+        # String paths: this runs for every template file on every install
+        root = str(agent_folder) + os.sep
+
+        for entry in self.get_manifest().entries:
+            key = entry.path.as_posix()
+            st = scan.files.get(key)
+            if st is None:
+                if key in scan.dirs:
+                    existing[entry.path] = ConflictKind.TYPE_MISMATCH
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                existing[entry.path] = ConflictKind.TYPE_MISMATCH
+                continue
+
+            data = rendered.get(entry.path)
+            recorded = ledger.get(key)
+            if recorded is not None and recorded.matches(st):
+                trusted += 1
+                expected = entry.sha256 if data is None else hashlib.sha256(data).hexdigest()
+                if recorded.sha256 == expected and recorded.mode == entry.mode:
+                    existing[entry.path] = ConflictKind.IDENTICAL
+                else:
+                    existing[entry.path] = ConflictKind.OUTDATED
+                continue
+            size = entry.size if data is None else len(data)
+            if st.st_size != size or stat.S_IMODE(st.st_mode) != entry.mode:
+                existing[entry.path] = ConflictKind.MODIFIED
+                continue
+            hashed += 1
+            expected = entry.sha256 if data is None else hashlib.sha256(data).hexdigest()
+            if hash_file(root + key) == expected:
+                existing[entry.path] = ConflictKind.IDENTICAL
+            else:
+                existing[entry.path] = ConflictKind.MODIFIED
+
+        get_tracer().count("files_hashed", hashed)
+        get_tracer().count("ledger_hits", trusted)
+        return existing
+
+    def plan_sync(
+        self,
+        project_path: Path,
+        rendered: dict[Path, bytes] | None = None,
+        scan: DestinationScan | None = None,
+    ) -> tuple[list[Path], list[Path], list[Path]]:
+        """
+        Compare template files against the project by size, mode and content hash.
+
+        Args:
+            project_path: Target project directory
+            rendered: Output of ``render_templates`` (rendered here if omitted)
+            scan: Destination scan to reuse (scanned here if omitted)
+
+        Returns:
+            Tuple of (added, updated, unchanged) relative paths, in manifest order
+        """
+        existing = self.classify_existing(project_path, rendered, scan)
+        added, updated, unchanged = [], [], []
+        for rel_path in self.get_template_files():
+            kind = existing.get(rel_path)
+            if kind is None:
+                added.append(rel_path)
+            elif kind is ConflictKind.IDENTICAL:
+                unchanged.append(rel_path)
+            else:
+                updated.append(rel_path)
+        return added, updated, unchanged
+
+    def install_templates(
+        self,
+        project_path: Path,
+        sync: bool = False,
+        show_progress: bool = True,
+        copy_workers: int = DEFAULT_COPY_WORKERS,
+        link_mode: LinkMode = LinkMode.COPY,
+    ) -> InstallResult:
         """
         Install templates to project directory.
 
-        Automatically creates backup if conflicts are detected.
+        Files are staged and then committed with atomic renames, so an
+        interrupted install never leaves the agent folder half-updated.
+        Automatically backs up files that would be overwritten. In sync mode
+        only new or changed files are copied, and only changed files count
+        as conflicts.
 
         Args:
             project_path: Target project directory
+            sync: Copy only files whose content differs from the templates
+            show_progress: Display a progress bar (disable when running in worker threads)
+            copy_workers: Number of files copied concurrently (1 copies sequentially)
+            link_mode: How files are materialized; files DevKit merges into
+                later (MERGED_FILES) are always copied
 
         Returns:
             InstallResult with details of the operation
+
+        Raises:
+            InstallLockedError: If another install is running in the project
+        """
+        # Installs in a project share its journal and staging area
+        with InstallLock(project_path):
+            tracer = get_tracer()
+            events = get_events()
+            plan = self.plan_install(project_path, sync=sync)
+            if plan is None:
+                return self.no_templates_result(project_path)
+            self.backup_conflicts(plan)
+
+            # Stage into .devkit/staging, then swap files in with atomic renames
+            files_to_copy = plan.files_to_copy
+            with InstallTransaction(project_path, plan.agent_folder, files_to_copy, scan=plan.scan) as transaction:
+                with tracer.span(
+                    "install.stage", files=len(files_to_copy), bytes=plan.bytes_to_copy,
+                    workers=copy_workers, link_mode=str(link_mode),
+                ), make_progress(show_progress and bool(files_to_copy)) as progress:
+                    advance = None
+                    if progress:
+                        advance = BatchedAdvance(
+                            progress, progress.add_task("Installing templates", total=len(files_to_copy)),
+                        )
+                    on_done = advance
+                    if events.enabled:
+                        # Report each file as its copy finishes, then advance the bar
+                        def on_done(rel_path: Path) -> None:
+                            self.emit_file(plan, "copied", rel_path)
+                            if advance:
+                                advance(rel_path)
+                    run_file_jobs(
+                        files_to_copy,
+                        lambda rel_path: self.stage_file(plan, transaction, rel_path, link_mode),
+                        workers=copy_workers, on_done=on_done,
+                    )
+                    if advance:
+                        advance.flush()
+                events.emit(
+                    "phase", project=str(project_path), phase="stage",
+                    files=len(files_to_copy), bytes=plan.bytes_to_copy,
+                )
+                self.commit_install(plan, transaction)
+
+            return self.finish_install(plan)
+
+    def plan_install(self, project_path: Path, sync: bool = False) -> InstallPlan | None:
         """
+        Work out what an install will do, without writing to the agent folder.
+
+        Runs the read-only install phases: recovering an interrupted install,
+        rendering templates, scanning the agent folder and classifying the
+        files already there. ``install_templates`` and ``AsyncTemplateManager``
+        continue from the returned plan, holding the project's ``InstallLock``
+        from here to the commit.
+
+        Args:
+            project_path: Target project directory
+            sync: Copy only files whose content differs from the templates
+
+        Returns:
+            The plan, or None if there are no template files to install
+
+        Raises:
+            DevKitError: If a directory is where a template file belongs
+        """
+        tracer = get_tracer()
+        events = get_events()
         agent_folder = project_path / self.agent.folder
         template_files = self.get_template_files()
+        project = str(project_path)
+        events.emit("install", project=project, agent=str(self.agent.name), files=len(template_files), sync=sync)
+
+        # Finish or undo an install interrupted in a previous run
+        with tracer.span("install.recover") as span:
+            recovered = recover_install(project_path)
+            span.set(action=recovered)
+        events.emit("phase", project=project, phase="recover", action=recovered)
 
-        # Check if template directory is empty
         if not template_files:
-            return InstallResult(
-                success=False,
-                project_path=project_path,
-                agent=self.agent,
-                files_copied=[],
-                backup_path=None,
-                conflicts=[],
-                message=f"No template files found for {self.agent.display_name}"
-            )
+            return None
+
+        with tracer.span("install.render") as span:
+            rendered = self.render_templates(project_path)
+            span.set(files=len(rendered))
+        events.emit("phase", project=project, phase="render", files=len(rendered))
+
+        # One walk of the agent folder serves every later stage
+        with tracer.span("install.scan") as span:
+            scan = scan_destination(agent_folder, template_files)
+            ledger = read_ledger(agent_folder) if scan.exists else {}
+            span.set(existing=len(scan), ledger=len(ledger))
+        events.emit("phase", project=project, phase="scan", existing=len(scan))
+
+        with tracer.span("install.plan", sync=sync, files=len(template_files)) as span:
+            existing = self.classify_existing(project_path, rendered, scan, ledger)
+            files_added = [p for p in template_files if p not in existing]
+            if sync:
+                files_updated = [p for p, kind in existing.items() if kind is not ConflictKind.IDENTICAL]
+                files_unchanged = [p for p, kind in existing.items() if kind is ConflictKind.IDENTICAL]
+            else:
+                files_updated = list(existing)
+                files_unchanged = []
+            # Identical files are rewritten by a full install but need no
+            # backup, and neither do earlier installs nobody has touched
+            conflicts = [
+                p for p, kind in existing.items()
+                if kind is not ConflictKind.IDENTICAL and kind is not ConflictKind.OUTDATED
+            ]
+            span.set(added=len(files_added), updated=len(files_updated), unchanged=len(files_unchanged))
+
+        for rel_path in conflicts:
+            if scan.is_dir(rel_path):
+                raise DevKitError(f"Cannot install {rel_path}: {agent_folder / rel_path} is a directory")
+
+        # Keep manifest order for the files we are about to copy
+        pending = set(files_added) | set(files_updated)
+        files_to_copy = [p for p in template_files if p in pending]
+        entries = {entry.path: entry for entry in self.get_manifest().entries}
+        plan = InstallPlan(
+            project_path=project_path,
+            agent_folder=agent_folder,
+            sync=sync,
+            rendered=rendered,
+            scan=scan,
+            existing=existing,
+            files_added=files_added,
+            files_updated=files_updated,
+            files_unchanged=files_unchanged,
+            conflicts=conflicts,
+            files_to_copy=files_to_copy,
+            modes={rel_path: entry.mode for rel_path, entry in entries.items()},
+            bytes_to_copy=sum(
+                len(rendered[p]) if p in rendered else entries[p].size
+                for p in files_to_copy
+            ),
+            ledger=ledger,
+        )
 
-        conflicts = self.detect_conflicts(project_path)
-        backup_path = None
+        events.emit(
+            "phase", project=project, phase="plan",
+            added=len(files_added), updated=len(files_updated), unchanged=len(files_unchanged),
+        )
+        if events.enabled:
+            for rel_path in files_unchanged:
+                self.emit_file(plan, "skipped", rel_path)
+        return plan
 
-        # Create backup if conflicts exist
-        if conflicts and agent_folder.exists():
-            backup_path = create_backup(agent_folder)
+    def backup_conflicts(self, plan: InstallPlan) -> None:
+        """
+        Back up the files a plan is about to overwrite.
 
-        # Ensure agent folder exists
-        ensure_directory(agent_folder)
+        Only reads the agent folder, so it may run while files are staged.
+        Sets ``plan.backup_id`` and ``plan.backup_path``.
 
-        # Copy all template files with progress indicator
-        files_copied = []
+        Args:
+            plan: Plan from ``plan_install``
+        """
+        if not plan.conflicts:
+            return
+        events = get_events()
+        with get_tracer().span("install.backup", files=len(plan.conflicts)):
+            store = BackupStore(plan.project_path)
+            backup = store.create(plan.agent_folder, plan.conflicts, scan=plan.scan)
+            if backup:
+                plan.backup_id = backup.id
+                plan.backup_path = store.snapshot_path(backup.id)
+                store.prune()
+        backed_up = [f.path for f in backup.files] if backup else []
+        if events.enabled:
+            for rel_path in backed_up:
+                self.emit_file(plan, "backed-up", rel_path)
+        events.emit("phase", project=str(plan.project_path), phase="backup", id=plan.backup_id, files=len(backed_up))
+
+    def stage_file(
+        self,
+        plan: InstallPlan,
+        transaction: InstallTransaction,
+        rel_path: Path,
+        link_mode: LinkMode = LinkMode.COPY,
+    ) -> None:
+        """
+        Write one template file into the transaction's staging directory.
+
+        Safe to call from several threads at once.
+
+        Args:
+            plan: Plan from ``plan_install``
+            transaction: Open transaction for the plan's files
+            rel_path: Template file to stage
+            link_mode: How the file is materialized (merged files are always copied)
+        """
+        staged_file = transaction.stage_path(rel_path)
+        source_file = self._files.file_path(rel_path)
+        file_mode = LinkMode.COPY if rel_path.name in MERGED_FILES else link_mode
+        mode = plan.modes[rel_path]
+        if rel_path in plan.rendered:
+            # Rendered per project, so never linked to the template
+            write_file(staged_file, plan.rendered[rel_path], mode, make_parents=False)
+        elif self._contents is not None and file_mode is LinkMode.COPY:
+            write_file(staged_file, self._contents[rel_path], mode, make_parents=False)
+        elif source_file is None:
+            # Bundled and converted templates have no file to link to
+            write_file(staged_file, self._files.read_bytes(rel_path), mode, make_parents=False)
+        else:
+            copy_file(
+                source_file, staged_file,
+                make_parents=False, link_mode=file_mode,
+            )
+
+    def commit_install(self, plan: InstallPlan, transaction: InstallTransaction) -> None:
+        """
+        Move a plan's staged files into the agent folder.
+
+        Args:
+            plan: Plan from ``plan_install``
+            transaction: Transaction every file was staged into
+        """
+        with get_tracer().span("install.commit", files=len(plan.files_to_copy)):
+            if not plan.scan.exists:
+                ensure_directory(plan.agent_folder)
+            transaction.commit()
+        get_events().emit("phase", project=str(plan.project_path), phase="commit", files=len(plan.files_to_copy))
 
-        with Progress(
-            SpinnerColumn(style=UI_THEME["primary"]),
-            TextColumn("[bold {color}]{{task.description}}[/bold {color}]".format(color=UI_THEME["primary"])),
-            BarColumn(complete_style=UI_THEME["success"], finished_style=UI_THEME["success"]),
-            TaskProgressColumn(),
-            transient=True  # Remove progress bar when done
-        ) as progress:
-            task = progress.add_task("Installing templates", total=len(template_files))
+    def finish_install(self, plan: InstallPlan) -> InstallResult:
+        """
+        Merge hooks into the settings file and build the result of a committed plan.
+
+        Args:
+            plan: Plan whose files have been committed
 
-            for rel_path in template_files:
-                source_file = self.template_path / rel_path
-                dest_file = agent_folder / rel_path
-                copy_file(source_file, dest_file)
-                files_copied.append(rel_path)
-                progress.update(task, advance=1)
+        Returns:
+            InstallResult for the install
+        """
+        tracer = get_tracer()
+        events = get_events()
+        files_copied = plan.files_to_copy
+        tracer.count("files_copied", len(files_copied))
+        tracer.count("bytes_copied", plan.bytes_to_copy)
+
+        # Record what is now in the agent folder for the next run
+        with tracer.span("install.ledger") as span:
+            recorded = self._record_ledger(plan)
+            span.set(written=recorded)
+        events.emit("phase", project=str(plan.project_path), phase="ledger", written=recorded)
 
         # Configure hooks in settings.local.json
-        self._configure_hooks(agent_folder)
+        with tracer.span("install.hooks") as span:
+            written = self._configure_hooks(plan.agent_folder)
+            span.set(written=written)
+        if written:
+            self.emit_file(plan, "merged", Path(SETTINGS_FILE))
+        events.emit("phase", project=str(plan.project_path), phase="hooks", written=written)
 
         # Build result message
         message = self._build_result_message(
-            project_path, files_copied, conflicts, backup_path
+            plan.project_path, files_copied, plan.existing, plan.backup_id,
+            plan.files_unchanged if plan.sync else None,
         )
 
         return InstallResult(
             success=True,
-            project_path=project_path,
+            project_path=plan.project_path,
             agent=self.agent,
             files_copied=files_copied,
-            backup_path=backup_path,
-            conflicts=conflicts,
+            backup_path=plan.backup_path,
+            conflicts=plan.conflicts,
             message=message,
+            files_added=plan.files_added,
+            files_updated=plan.files_updated,
+            files_unchanged=plan.files_unchanged,
+            sync=plan.sync,
+            backup_id=plan.backup_id,
+            existing=plan.existing,
+        )
+
+    def emit_file(self, plan: InstallPlan, action: str, rel_path: Path) -> None:
+        """Emit a ``file`` event for a template file (see ``devkit_cli.events``)."""
+        get_events().emit(
+            "file", project=str(plan.project_path), action=action,
+            path=f"{self.agent.folder}/{rel_path.as_posix()}",
         )
 
-    def _configure_hooks(self, agent_folder: Path) -> None:
+    def no_templates_result(self, project_path: Path) -> InstallResult:
+        """Failed result for an install with nothing to install."""
+        return InstallResult(
+            success=False,
+            project_path=project_path,
+            agent=self.agent,
+            files_copied=[],
+            backup_path=None,
+            conflicts=[],
+            message=(
+                f"No template files found for {self.agent.display_name}"
+                if self.file_filter.is_empty
+                else "No template files match the selected profile and filters"
+            )
+        )
+
+    def _record_ledger(self, plan: InstallPlan) -> bool:
+        """
+        Update the agent folder's ledger after a committed install.
+
+        Copied files are stat'ed once; unchanged files reuse the stat from
+        the destination scan. Entries for files outside this install (left
+        out by a filter, for example) are kept.
+
+        Args:
+            plan: Plan whose files have been committed
+
+        Returns:
+            True if the ledger was written
+        """
+        entries = dict(plan.ledger)
+        templates = {entry.path: entry.sha256 for entry in self.get_manifest().entries}
+        root = str(plan.agent_folder) + os.sep
+
+        def expected(rel_path: Path) -> str:
+            data = plan.rendered.get(rel_path)
+            return templates[rel_path] if data is None else hashlib.sha256(data).hexdigest()
+
+        for rel_path in plan.files_to_copy:
+            key = rel_path.as_posix()
+            try:
+                st = os.stat(root + key)
+            except OSError:
+                entries.pop(key, None)
+                continue
+            entries[key] = ledger_entry(st, expected(rel_path), templates[rel_path])
+        for rel_path in plan.files_unchanged:
+            key = rel_path.as_posix()
+            st = plan.scan.files[key]
+            recorded = entries.get(key)
+            if recorded is None or not recorded.matches(st) or recorded.template != templates[rel_path]:
+                entries[key] = ledger_entry(st, expected(rel_path), templates[rel_path])
+
+        if entries == plan.ledger:
+            return False
+        try:
+            write_ledger(plan.agent_folder, entries, self.source.label)
+        except OSError:
+            # Without a ledger the next install hashes and backs up as before
+            return False
+        return True
+
+    def _configure_hooks(self, agent_folder: Path) -> bool:
         """
         Configure hooks in settings.local.json.
-        
-        Creates or merges hooks configuration into the settings file.
-        
+
+        Merges the pack's settings registry (devkit-settings.json) into the
+        settings file, skipping hooks whose script was filtered out of the
+        install. Placeholders in the registry are rendered for the project
+        first. Nothing is written when the file is already up to date.
+
         Args:
             agent_folder: Path to the agent folder (e.g., .claude/)
+
+        Returns:
+            True if the settings file was written
         """
-        settings_file = agent_folder / "settings.local.json"
-        
-        # Define the hooks configuration
-        hooks_config = {
-            "hooks": {
-                "SessionStart": [
-                    {
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": "\"$CLAUDE_PROJECT_DIR\"/.claude/hooks/welcome-banner.sh",
-                                "timeout": 5
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
-        
-        # Load existing settings if file exists
-        if settings_file.exists():
-            try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    existing_settings = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # If file is corrupted or empty, start fresh
-                existing_settings = {}
-        else:
-            existing_settings = {}
-        
-        # Merge hooks configuration
-        if "hooks" not in existing_settings:
-            existing_settings["hooks"] = {}
-        
-        # Merge SessionStart hooks
-        if "SessionStart" not in existing_settings["hooks"]:
-            existing_settings["hooks"]["SessionStart"] = hooks_config["hooks"]["SessionStart"]
-        else:
-            # Append to existing SessionStart hooks if not already present
-            existing_hooks = existing_settings["hooks"]["SessionStart"]
-            new_hook = hooks_config["hooks"]["SessionStart"][0]
-            
-            # Check if this exact hook already exists
-            hook_exists = any(
-                h.get("hooks", [{}])[0].get("command") == new_hook["hooks"][0]["command"]
-                for h in existing_hooks
-                if isinstance(h, dict) and "hooks" in h
-            )
-            
-            if not hook_exists:
-                existing_hooks.append(new_hook)
-        
-        # Write back to file
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_settings, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        self.get_manifest()
+        registry = self._files.read_settings_registry()
+        if registry:
+            registry = render_value(registry, self.template_variables(agent_folder.parent))
+        if not self.file_filter.is_empty:
+            selected = set(self._pack_manifest.paths)
+            registry = drop_hooks_for(registry, [
+                f"{self.agent.folder}/{path.as_posix()}"
+                for path in self.source.get_manifest().paths
+                if path not in selected
+            ])
+        if not registry:
+            return False
+        return apply_settings(agent_folder / SETTINGS_FILE, registry)
 
     def _build_result_message(
         self,
         project_path: Path,
         files_copied: list[Path],
-        conflicts: list[Path],
-        backup_path: Path | None,
+        existing: dict[Path, ConflictKind],
+        backup_id: str | None,
+        files_unchanged: list[Path] | None = None,
     ) -> str:
         """Build human-readable result message."""
         parts = []
 
-        if conflicts:
+        if files_unchanged is not None:
+            parts.append(
+                f"Synced {self.agent.folder}/: {len(files_copied)} file(s) copied, "
+                f"{len(files_unchanged)} unchanged."
+            )
+            if backup_id:
+                parts.append(f"Created backup: {backup_id}")
+            return " ".join(parts)
+
+        if existing:
             parts.append(
-                f"Found {len(conflicts)} existing file(s) that would be overwritten."
+                f"Found {len(existing)} existing file(s) that would be overwritten "
+                f"({summarize_existing(existing)})."
             )
-            if backup_path:
-                parts.append(f"Created backup at: {backup_path.name}")
+            if backup_id:
+                parts.append(f"Created backup: {backup_id}")
 
         parts.append(f"Copied {len(files_copied)} template file(s) to {self.agent.folder}/")
 
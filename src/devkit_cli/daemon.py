@@ -0,0 +1,276 @@
+"""DevKit daemon: runs CLI commands for the thin client over a Unix socket.
+
+The daemon keeps the interpreter, the CLI modules and the template
+manifests warm, so a forwarded command costs one socket round trip instead
+of a full Python startup and template walk. Requests are handled one at a
+time, because each one runs in the client's working directory.
+"""
+
+import contextlib
+import io
+import marshal
+import os
+import socket
+import socketserver
+import stat
+import time
+from pathlib import Path
+from devkit_cli import manifest as manifest_module
+from devkit_cli.client import is_forwarded_env, protocol_version, socket_path
+from devkit_cli.config import TEMPLATES_DIR
+from devkit_cli.utils import DevKitError
+
+
+class DaemonRunningError(DevKitError):
+    """Error when another daemon already listens on the socket."""
+    pass
+
+
+class UnsafeSocketError(DevKitError):
+    """Error when the socket directory could be reached by other users."""
+    pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one marshal-encoded request per connection."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        try:
+            request = marshal.loads(self.rfile.read())
+        except (ValueError, EOFError, TypeError):
+            request = None
+        if not isinstance(request, dict):
+            self._reply({"error": "bad request"})
+            return
+
+        if request.get("op") == "shutdown":
+            self.server.stopping = True
+            self._reply({"ok": True})
+            return
+
+        if request.get("version") != protocol_version():
+            # Client and daemon come from different installs: run locally
+            self._reply({"error": f"daemon runs {protocol_version()}"})
+            return
+
+        self._reply(self.server.run_command(request))
+
+    def _reply(self, response: dict) -> None:
+        try:
+            self.wfile.write(marshal.dumps(response))
+        except (BrokenPipeError, ConnectionResetError):
+            # The client hung up, e.g. after refusing a daemon of another user
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Sequential Unix socket server running CLI commands in-process."""
+
+    def __init__(self, path: Path, idle_timeout: float | None = None, on_warning=None):
+        """
+        Bind the daemon socket.
+
+        Args:
+            path: Socket path
+            idle_timeout: Exit after this many seconds without requests
+            on_warning: Called with a message when template changes can no
+                longer be watched with inotify
+
+        Raises:
+            DaemonRunningError: If a daemon is already listening on path
+            UnsafeSocketError: If the socket directory is not private
+        """
+        _claim_socket(path)
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.path = path
+        self.timeout = idle_timeout
+        self.stopping = False
+        self._on_warning = on_warning
+        self._watcher = _open_template_watcher(self._fall_back)
+
+    def handle_timeout(self) -> None:
+        """No request within the idle timeout: shut down."""
+        self.stopping = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self._watcher:
+            self._watcher.close()
+        self.path.unlink(missing_ok=True)
+
+    def run_command(self, request: dict) -> dict:
+        """
+        Run one CLI command as the client would have, capturing its output.
+
+        Args:
+            request: Client request with argv, cwd and env
+
+        Returns:
+            Response with exit code, stdout and stderr
+        """
+        from devkit_cli import cli
+
+        self._refresh_manifests()
+
+        argv = list(request["argv"])
+        if "--quiet" not in argv and "-q" not in argv:
+            argv.insert(0, "--plain")
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        saved_cwd = os.getcwd()
+        saved_env = dict(os.environ)
+        try:
+            os.chdir(request["cwd"])
+            # The client's forwarded variables replace the daemon's own: one
+            # unset in the client must be unset for its command too
+            for name in [name for name in os.environ if is_forwarded_env(name)]:
+                del os.environ[name]
+            os.environ.update(request.get("env", {}))
+            cli._output["plain"] = False
+            cli._STARTED = time.perf_counter()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    cli.app(args=argv, prog_name="devkit")
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except OSError as e:
+            stderr.write(f"Error: {e}\n")
+            exit_code = 1
+        finally:
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+        return {"exit": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _refresh_manifests(self) -> None:
+        """
+        Keep cached manifests in step with template edits.
+
+        Manifests for the bundled templates are patched from the watcher's
+        events. Installed packages never change; any other root (``--source``
+        directories) is dropped and rebuilt by the next command that uses it.
+        """
+        try:
+            changed = self._watcher.read(0) if self._watcher else set()
+        except OSError as e:
+            # inotify missed a new directory: poll, and rebuild everything once
+            self._fall_back(e)
+            self._watcher.close()
+            from devkit_cli.watch import PollingWatcher
+            self._watcher = PollingWatcher(TEMPLATES_DIR)
+            changed = None
+        if changed is None:
+            manifest_module._MANIFEST_CACHE.clear()
+            return
+
+        by_agent: dict[str, list[Path]] = {}
+        for rel_path in changed:
+            if len(rel_path.parts) > 1:
+                by_agent.setdefault(rel_path.parts[0], []).append(Path(*rel_path.parts[1:]))
+
+        for key in list(manifest_module._MANIFEST_CACHE):
+            root = Path(key[0])
+            if root.parent == TEMPLATES_DIR:
+                if root.name in by_agent:
+                    manifest_module.update_manifest(root, by_agent[root.name], list(key[1]))
+            elif not manifest_module._is_installed_package(root):
+                del manifest_module._MANIFEST_CACHE[key]
+
+    def _fall_back(self, error: OSError) -> None:
+        """Report that the template watcher switched to polling."""
+        if self._on_warning:
+            self._on_warning(f"{error}; polling the templates for changes instead")
+
+
+def serve(idle_timeout: float | None = None, on_ready=None, on_warning=None) -> None:
+    """
+    Run the daemon until it is asked to stop or sits idle too long.
+
+    Args:
+        idle_timeout: Exit after this many seconds without requests
+        on_ready: Called with the socket path once it is listening
+        on_warning: Called with a message when the daemon degrades, e.g.
+            polling the templates because inotify failed
+
+    Raises:
+        DaemonRunningError: If a daemon is already running
+        UnsafeSocketError: If the socket directory is not private
+    """
+    # Warm the modules and manifests commands will need
+    from devkit_cli import cli  # noqa: F401
+    from devkit_cli.config import PACK_TEMPLATES_DIR
+    if PACK_TEMPLATES_DIR.is_dir():
+        manifest_module.load_manifest(PACK_TEMPLATES_DIR)
+
+    path = Path(socket_path())
+    with DaemonServer(path, idle_timeout, on_warning) as server:
+        if on_ready:
+            on_ready(path)
+        while not server.stopping:
+            server.handle_request()
+
+
+def _claim_socket(path: Path) -> None:
+    """Create the socket directory and remove a stale socket file."""
+    _check_socket_dir(path.parent)
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink(missing_ok=True)
+            return
+    raise DaemonRunningError(f"A DevKit daemon is already running on {path}")
+
+
+def _check_socket_dir(directory: Path) -> None:
+    """
+    Create the socket directory, or check an existing one is private.
+
+    Without XDG_RUNTIME_DIR the socket lives in the shared temp directory,
+    where another user could create the directory first and read requests
+    or answer them. The directory must be a real directory (not a symlink),
+    owned by the current user, and accessible to nobody else.
+
+    Raises:
+        UnsafeSocketError: If the directory fails any of these checks
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True)
+        # The umask may have narrowed the mode of the new directory
+        directory.chmod(0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        raise UnsafeSocketError(f"Cannot create socket directory {directory}: {e}") from e
+
+    st = directory.lstat()
+    if not stat.S_ISDIR(st.st_mode):
+        raise UnsafeSocketError(f"Socket directory {directory} is not a directory")
+    if st.st_uid != os.getuid():
+        raise UnsafeSocketError(f"Socket directory {directory} is owned by another user (uid {st.st_uid})")
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        raise UnsafeSocketError(
+            f"Socket directory {directory} has mode {stat.S_IMODE(st.st_mode):o}, expected 700 "
+            f"(fix it with: chmod 700 {directory})"
+        )
+
+
+def _open_template_watcher(on_fallback=None):
+    """Watch the bundled templates unless they live in an installed package."""
+    if manifest_module._is_installed_package(TEMPLATES_DIR):
+        return None
+    from devkit_cli.watch import open_watcher
+    try:
+        return open_watcher(TEMPLATES_DIR, on_fallback=on_fallback)
+    except OSError:
+        return None
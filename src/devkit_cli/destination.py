@@ -0,0 +1,120 @@
+"""Destination scan: what an install will find in the project's agent folder.
+
+Every install stage used to probe the destination path by path (``exists``
+while detecting conflicts, ``stat`` while planning a sync, ``is_file`` and
+``stat`` while backing up, ``lstat`` and ``mkdir`` while committing).
+``scan_destination`` walks the agent folder once with ``os.scandir`` and
+records what is there, and the stages look paths up in the result instead.
+
+Only directories on the way to a template file are entered, so unrelated
+trees in the agent folder (session logs, caches) are never listed, and
+only template paths are stat'ed. Symlinks to such directories (e.g.
+``commands -> ../shared/commands``) are followed, so files reached through
+them are compared and backed up like any others.
+"""
+
+import os
+import stat
+from pathlib import Path
+from typing import Iterable
+
+
+class DestinationScan:
+    """Files and directories found under an agent folder, by POSIX relative path."""
+
+    def __init__(self, root: Path, files: dict[str, os.stat_result], dirs: set[str], exists: bool):
+        """
+        Initialize a scan result (use ``scan_destination``).
+
+        Args:
+            root: Agent folder that was scanned
+            files: Stat results for template paths that exist and are not
+                directories (symlinks are followed)
+            dirs: Directories found on the way to template paths, including
+                symlinks to directories there ("" is the root)
+            exists: Whether the agent folder itself exists
+        """
+        self.root = root
+        self.files = files
+        self.dirs = dirs
+        self.exists = exists
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def stat(self, rel_path: Path) -> os.stat_result | None:
+        """Stat result of a template path, or None if nothing file-like is there."""
+        return self.files.get(rel_path.as_posix())
+
+    def is_dir(self, rel_path: Path) -> bool:
+        """Whether a real directory (not a symlink to one) is at a template file path."""
+        return rel_path.as_posix() in self.dirs
+
+    def existing_dirs(self) -> set[Path]:
+        """Absolute paths of the directories found, for skipping ``mkdir``."""
+        return {self.root / d if d else self.root for d in self.dirs}
+
+
+def scan_destination(agent_folder: Path, rel_paths: Iterable[Path]) -> DestinationScan:
+    """
+    Walk an agent folder once, recording what exists at the given paths.
+
+    Args:
+        agent_folder: Folder templates are installed into
+        rel_paths: Template paths relative to agent_folder
+
+    Returns:
+        The scan result
+    """
+    wanted: set[str] = set()
+    wanted_dirs: set[str] = {""}
+    for rel_path in rel_paths:
+        key = rel_path.as_posix()
+        wanted.add(key)
+        parent = key.rpartition("/")[0]
+        while parent not in wanted_dirs:
+            wanted_dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+
+    files: dict[str, os.stat_result] = {}
+    dirs: set[str] = set()
+    root = str(agent_folder)
+    try:
+        if not stat.S_ISDIR(os.stat(root).st_mode):
+            return DestinationScan(agent_folder, files, dirs, exists=False)
+    except (FileNotFoundError, NotADirectoryError):
+        return DestinationScan(agent_folder, files, dirs, exists=False)
+
+    dirs.add("")
+    stack = [("", root)]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            scanner = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with scanner:
+            for item in scanner:
+                key = prefix + item.name
+                if item.is_dir(follow_symlinks=False):
+                    if key in wanted_dirs:
+                        dirs.add(key)
+                        stack.append((key + "/", item.path))
+                    elif key in wanted:
+                        # A directory where a template file belongs
+                        dirs.add(key)
+                    continue
+                if key in wanted_dirs and item.is_symlink() and item.is_dir():
+                    # A linked directory on the way to template paths: its
+                    # files are installed through the link, so scan them
+                    dirs.add(key)
+                    stack.append((key + "/", item.path))
+                    continue
+                if key not in wanted:
+                    continue
+                try:
+                    files[key] = item.stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    # Dangling symlink: nothing to compare, install over it
+                    continue
+    return DestinationScan(agent_folder, files, dirs, exists=True)
@@ -0,0 +1,138 @@
+"""Machine-readable event stream for DevKit CLI (``--output json|ndjson``).
+
+Code reports what it does with ``get_events().emit(event, **fields)``. By
+default the sink is ``NULL_EVENTS``, whose ``emit`` does nothing, and hot
+loops check ``enabled`` before building per-file events. ``emitting``
+installs a real sink for the duration of a command:
+
+- ``NdjsonSink`` writes each event as one JSON line and flushes it at once,
+  so a supervising process can follow an install as it happens, at
+  constant memory.
+- ``JsonSink`` collects the events and writes them as one JSON array when
+  the command ends, for tools that want a single document.
+
+Events are dicts with an ``event`` name, a ``time`` (seconds since the
+epoch) and event-specific fields. Paths are project-relative POSIX strings.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+
+# Values accepted by --output
+OUTPUT_FORMATS = ["text", "json", "ndjson"]
+
+
+class NullEventSink:
+    """Sink used when no machine-readable output was requested."""
+
+    enabled = False
+
+    def emit(self, event: str, **fields) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+NULL_EVENTS = NullEventSink()
+
+
+class NdjsonSink:
+    """Writes one JSON object per line, flushed as each event happens."""
+
+    enabled = True
+
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Text stream to write to (normally stdout)
+        """
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        """Write one event (safe to call from worker threads)."""
+        line = json.dumps({"event": event, "time": round(time.time(), 6), **fields}, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class JsonSink:
+    """Collects events and writes them as one JSON array on close."""
+
+    enabled = True
+
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Text stream to write the array to (normally stdout)
+        """
+        self.stream = stream
+        self.events: list[dict] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        """Record one event (safe to call from worker threads)."""
+        with self._lock:
+            self.events.append({"event": event, "time": round(time.time(), 6), **fields})
+
+    def close(self) -> None:
+        """Write every recorded event."""
+        json.dump(self.events, self.stream, indent=2, default=str)
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+# Active sink; replaced by ``emitting`` for the duration of a command
+_events: NdjsonSink | JsonSink | NullEventSink = NULL_EVENTS
+
+
+def get_events() -> NdjsonSink | JsonSink | NullEventSink:
+    """Return the active event sink (``NULL_EVENTS`` unless requested)."""
+    return _events
+
+
+def open_sink(output_format: str, stream: TextIO | None = None) -> NdjsonSink | JsonSink | NullEventSink:
+    """
+    Create the sink for an ``--output`` format.
+
+    Args:
+        output_format: One of OUTPUT_FORMATS
+        stream: Where to write (defaults to stdout)
+    """
+    stream = stream or sys.stdout
+    if output_format == "ndjson":
+        return NdjsonSink(stream)
+    if output_format == "json":
+        return JsonSink(stream)
+    return NULL_EVENTS
+
+
+@contextmanager
+def emitting(sink: NdjsonSink | JsonSink | NullEventSink) -> Iterator[NdjsonSink | JsonSink | NullEventSink]:
+    """
+    Make a sink active for a block, closing it when the block exits.
+
+    Yields:
+        The active sink
+    """
+    global _events
+    _events = sink
+    try:
+        yield sink
+    finally:
+        _events = NULL_EVENTS
+        sink.close()
@@ -0,0 +1,142 @@
+"""Fleet installs: apply templates to many projects in one process."""
+
+import glob
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from devkit_cli.core import BatchedAdvance, TemplateManager, make_progress
+from devkit_cli.models import FleetResult, InstallResult, LinkMode
+from devkit_cli.utils import DevKitError, ProjectPathError
+
+
+# Default number of projects installed concurrently
+DEFAULT_FLEET_WORKERS = 8
+
+
+def resolve_fleet_paths(
+    paths: list[str],
+    from_file: Path | None = None,
+    pattern: str | None = None,
+) -> list[Path]:
+    """
+    Collect project directories from arguments, a paths file and a glob.
+
+    Args:
+        paths: Project paths given on the command line
+        from_file: File with one project path per line ('#' starts a comment)
+        pattern: Glob pattern matching project directories
+
+    Returns:
+        Resolved, de-duplicated project paths in the order given
+
+    Raises:
+        ProjectPathError: If the paths file cannot be read or nothing matched
+    """
+    candidates = list(paths)
+
+    if from_file is not None:
+        try:
+            lines = from_file.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            raise ProjectPathError(f"Cannot read paths file {from_file}: {e}") from e
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                candidates.append(line)
+
+    if pattern is not None:
+        matches = sorted(glob.glob(str(Path(pattern).expanduser())))
+        candidates.extend(m for m in matches if Path(m).is_dir())
+
+    resolved = []
+    seen = set()
+    for candidate in candidates:
+        project_path = Path(candidate).expanduser().resolve()
+        if project_path not in seen:
+            seen.add(project_path)
+            resolved.append(project_path)
+
+    if not resolved:
+        raise ProjectPathError("No project paths given (use arguments, --from-file or --glob)")
+
+    return resolved
+
+
+def run_fleet(
+    template_manager: TemplateManager,
+    project_paths: list[Path],
+    workers: int = DEFAULT_FLEET_WORKERS,
+    sync: bool = False,
+    show_progress: bool = True,
+    link_mode: LinkMode = LinkMode.COPY,
+) -> FleetResult:
+    """
+    Install templates into many projects on a bounded thread pool.
+
+    The manifest and template contents are loaded once and shared by all
+    workers. Each project copies its files sequentially, since the pool
+    already provides the concurrency. A failure in one project never stops
+    the others.
+
+    Args:
+        template_manager: Manager for the agent to install
+        project_paths: Existing project directories
+        workers: Maximum number of concurrent installs
+        sync: Copy only new or changed files in each project
+        show_progress: Display a progress bar over projects
+        link_mode: How files are materialized in each project
+
+    Returns:
+        FleetResult with one InstallResult per project, in input order
+    """
+    start = time.perf_counter()
+    template_manager.preload_contents()
+
+    def install_one(project_path: Path) -> InstallResult:
+        if not project_path.is_dir():
+            return _failed_result(template_manager, project_path, "Project directory not found")
+        try:
+            return template_manager.install_templates(
+                project_path, sync=sync, show_progress=False,
+                copy_workers=1, link_mode=link_mode,
+            )
+        except (DevKitError, OSError) as e:
+            return _failed_result(template_manager, project_path, str(e))
+        except Exception as e:
+            # A bug or bad input in one project must not lose the others' results
+            return _failed_result(template_manager, project_path, f"Unexpected error: {type(e).__name__}: {e}")
+
+    results: dict[Path, InstallResult] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor, make_progress(show_progress) as progress:
+        futures = {executor.submit(install_one, p): p for p in project_paths}
+        advance = None
+        if progress:
+            advance = BatchedAdvance(progress, progress.add_task("Installing into projects", total=len(futures)))
+
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if advance:
+                advance()
+        if advance:
+            advance.flush()
+
+    return FleetResult(
+        agent=template_manager.agent,
+        results=[results[p] for p in project_paths],
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def _failed_result(template_manager: TemplateManager, project_path: Path, message: str) -> InstallResult:
+    """Build an InstallResult for a project that could not be installed."""
+    return InstallResult(
+        success=False,
+        project_path=project_path,
+        agent=template_manager.agent,
+        files_copied=[],
+        backup_path=None,
+        conflicts=[],
+        message=message,
+    )
+
@@ -0,0 +1,173 @@
+"""Markdown frontmatter parser (header-only unless the body is wanted)."""
+
+import io
+from pathlib import Path
+from typing import Iterable
+from devkit_cli.models import Component
+
+
+# Frontmatter delimiter line
+DELIMITER = "---"
+
+# Stop reading a file after this many bytes if the header never closes
+MAX_HEADER_BYTES = 64 * 1024
+
+
+def read_frontmatter(path: Path, max_bytes: int = MAX_HEADER_BYTES) -> dict[str, str]:
+    """
+    Read the frontmatter block at the top of a markdown file.
+
+    Only the header is read: the file is consumed line by line and reading
+    stops at the closing ``---``, so the cost does not depend on the size of
+    the document body.
+
+    Args:
+        path: Markdown file
+        max_bytes: Give up (returning {}) if the header is longer than this
+
+    Returns:
+        Frontmatter keys and values, or {} if the file has no frontmatter
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return _read_header(f, max_bytes)
+
+
+def frontmatter_from_bytes(data: bytes, max_bytes: int = MAX_HEADER_BYTES) -> dict[str, str]:
+    """
+    Parse the frontmatter block from file contents already in memory.
+
+    Only the first ``max_bytes`` are decoded, for sources (such as bundles)
+    that hand out whole files.
+
+    Returns:
+        Frontmatter keys and values, or {} if there is no frontmatter
+    """
+    text = data[:max_bytes].decode("utf-8", errors="replace")
+    return _read_header(io.StringIO(text), max_bytes)
+
+
+def split_frontmatter(text: str) -> tuple[dict[str, str], str]:
+    """
+    Separate a markdown document into its frontmatter and body.
+
+    Args:
+        text: Whole document
+
+    Returns:
+        Tuple of (frontmatter keys and values, body); a document without a
+        closed frontmatter block is returned whole as the body
+    """
+    lines = text.splitlines(keepends=True)
+    if not lines or lines[0].strip() != DELIMITER:
+        return {}, text
+    for index, line in enumerate(lines[1:], start=1):
+        if line.rstrip() == DELIMITER:
+            return parse_frontmatter(lines[1:index]), "".join(lines[index + 1:])
+    return {}, text
+
+
+def _read_header(lines: Iterable[str], max_bytes: int) -> dict[str, str]:
+    """Collect and parse the lines between the opening and closing ``---``."""
+    iterator = iter(lines)
+    first = next(iterator, "")
+    if first.strip() != DELIMITER:
+        return {}
+    header = []
+    consumed = len(first)
+    for line in iterator:
+        consumed += len(line)
+        if consumed > max_bytes:
+            return {}
+        if line.rstrip() == DELIMITER:
+            return parse_frontmatter(header)
+        header.append(line)
+    return {}
+
+
+def parse_frontmatter(lines: list[str]) -> dict[str, str]:
+    """
+    Parse the flat ``key: value`` subset of YAML used by agent templates.
+
+    Values may be quoted; indented continuation lines are folded into the
+    previous value, and comments and blank lines are skipped.
+
+    Args:
+        lines: Lines between the ``---`` delimiters
+
+    Returns:
+        Parsed keys and values
+    """
+    data: dict[str, str] = {}
+    key = None
+    for raw in lines:
+        line = raw.rstrip("\n")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if line[0] in " \t" and key is not None:
+            data[key] = f"{data[key]} {stripped}".strip()
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = name.strip()
+        data[key] = _unquote(value.strip())
+    return data
+
+
+def _unquote(value: str) -> str:
+    """Strip matching single or double quotes."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def component_kind(rel_path: str) -> str | None:
+    """
+    Classify a template file by its location.
+
+    Takes a POSIX path string rather than a Path: this runs for every file
+    in a pack, and string splitting is far cheaper than pathlib parsing.
+
+    Args:
+        rel_path: POSIX path relative to the template or plugin root
+
+    Returns:
+        "agent", "command" or "skill", or None for supporting files
+    """
+    if not rel_path.endswith(".md"):
+        return None
+    parts = rel_path.split("/")
+    if len(parts) < 2:
+        return None
+    if parts[0] == "agents":
+        return "agent"
+    if parts[0] == "commands":
+        return "command"
+    if parts[0] == "skills" and len(parts) == 3 and parts[2] == "SKILL.md":
+        return "skill"
+    return None
+
+
+def make_component(kind: str, rel_path: str, meta: dict[str, str]) -> Component:
+    """
+    Build a Component from a file's frontmatter.
+
+    Commands are invoked by file name and skills by directory name, so those
+    are the fallback names when the frontmatter has none.
+
+    Args:
+        kind: Component kind, from ``component_kind``
+        rel_path: POSIX path relative to the template or plugin root
+        meta: Parsed frontmatter
+    """
+    parts = rel_path.split("/")
+    default_name = parts[-2] if kind == "skill" else parts[-1].rsplit(".", 1)[0]
+    return Component(
+        kind=kind,
+        name=meta.get("name") or default_name,
+        path=rel_path,
+        description=meta.get("description", ""),
+        tools=meta.get("tools") or meta.get("allowed-tools", ""),
+        model=meta.get("model", ""),
+    )
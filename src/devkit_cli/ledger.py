@@ -0,0 +1,144 @@
+"""Install ledger: what DevKit wrote to a project's agent folder.
+
+After each install DevKit writes ``.devkit-ledger.json`` into the agent
+folder. For every installed file it records the size, mtime, inode and mode
+the file had once written, the hash of its contents, and the hash of the
+template it came from. A file whose stat still matches was not touched
+since, so its contents are known without reading it:
+
+- installs skip hashing files that match the ledger, and replace untouched
+  files from an earlier install without backing them up
+  (``ConflictKind.OUTDATED``); only files someone changed are backed up
+- ``devkit status`` stats every recorded file and hashes only the ones
+  whose stat changed, so a check costs one stat per file
+
+Entries are stored as arrays (see ``FIELDS``) to keep the file small and
+quick to parse on large installs.
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+from devkit_cli import __version__
+from devkit_cli.config import LEDGER_FILE
+from devkit_cli.manifest import TemplateManifest
+from devkit_cli.models import Agent, DriftReport, LedgerEntry
+from devkit_cli.utils import hash_file, write_text_atomic
+
+
+# Bump when the ledger layout changes
+LEDGER_FORMAT = 1
+
+# Order of the values stored for each file
+FIELDS = ["size", "mtime_ns", "ino", "mode", "sha256", "template"]
+
+
+def read_ledger(agent_folder: Path) -> dict[str, LedgerEntry]:
+    """
+    Read the ledger of an agent folder.
+
+    Args:
+        agent_folder: Agent folder (e.g., project/.claude)
+
+    Returns:
+        Entries by POSIX path relative to the agent folder, or {} if there is
+        no usable ledger (installs then fall back to hashing)
+    """
+    try:
+        with open(agent_folder / LEDGER_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != LEDGER_FORMAT or data.get("fields") != FIELDS:
+        return {}
+    try:
+        return {path: LedgerEntry(*values) for path, values in data["files"].items()}
+    except (KeyError, TypeError, AttributeError):
+        return {}
+
+
+def write_ledger(agent_folder: Path, entries: dict[str, LedgerEntry], source: str) -> None:
+    """
+    Write the ledger of an agent folder.
+
+    Args:
+        agent_folder: Agent folder the entries describe
+        entries: Entries by POSIX path relative to the agent folder
+        source: Label of the template source installed from
+    """
+    data = {
+        "format": LEDGER_FORMAT,
+        "version": __version__,
+        "source": source,
+        "fields": FIELDS,
+        "files": {
+            path: [entry.size, entry.mtime_ns, entry.ino, entry.mode, entry.sha256, entry.template]
+            for path, entry in sorted(entries.items())
+        },
+    }
+    write_text_atomic(agent_folder / LEDGER_FILE, json.dumps(data, separators=(",", ":")))
+
+
+def ledger_entry(st: os.stat_result, sha256: str, template: str) -> LedgerEntry:
+    """Record a file as it is now, given the hash of its contents."""
+    return LedgerEntry(
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        ino=st.st_ino,
+        mode=stat.S_IMODE(st.st_mode),
+        sha256=sha256,
+        template=template,
+    )
+
+
+def check_drift(
+    project_path: Path,
+    agent: Agent,
+    entries: dict[str, LedgerEntry],
+    manifest: TemplateManifest | None = None,
+) -> DriftReport:
+    """
+    Compare an agent folder with its ledger.
+
+    Each recorded file is stat'ed; only files whose stat differs from the
+    ledger are hashed, and a file with its recorded contents still counts
+    as clean (it was only touched).
+
+    Args:
+        project_path: Project directory
+        agent: Agent whose folder is checked
+        entries: The folder's ledger (``read_ledger``)
+        manifest: Current templates for the agent; files whose template
+            changed since the install are reported as outdated
+
+    Returns:
+        The drift report, paths relative to the agent folder
+    """
+    agent_folder = project_path / agent.folder
+    templates = {entry.path.as_posix(): entry.sha256 for entry in manifest.entries} if manifest else {}
+    report = DriftReport(project_path=project_path, agent=agent, files=len(entries))
+    # String paths: one stat per file is the whole cost of a clean check
+    root = str(agent_folder) + os.sep
+
+    for key, recorded in entries.items():
+        try:
+            st = os.stat(root + key)
+        except (FileNotFoundError, NotADirectoryError):
+            report.missing.append(Path(key))
+            continue
+        if not recorded.matches(st):
+            if not stat.S_ISREG(st.st_mode) or stat.S_IMODE(st.st_mode) != recorded.mode:
+                report.modified.append(Path(key))
+                continue
+            report.hashed += 1
+            if hash_file(root + key) != recorded.sha256:
+                report.modified.append(Path(key))
+                continue
+        template = templates.get(key)
+        if template is not None and template != recorded.template:
+            report.outdated.append(Path(key))
+
+    for paths in (report.modified, report.missing, report.outdated):
+        paths.sort()
+    return report
@@ -0,0 +1,220 @@
+"""Machine-readable output for DevKit CLI (``devkit --output json|ndjson``).
+
+Mirrors the display functions in ``ui`` and ``plain``, but turns each one
+into an event on the active sink (see ``devkit_cli.events``) instead of
+text. Nothing here imports rich. Banners and hints aimed at people are
+dropped; prompts are unavailable, as in plain mode.
+"""
+
+from collections import Counter
+from dataclasses import asdict
+from typing import Sequence
+from devkit_cli.backup import Backup
+from devkit_cli.events import get_events
+from devkit_cli.models import Component, DriftReport, FleetResult, InstallResult, PluginInfo, WatchPush
+from devkit_cli.plain import prompt_project_path, select_agent  # noqa: F401 (same behaviour)
+from devkit_cli.timing import Tracer
+
+
+def show_banner() -> None:
+    """Machine output has no banner."""
+
+
+def show_error(message: str, prefix: str = "Error") -> None:
+    """
+    Emit an ``error`` event.
+
+    Args:
+        message: Error message
+        prefix: Context for the error, such as a project path
+    """
+    get_events().emit("error", message=message, context=prefix)
+
+
+def show_warning(message: str) -> None:
+    """Emit a ``warning`` event."""
+    get_events().emit("warning", message=message.strip())
+
+
+def show_hint(message: str) -> None:
+    """Emit a ``message`` event."""
+    get_events().emit("message", message=message.strip())
+
+
+def _result_fields(result: InstallResult) -> dict:
+    """Summary fields of an install result (files were reported as events)."""
+    return {
+        "project": str(result.project_path),
+        "agent": str(result.agent.name),
+        "success": result.success,
+        "message": result.message,
+        "sync": result.sync,
+        "copied": len(result.files_copied),
+        "added": len(result.files_added),
+        "updated": len(result.files_updated),
+        "unchanged": len(result.files_unchanged),
+        "existing": dict(Counter(result.existing.values())),
+        "backup_id": result.backup_id,
+    }
+
+
+def show_result(result: InstallResult, verbose: bool = False) -> None:
+    """
+    Emit a ``result`` event for an install.
+
+    Per-file actions were already emitted while installing, so ``verbose``
+    has nothing to add.
+
+    Args:
+        result: Installation result
+        verbose: Accepted for compatibility with the other display modules
+    """
+    get_events().emit("result", **_result_fields(result))
+
+
+def show_next_steps(project_label: str) -> None:
+    """Machine output has no follow-up instructions."""
+
+
+def show_fleet_result(fleet: FleetResult) -> None:
+    """
+    Emit a ``result`` event per project, then a ``fleet_result`` summary.
+
+    Args:
+        fleet: Fleet result
+    """
+    events = get_events()
+    for result in fleet.results:
+        events.emit("result", **_result_fields(result))
+    events.emit(
+        "fleet_result",
+        agent=str(fleet.agent.name),
+        projects=len(fleet.results),
+        succeeded=len(fleet.succeeded),
+        failed=len(fleet.failed),
+        elapsed=round(fleet.elapsed, 6),
+    )
+
+
+def show_watch_push(push: WatchPush) -> None:
+    """
+    Emit a ``watch_push`` event, plus results for the projects updated.
+
+    Args:
+        push: Pushed changes
+    """
+    events = get_events()
+    events.emit(
+        "watch_push",
+        changed=[p.as_posix() for p in push.changed],
+        removed=[p.as_posix() for p in push.removed],
+        settings_changed=push.settings_changed,
+    )
+    if push.fleet:
+        for result in push.fleet.results:
+            events.emit("result", **_result_fields(result))
+
+
+def show_plugins(plugins: Sequence[PluginInfo], show_components: bool = False) -> None:
+    """
+    Emit one ``plugin`` event per plugin.
+
+    Args:
+        plugins: Plugins to report
+        show_components: Include each plugin's components
+    """
+    events = get_events()
+    for plugin in plugins:
+        fields = {
+            "name": plugin.name,
+            "source": plugin.source,
+            "description": plugin.description,
+            "version": plugin.version,
+            "author": plugin.author,
+            "installable": plugin.installable,
+            "component_count": len(plugin.components),
+        }
+        if show_components:
+            fields["components"] = [asdict(c) for c in plugin.components]
+        events.emit("plugin", **fields)
+
+
+def show_components(components: Sequence[Component]) -> None:
+    """Emit one ``component`` event per component."""
+    events = get_events()
+    for component in components:
+        events.emit("component", **asdict(component))
+
+
+def show_backups(backups: Sequence[Backup]) -> None:
+    """Emit one ``backup`` event per backup, newest first."""
+    events = get_events()
+    for backup in backups:
+        events.emit(
+            "backup",
+            id=backup.id,
+            created=backup.created.isoformat(),
+            agent_folder=backup.agent_folder,
+            files=len(backup.files),
+        )
+
+
+def show_status(reports: Sequence[DriftReport]) -> None:
+    """
+    Emit a ``drift`` event per drifted file, then a ``status`` event per agent folder.
+
+    Args:
+        reports: One drift report per agent folder
+    """
+    events = get_events()
+    for report in reports:
+        folder = report.agent.folder
+        for state, paths in (("modified", report.modified), ("missing", report.missing), ("outdated", report.outdated)):
+            for path in paths:
+                events.emit("drift", project=str(report.project_path), state=state, path=f"{folder}/{path.as_posix()}")
+        events.emit(
+            "status",
+            project=str(report.project_path),
+            agent=str(report.agent.name),
+            clean=report.clean,
+            files=report.files,
+            modified=len(report.modified),
+            missing=len(report.missing),
+            outdated=len(report.outdated),
+            hashed=report.hashed,
+        )
+
+
+def show_restore_result(backup: Backup, restored: Sequence, undo: Backup | None) -> None:
+    """
+    Emit a ``restore`` event.
+
+    Args:
+        backup: Backup that was restored
+        restored: Relative paths that were restored
+        undo: Backup of the files that were replaced, if any
+    """
+    get_events().emit(
+        "restore",
+        id=backup.id,
+        agent_folder=backup.agent_folder,
+        files=[f"{backup.agent_folder}/{path.as_posix()}" for path in restored],
+        undo_id=undo.id if undo else None,
+    )
+
+
+def show_timings(tracer: Tracer) -> None:
+    """Emit a ``timings`` event with the recorded spans and counters."""
+    get_events().emit(
+        "timings",
+        spans=[
+            {"name": name, "ms": round(duration_ms, 3), "details": details}
+            for name, duration_ms, details in tracer.rows()
+        ],
+        counters=dict(tracer.counters),
+    )
+
+
+def show_version(version: str) -> None:
+    """Emit a ``version`` event."""
+    get_events().emit("version", version=version)
@@ -0,0 +1,429 @@
+"""Template manifest for DevKit CLI."""
+
+import fnmatch
+import hashlib
+import json
+import os
+import stat
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+from devkit_cli import __version__
+from devkit_cli.config import DEFAULT_PROFILE, INSTALL_PROFILES, TEMPLATE_SUBDIRS
+from devkit_cli.render import has_placeholders
+from devkit_cli.timing import get_tracer
+from devkit_cli.utils import DevKitError, get_cache_dir, write_text_atomic
+
+
+# Bump when the on-disk manifest layout changes
+MANIFEST_FORMAT = 2
+
+# Files modified this recently (ns) are hashed again on the next build: an
+# edit within the same mtime tick would not change their stat
+RACY_WINDOW_NS = 2_000_000_000
+
+# In-process cache so repeated managers share one manifest
+_MANIFEST_CACHE: dict[tuple[str, tuple[str, ...]], "TemplateManifest"] = {}
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A single template file recorded in the manifest."""
+    path: Path
+    size: int
+    mode: int
+    sha256: str
+    templated: bool = False  # Contains {{ devkit.* }} placeholders
+
+
+@dataclass
+class TemplateManifest:
+    """Precomputed index of every template file under a template root."""
+    root: Path
+    version: str
+    entries: list[ManifestEntry]
+    _digest: str | None = field(default=None, init=False, repr=False, compare=False)
+    # (size, mtime_ns, mode) each file was hashed at, by POSIX path (set by build)
+    _stats: dict[str, list[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        root: Path,
+        subdirs: list[str] = TEMPLATE_SUBDIRS,
+        known: dict[str, tuple[list[int], ManifestEntry]] | None = None,
+    ) -> "TemplateManifest":
+        """
+        Walk the template tree once and record every file.
+
+        Args:
+            root: Template root directory (e.g., templates/claude-code)
+            subdirs: Subdirectories of the root to include
+            known: Entries of an earlier build with the stat they were
+                hashed at, by POSIX path; files whose size, mtime and mode
+                still match are not read again
+
+        Returns:
+            Manifest with entries sorted by relative path
+        """
+        known = known or {}
+        settled = time.time_ns() - RACY_WINDOW_NS
+        stats: dict[str, list[int]] = {}
+        hashed = 0
+        entries = []
+        for subdir in subdirs:
+            subdir_path = root / subdir
+            if not subdir_path.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(subdir_path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    file_path = Path(dirpath) / filename
+                    st = file_path.stat()
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
+                    rel_path = file_path.relative_to(root)
+                    key = rel_path.as_posix()
+                    stat_key = [st.st_size, st.st_mtime_ns, stat.S_IMODE(st.st_mode)]
+                    previous = known.get(key)
+                    if previous and previous[0] == stat_key:
+                        entry = previous[1]
+                    else:
+                        entry = _scan_entry(file_path, rel_path, st)
+                        hashed += 1
+                    entries.append(entry)
+                    if st.st_mtime_ns < settled:
+                        stats[key] = stat_key
+
+        get_tracer().count("templates_hashed", hashed)
+        # The walk lists a directory's files before its subdirectories
+        entries.sort(key=lambda entry: entry.path.as_posix())
+        manifest = cls(root=root, version=__version__, entries=entries)
+        manifest._stats = stats
+        return manifest
+
+    @classmethod
+    def from_dict(cls, root: Path, data: dict) -> "TemplateManifest":
+        """Rebuild a manifest from its serialized form."""
+        entries = [
+            ManifestEntry(
+                path=Path(item["path"]),
+                size=item["size"],
+                mode=item["mode"],
+                sha256=item["sha256"],
+                templated=item.get("templated", False),
+            )
+            for item in data["entries"]
+        ]
+        return cls(root=root, version=data["version"], entries=entries)
+
+    def to_dict(self) -> dict:
+        """Serialize the manifest to a JSON-compatible dict."""
+        return {
+            "format": MANIFEST_FORMAT,
+            "version": self.version,
+            "entries": [
+                {
+                    "path": entry.path.as_posix(),
+                    "size": entry.size,
+                    "mode": entry.mode,
+                    "sha256": entry.sha256,
+                    "templated": entry.templated,
+                }
+                for entry in self.entries
+            ],
+        }
+
+    def digest(self) -> str:
+        """
+        Content hash of the manifest: every path with its mode and file hash.
+
+        Computed once per manifest object; two manifests listing the same
+        files with the same contents have the same digest.
+        """
+        if self._digest is None:
+            h = hashlib.sha256()
+            for entry in self.entries:
+                h.update(f"{entry.path.as_posix()}\0{entry.mode:o}\0{entry.sha256}\n".encode("utf-8"))
+            self._digest = h.hexdigest()
+        return self._digest
+
+    @property
+    def paths(self) -> list[Path]:
+        """Relative paths of all template files."""
+        return [entry.path for entry in self.entries]
+
+    def select(self, file_filter: "FileFilter") -> "TemplateManifest":
+        """
+        Narrow the manifest to the files a filter selects.
+
+        Args:
+            file_filter: Include/exclude patterns to apply
+
+        Returns:
+            New manifest holding only the selected entries, in manifest order
+
+        Raises:
+            DevKitError: If an include pattern matches no template file
+        """
+        for pattern in file_filter.include:
+            if not any(_matches(entry.path, pattern) for entry in self.entries):
+                raise DevKitError(f"Include pattern '{pattern}' matches no template files")
+
+        entries = [entry for entry in self.entries if file_filter.matches(entry.path)]
+        return TemplateManifest(root=self.root, version=self.version, entries=entries)
+
+
+@dataclass(frozen=True)
+class FileFilter:
+    """
+    Glob filters selecting which template files to install.
+
+    Patterns match paths relative to the template root (``commands/onboard.md``),
+    with ``*`` also matching across directories. A pattern naming a directory
+    (``skills``) matches everything below it. An empty include list selects
+    every file; excludes are applied after includes.
+    """
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+
+    @classmethod
+    def from_options(
+        cls,
+        profile: str | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> "FileFilter":
+        """
+        Combine a named install profile with extra include/exclude patterns.
+
+        Args:
+            profile: Name from INSTALL_PROFILES (defaults to DEFAULT_PROFILE)
+            include: Extra patterns to include
+            exclude: Extra patterns to exclude
+
+        Returns:
+            The combined filter
+
+        Raises:
+            DevKitError: If the profile is unknown
+        """
+        name = profile or DEFAULT_PROFILE
+        if name not in INSTALL_PROFILES:
+            available = ", ".join(sorted(INSTALL_PROFILES))
+            raise DevKitError(f"Unknown install profile '{name}' (available: {available})")
+
+        base = INSTALL_PROFILES[name]
+        return cls(
+            include=tuple(dict.fromkeys([*base["include"], *(include or [])])),
+            exclude=tuple(dict.fromkeys([*base["exclude"], *(exclude or [])])),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the filter selects every file."""
+        return not self.include and not self.exclude
+
+    def matches(self, rel_path: Path) -> bool:
+        """Whether a template file is selected by this filter."""
+        if self.include and not any(_matches(rel_path, p) for p in self.include):
+            return False
+        return not any(_matches(rel_path, p) for p in self.exclude)
+
+
+def _matches(rel_path: Path, pattern: str) -> bool:
+    """Match a relative path against one glob pattern or directory prefix."""
+    path = rel_path.as_posix()
+    pattern = pattern.strip("/")
+    return fnmatch.fnmatchcase(path, pattern) or fnmatch.fnmatchcase(path, pattern + "/*")
+
+
+def load_manifest(
+    root: Path,
+    subdirs: list[str] = TEMPLATE_SUBDIRS,
+    refresh: bool = False,
+) -> TemplateManifest:
+    """
+    Load the manifest for a template root, building it on first use.
+
+    Manifests are cached in memory for the lifetime of the process, and on
+    disk under the user cache directory, keyed by package version and
+    template root. Roots inside an installed package never change, so their
+    cached manifest is used as is. Other roots (source checkouts, user
+    template directories, overlay layers) are walked and stat'ed each run so
+    edits are picked up immediately, but only files whose size, mtime or
+    mode changed since the cached build are read and hashed again.
+
+    Args:
+        root: Template root directory
+        subdirs: Subdirectories of the root to include
+        refresh: Ignore any cached manifest and rebuild it
+
+    Returns:
+        Manifest for the template root
+    """
+    key = (str(root), tuple(subdirs))
+    if not refresh and key in _MANIFEST_CACHE:
+        return _MANIFEST_CACHE[key]
+
+    cache_file = _manifest_cache_file(root, subdirs)
+    if not _is_installed_package(root):
+        known = {} if refresh else _read_cached_stats(root, cache_file)
+        manifest = TemplateManifest.build(root, subdirs, known=known)
+        stale = {path: stat_key for path, (stat_key, _) in known.items()}
+        if manifest._stats != stale or len(manifest.entries) != len(known):
+            try:
+                write_text_atomic(cache_file, json.dumps({**manifest.to_dict(), "stats": manifest._stats}))
+            except OSError:
+                # A read-only cache dir only costs us the next rehash
+                pass
+        _MANIFEST_CACHE[key] = manifest
+        return manifest
+
+    manifest = None if refresh else _read_cached_manifest(root, cache_file)
+
+    if manifest is None:
+        manifest = TemplateManifest.build(root, subdirs)
+        try:
+            write_text_atomic(cache_file, json.dumps(manifest.to_dict()))
+        except OSError:
+            # A read-only cache dir only costs us the next rebuild
+            pass
+
+    _MANIFEST_CACHE[key] = manifest
+    return manifest
+
+
+def update_manifest(
+    root: Path,
+    changed: Iterable[Path],
+    subdirs: list[str] = TEMPLATE_SUBDIRS,
+) -> TemplateManifest:
+    """
+    Patch the cached manifest for a template root after some files changed.
+
+    Only the changed paths are stat'ed and hashed; every other entry is kept
+    as is. Paths that no longer exist (or are no longer regular files) are
+    dropped, along with every entry below them, since a directory that was
+    moved away or deleted is reported as a single path. Entries stay sorted
+    by path, as in a freshly built manifest, so its digest is the same.
+
+    Args:
+        root: Template root directory
+        changed: Paths relative to root that were created, modified or removed
+        subdirs: Subdirectories of the root to include
+
+    Returns:
+        The updated manifest, which also replaces the cached one
+    """
+    manifest = load_manifest(root, subdirs)
+    entries = {entry.path: entry for entry in manifest.entries}
+
+    # Parents first, so a directory replaced within one batch loses its old
+    # entries before the files now in it are added back
+    for rel_path in sorted(changed, key=lambda p: len(p.parts)):
+        if not rel_path.parts or rel_path.parts[0] not in subdirs:
+            continue
+        file_path = root / rel_path
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            entries.pop(rel_path, None)
+            prefix = rel_path.as_posix() + "/"
+            for path in [p for p in entries if p.as_posix().startswith(prefix)]:
+                del entries[path]
+            continue
+        entries[rel_path] = _scan_entry(file_path, rel_path, st)
+
+    manifest = TemplateManifest(
+        root=root,
+        version=__version__,
+        entries=sorted(entries.values(), key=lambda entry: entry.path.as_posix()),
+    )
+    _MANIFEST_CACHE[(str(root), tuple(subdirs))] = manifest
+    if _is_installed_package(root):
+        try:
+            write_text_atomic(_manifest_cache_file(root, subdirs), json.dumps(manifest.to_dict()))
+        except OSError:
+            pass
+    return manifest
+
+
+def _scan_entry(file_path: Path, rel_path: Path, st: os.stat_result) -> ManifestEntry:
+    """
+    Hash a template file and check it for placeholders in one read.
+
+    Flagging templated files here means installs know which files need
+    rendering without looking at their contents again.
+    """
+    data = file_path.read_bytes()
+    return ManifestEntry(
+        path=rel_path,
+        size=len(data),
+        mode=stat.S_IMODE(st.st_mode),
+        sha256=hashlib.sha256(data).hexdigest(),
+        templated=has_placeholders(data),
+    )
+
+
+def _is_installed_package(root: Path) -> bool:
+    """Whether a template root lives in an installed (immutable) package."""
+    return any(part in ("site-packages", "dist-packages") for part in root.parts)
+
+
+def _manifest_cache_file(root: Path, subdirs: list[str]) -> Path:
+    """Cache file location for a template root, keyed by package version."""
+    digest = hashlib.sha256(
+        "\0".join([str(root.resolve()), *subdirs]).encode("utf-8")
+    ).hexdigest()[:16]
+    return get_cache_dir() / "manifests" / f"{__version__}-{digest}.json"
+
+
+def _read_cached_stats(root: Path, cache_file: Path) -> dict[str, tuple[list[int], ManifestEntry]]:
+    """
+    Entries of a cached build with the stat they were hashed at.
+
+    Returns:
+        Entries by POSIX path, or {} if there is no usable cache
+    """
+    data = _read_cache_file(cache_file)
+    manifest = _manifest_from_cache(root, data) if data else None
+    stats = data.get("stats") if manifest else None
+    if not isinstance(stats, dict):
+        return {}
+    known = {}
+    for entry in manifest.entries:
+        key = entry.path.as_posix()
+        stat_key = stats.get(key)
+        if isinstance(stat_key, list):
+            known[key] = (stat_key, entry)
+    return known
+
+
+def _read_cached_manifest(root: Path, cache_file: Path) -> TemplateManifest | None:
+    """Read a cached manifest, returning None if missing or unusable."""
+    data = _read_cache_file(cache_file)
+    return _manifest_from_cache(root, data) if data else None
+
+
+def _read_cache_file(cache_file: Path) -> dict | None:
+    """Contents of a manifest cache file of this format and version, or None."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT or data.get("version") != __version__:
+        return None
+    return data
+
+
+def _manifest_from_cache(root: Path, data: dict) -> TemplateManifest | None:
+    """Rebuild a cached manifest, returning None if its entries are malformed."""
+    try:
+        return TemplateManifest.from_dict(root, data)
+    except (KeyError, TypeError):
+        return None
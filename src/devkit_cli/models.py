@@ -1,16 +1,33 @@
 """Data models for DevKit CLI."""
 
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
 
 
-class AgentType(str, Enum):
+class AgentType(StrEnum):
     """Supported coding agents."""
     CLAUDE_CODE = "claude-code"
     CURSOR = "cursor"
 
 
+class LinkMode(StrEnum):
+    """How installed template files are materialized in the project."""
+    COPY = "copy"
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    SYMLINK = "symlink"
+    AUTO = "auto"
+
+
+class ConflictKind(StrEnum):
+    """How an existing project file compares with the template it would be replaced by."""
+    IDENTICAL = "identical"          # Same contents and mode
+    MODIFIED = "modified"            # A file with different contents or mode
+    OUTDATED = "outdated"            # An earlier install left untouched (per the ledger); no backup needed
+    TYPE_MISMATCH = "type-mismatch"  # A directory or special file
+
+
 @dataclass
 class Agent:
     """Represents a coding agent configuration."""
@@ -31,3 +48,101 @@ class InstallResult:
     backup_path: Path | None
     conflicts: list[Path]
     message: str
+    files_added: list[Path] = field(default_factory=list)
+    files_updated: list[Path] = field(default_factory=list)
+    files_unchanged: list[Path] = field(default_factory=list)
+    sync: bool = False
+    backup_id: str | None = None
+    existing: dict[Path, ConflictKind] = field(default_factory=dict)  # Template paths already in the project
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """What DevKit wrote to one file of an agent folder (see ``devkit_cli.ledger``)."""
+    size: int
+    mtime_ns: int
+    ino: int
+    mode: int
+    sha256: str    # Contents as written (rendered, for templated files)
+    template: str  # Manifest hash of the template it was installed from
+
+    def matches(self, st) -> bool:
+        """Whether an ``os.stat_result`` shows the file as DevKit left it."""
+        return (
+            st.st_size == self.size
+            and st.st_mtime_ns == self.mtime_ns
+            and st.st_ino == self.ino
+            and st.st_mode & 0o7777 == self.mode
+        )
+
+
+@dataclass
+class DriftReport:
+    """How an agent folder compares with what DevKit installed (``devkit status``)."""
+    project_path: Path
+    agent: Agent
+    files: int                                             # Files in the ledger
+    modified: list[Path] = field(default_factory=list)     # Changed since DevKit wrote them
+    missing: list[Path] = field(default_factory=list)      # Deleted since DevKit wrote them
+    outdated: list[Path] = field(default_factory=list)     # Untouched, but the template has changed
+    hashed: int = 0                                        # Files whose stat changed and were hashed
+
+    @property
+    def clean(self) -> bool:
+        """Whether every installed file is as DevKit wrote it."""
+        return not self.modified and not self.missing
+
+
+@dataclass
+class FleetResult:
+    """Aggregated result of installing templates into many projects."""
+    agent: Agent
+    results: list[InstallResult]
+    elapsed: float
+
+    @property
+    def succeeded(self) -> list[InstallResult]:
+        """Results for projects that installed successfully."""
+        return [r for r in self.results if r.success]
+
+    @property
+    def failed(self) -> list[InstallResult]:
+        """Results for projects that failed to install."""
+        return [r for r in self.results if not r.success]
+
+
+@dataclass
+class WatchPush:
+    """One batch of template changes pushed into watched projects."""
+    changed: list[Path]
+    removed: list[Path]
+    settings_changed: bool
+    fleet: FleetResult | None
+
+
+@dataclass
+class Component:
+    """An agent, command or skill, described by its frontmatter."""
+    kind: str
+    name: str
+    path: str  # POSIX path relative to the pack or plugin root
+    description: str = ""
+    tools: str = ""
+    model: str = ""
+
+
+@dataclass
+class PluginInfo:
+    """A plugin listed in a marketplace."""
+    name: str
+    source: str
+    description: str = ""
+    version: str = ""
+    author: str = ""
+    path: Path | None = None
+    components: list[Component] = field(default_factory=list)
+
+    @property
+    def installable(self) -> bool:
+        """Whether the plugin lives in a local directory DevKit can copy from."""
+        return self.path is not None
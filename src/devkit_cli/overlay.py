@@ -0,0 +1,295 @@
+"""Template overlays: a base pack with org, team and project layers on top.
+
+An ``OverlaySource`` stacks template sources, lowest first. A file in a
+higher layer replaces the file at the same path below it. A deletion marker,
+an empty file named ``PATH.devkit-delete``, removes ``PATH`` from the layers
+below (a file, or a whole directory such as ``skills/NAME``; a marker named
+``.devkit-delete`` removes everything in its directory). The layer may then
+add its own files there. The pack's settings registry comes from the
+highest layer that has one, without hooks whose script was deleted.
+
+Layers are listed in the user's ``overlays.json`` and with ``--overlay``.
+The merged manifest is resolved once per stack of layer contents: it is
+cached in memory and on disk, keyed by a fingerprint of every layer (the
+path, size, mtime and mode of each file in a template directory, the
+embedded manifest of a bundle). Checking the cache reads no template file;
+layer manifests are only built, and their files hashed, on a miss.
+"""
+
+import hashlib
+import json
+import os
+import stat
+from pathlib import Path
+from devkit_cli import __version__
+from devkit_cli.config import DELETE_MARKER_SUFFIX, OVERLAYS_FILE, TEMPLATE_SUBDIRS
+from devkit_cli.manifest import ManifestEntry, TemplateManifest
+from devkit_cli.settings import drop_hooks_for
+from devkit_cli.sources import DirectorySource, TemplateSource, open_template_source
+from devkit_cli.timing import get_tracer
+from devkit_cli.utils import DevKitError, get_cache_dir, get_config_dir, write_text_atomic
+
+
+# Bump when the on-disk cache layout changes
+CACHE_FORMAT = 1
+
+# Resolved stacks by key, shared by every overlay source in the process
+_RESOLVED_CACHE: dict[str, "ResolvedOverlay"] = {}
+
+
+class OverlayError(DevKitError):
+    """Error when overlay layers cannot be read or resolved."""
+    pass
+
+
+class ResolvedOverlay:
+    """The merged view of a layer stack."""
+
+    __slots__ = ("manifest", "layers", "deleted")
+
+    def __init__(self, manifest: TemplateManifest, layers: dict[Path, int], deleted: list[Path]):
+        """
+        Initialize a resolved stack.
+
+        Args:
+            manifest: Merged manifest (markers removed), sorted by path
+            layers: Index of the layer each file is read from, by path
+            deleted: Paths removed by deletion markers and not added back
+        """
+        self.manifest = manifest
+        self.layers = layers
+        self.deleted = deleted
+
+
+class OverlaySource:
+    """Template sources stacked into one pack (see the module docstring)."""
+
+    def __init__(self, layers: list[TemplateSource]):
+        """
+        Initialize an overlay source.
+
+        Args:
+            layers: Template sources, lowest (the base pack) first
+        """
+        if not layers:
+            raise OverlayError("An overlay needs at least one layer")
+        self.layers = layers
+        self.label = " + ".join(layer.label for layer in layers)
+        self._resolved: ResolvedOverlay | None = None
+
+    def get_manifest(self) -> TemplateManifest:
+        """
+        Merged manifest of the stack.
+
+        Raises:
+            TemplateNotFoundError: If a layer doesn't exist
+        """
+        return self._resolve().manifest
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """Read a file from the layer that provides it."""
+        return self.layers[self._resolve().layers[rel_path]].read_bytes(rel_path)
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """On-disk path of a file in the layer that provides it."""
+        return self.layers[self._resolve().layers[rel_path]].file_path(rel_path)
+
+    def read_settings_registry(self) -> dict:
+        """Registry of the highest layer that has one, without hooks for deleted scripts."""
+        for layer in reversed(self.layers):
+            registry = layer.read_settings_registry()
+            if registry:
+                # Commands name scripts as ".../{{ devkit.agent_folder }}/hooks/NAME"
+                return drop_hooks_for(registry, [f"/{path.as_posix()}" for path in self._resolve().deleted])
+        return {}
+
+    def _resolve(self) -> ResolvedOverlay:
+        """Resolve the stack, reusing a cached resolution of the same layer contents."""
+        if self._resolved is None:
+            with get_tracer().span("overlay", layers=len(self.layers)) as span:
+                key = hashlib.sha256(
+                    "\n".join(layer_fingerprint(layer) for layer in self.layers).encode("utf-8")
+                ).hexdigest()
+                resolved = _RESOLVED_CACHE.get(key)
+                cached = "memory"
+                if resolved is None:
+                    cache_file = get_cache_dir() / "overlays" / f"{key[:32]}.json"
+                    resolved = _read_cached(_layer_root(self.layers[0]), cache_file, key)
+                    cached = "disk"
+                    if resolved is None:
+                        resolved = resolve_layers([layer.get_manifest() for layer in self.layers])
+                        cached = "no"
+                        try:
+                            write_text_atomic(cache_file, json.dumps(_to_dict(resolved, key)))
+                        except OSError:
+                            # A read-only cache only costs us the next resolution
+                            pass
+                    _RESOLVED_CACHE[key] = resolved
+                span.set(files=len(resolved.manifest.entries), cached=cached)
+            self._resolved = resolved
+        return self._resolved
+
+
+def resolve_layers(manifests: list[TemplateManifest]) -> ResolvedOverlay:
+    """
+    Merge layer manifests, lowest first.
+
+    Within a layer, deletion markers apply to the layers below before the
+    layer's own files are added, so a layer can replace a directory by
+    deleting it and shipping new contents.
+
+    Args:
+        manifests: Manifest of each layer, lowest first
+
+    Returns:
+        The merged view
+    """
+    entries: dict[str, ManifestEntry] = {}
+    layers: dict[str, int] = {}
+    deleted: set[str] = set()
+
+    for index, manifest in enumerate(manifests):
+        files = []
+        for entry in manifest.entries:
+            key = entry.path.as_posix()
+            if not key.endswith(DELETE_MARKER_SUFFIX):
+                files.append((key, entry))
+                continue
+            # "skills/NAME.devkit-delete" removes skills/NAME; a bare
+            # "hooks/.devkit-delete" removes everything under hooks/
+            target = key[:-len(DELETE_MARKER_SUFFIX)].removesuffix("/")
+            prefix = target + "/"
+            for path in [p for p in entries if p == target or p.startswith(prefix)]:
+                del entries[path]
+                del layers[path]
+                deleted.add(path)
+        for key, entry in files:
+            entries[key] = entry
+            layers[key] = index
+
+    merged = [entries[key] for key in sorted(entries)]
+    return ResolvedOverlay(
+        manifest=TemplateManifest(root=manifests[0].root, version=__version__, entries=merged),
+        layers={entry.path: layers[key] for key, entry in zip(sorted(entries), merged)},
+        deleted=[Path(path) for path in sorted(deleted - entries.keys())],
+    )
+
+
+def layer_fingerprint(layer: TemplateSource) -> str:
+    """
+    Cheap identity of a layer's contents, for the resolution cache key.
+
+    A template directory is listed without reading any file: its resolved
+    root plus the path, size, mtime and mode of every template file, so any
+    edit, addition or removal changes the fingerprint. Other sources (such
+    as bundles, which embed their manifest) use their manifest's digest.
+
+    Raises:
+        TemplateNotFoundError: If the layer doesn't exist
+    """
+    if not isinstance(layer, DirectorySource) or not layer.root.is_dir():
+        # A missing directory raises here, like resolving it would
+        return layer.get_manifest().digest()
+
+    root = layer.root.resolve()
+    h = hashlib.sha256(os.fsencode(root) + b"\0")
+    prefix = len(str(root)) + 1
+    for subdir in TEMPLATE_SUBDIRS:
+        for dirpath, dirnames, filenames in os.walk(root / subdir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    h.update(f"{path[prefix:]}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_mode:o}\n".encode(
+                        "utf-8", errors="surrogateescape"
+                    ))
+    return h.hexdigest()
+
+
+def load_overlay_paths() -> list[Path]:
+    """
+    Layers configured in the user's ``overlays.json``, lowest first.
+
+    The file holds ``{"layers": ["~/org-templates", "~/team.dkpack"]}``.
+
+    Returns:
+        Layer paths, or [] if the file does not exist
+
+    Raises:
+        OverlayError: If the file is malformed
+    """
+    path = get_config_dir() / OVERLAYS_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, json.JSONDecodeError) as e:
+        raise OverlayError(f"Cannot read overlays file {path}: {e}") from e
+
+    layers = data.get("layers") if isinstance(data, dict) else None
+    if not isinstance(layers, list) or not all(isinstance(layer, str) for layer in layers):
+        raise OverlayError(f"Overlays file {path} must hold {{\"layers\": [paths]}}")
+    return [Path(layer).expanduser() for layer in layers]
+
+
+def open_layered_source(base: TemplateSource, overlays: list[Path] | None = None) -> TemplateSource:
+    """
+    Stack the configured overlay layers, then ``overlays``, on a base pack.
+
+    Args:
+        base: Base template pack
+        overlays: Extra layers from the command line, lowest first
+
+    Returns:
+        The base source itself when there are no layers, else an OverlaySource
+
+    Raises:
+        OverlayError: If the overlays file is malformed
+        TemplateNotFoundError: If a layer does not exist
+    """
+    paths = load_overlay_paths() + list(overlays or [])
+    if not paths:
+        return base
+    return OverlaySource([base, *(open_template_source(path) for path in paths)])
+
+
+def _layer_root(layer: TemplateSource) -> Path:
+    """Root recorded in a resolved manifest whose lowest layer is ``layer``."""
+    return layer.root if isinstance(layer, DirectorySource) else layer.get_manifest().root
+
+
+def _to_dict(resolved: ResolvedOverlay, key: str) -> dict:
+    """Serialize a resolved stack for the disk cache."""
+    data = resolved.manifest.to_dict()
+    for item in data["entries"]:
+        item["layer"] = resolved.layers[Path(item["path"])]
+    return {
+        **data,
+        "format": CACHE_FORMAT,
+        "key": key,
+        "deleted": [path.as_posix() for path in resolved.deleted],
+    }
+
+
+def _read_cached(root: Path, cache_file: Path, key: str) -> ResolvedOverlay | None:
+    """Read a cached resolution, returning None if missing or unusable."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("format") != CACHE_FORMAT or data.get("version") != __version__ or data.get("key") != key:
+        return None
+
+    try:
+        manifest = TemplateManifest.from_dict(root, data)
+        layers = {Path(item["path"]): item["layer"] for item in data["entries"]}
+        return ResolvedOverlay(manifest, layers, [Path(path) for path in data["deleted"]])
+    except (KeyError, TypeError):
+        return None
@@ -0,0 +1,257 @@
+"""Plain-text output for DevKit CLI.
+
+Mirrors the display functions in ``ui`` without importing rich or readchar,
+for CI and scripted use (``devkit --plain`` / ``devkit --quiet``). Interactive
+prompts are unavailable in this mode.
+"""
+
+import sys
+import time
+from typing import Sequence
+from devkit_cli.backup import Backup
+from devkit_cli.models import Agent, Component, DriftReport, FleetResult, InstallResult, PluginInfo, WatchPush
+from devkit_cli.timing import Tracer
+from devkit_cli.config import RESULT_FILES_PER_DIR
+from devkit_cli.utils import PromptUnavailableError, group_by_directory
+
+
+# When set, only errors are printed
+_quiet = False
+
+
+def set_quiet(quiet: bool) -> None:
+    """
+    Suppress all output except errors.
+
+    Args:
+        quiet: Whether to suppress non-error output
+    """
+    global _quiet
+    _quiet = quiet
+
+
+def _say(message: str = "") -> None:
+    """Print a line to stdout unless quiet."""
+    if not _quiet:
+        print(message, flush=True)
+
+
+def show_banner() -> None:
+    """Plain mode has no banner."""
+
+
+def show_error(message: str, prefix: str = "Error") -> None:
+    """
+    Print an error message to stderr.
+
+    Args:
+        message: Error message to display
+        prefix: Prefix text (default: "Error")
+    """
+    print(f"{prefix}: {message}", file=sys.stderr, flush=True)
+
+
+def show_warning(message: str) -> None:
+    """
+    Print a warning message.
+
+    Args:
+        message: Warning message to display
+    """
+    _say(f"Warning: {message.strip()}")
+
+
+def show_hint(message: str) -> None:
+    """
+    Print a secondary informational message.
+
+    Args:
+        message: Message to display
+    """
+    _say(message.strip())
+
+
+def select_agent(agents: Sequence[Agent]) -> Agent | None:
+    """Agent selection needs a prompt, which plain mode cannot show."""
+    raise PromptUnavailableError("No agent given; pass --claude or --cursor (prompts are disabled in plain mode)")
+
+
+def prompt_project_path() -> str:
+    """Path entry needs a prompt, which plain mode cannot show."""
+    raise PromptUnavailableError("No project path given; pass a path or --here (prompts are disabled in plain mode)")
+
+
+def show_result(result: InstallResult, verbose: bool = False) -> None:
+    """
+    Print installation result, one line per fact.
+
+    Copied files are summarized per directory (counts plus the first few
+    files) unless ``verbose`` is set, and each directory is written at once
+    rather than line by line.
+
+    Args:
+        result: Installation result to display
+        verbose: List every copied file
+    """
+    if not result.success:
+        show_error(result.message, prefix="Installation failed")
+        return
+
+    _say(result.message)
+    limit = None if verbose else RESULT_FILES_PER_DIR
+    for directory, count, names in group_by_directory(result.files_copied, limit):
+        prefix = f"{result.agent.folder}/{directory}/" if directory else f"{result.agent.folder}/"
+        lines = [f"  {prefix}{name}" for name in names]
+        if count > len(names):
+            lines.append(f"  {prefix}... and {count - len(names)} more (--verbose lists all)")
+        _say("\n".join(lines))
+
+
+def show_next_steps(project_label: str) -> None:
+    """
+    Print follow-up instructions after a successful init.
+
+    Args:
+        project_label: Directory to cd into ("." for current directory)
+    """
+    _say(f"Next: cd {project_label} and use the installed templates in your coding agent")
+
+
+def show_fleet_result(fleet: FleetResult) -> None:
+    """
+    Print one aggregated report for a fleet install.
+
+    Args:
+        fleet: Fleet result to display
+    """
+    succeeded = fleet.succeeded
+    files_copied = sum(len(r.files_copied) for r in succeeded)
+    files_unchanged = sum(len(r.files_unchanged) for r in succeeded)
+
+    _say(f"{len(succeeded)} of {len(fleet.results)} project(s) installed in {fleet.elapsed:.2f}s")
+    _say(f"Copied {files_copied} file(s), {files_unchanged} unchanged")
+    for result in fleet.failed:
+        show_error(result.message, prefix=str(result.project_path))
+
+
+def show_watch_push(push: WatchPush) -> None:
+    """
+    Print one batch of changes pushed by ``devkit watch``.
+
+    Args:
+        push: Pushed changes
+    """
+    stamp = time.strftime("%H:%M:%S")
+    for rel_path in push.changed:
+        _say(f"[{stamp}] changed {rel_path.as_posix()}")
+    for rel_path in push.removed:
+        _say(f"[{stamp}] removed {rel_path.as_posix()} (left in projects)")
+    if push.settings_changed:
+        _say(f"[{stamp}] settings registry merged")
+    if push.fleet:
+        copied = sum(len(r.files_copied) for r in push.fleet.succeeded)
+        _say(f"[{stamp}] updated {copied} file(s) across {len(push.fleet.succeeded)} project(s)")
+        for result in push.fleet.failed:
+            show_error(result.message, prefix=str(result.project_path))
+
+
+def show_plugins(plugins: Sequence[PluginInfo], show_components: bool = False) -> None:
+    """
+    Print marketplace plugins, one per line.
+
+    Args:
+        plugins: Plugins to display
+        show_components: Also print each plugin's components
+    """
+    if not plugins:
+        _say("No plugins found.")
+    for plugin in plugins:
+        version = f" {plugin.version}" if plugin.version else ""
+        _say(f"{plugin.name}{version}\t{len(plugin.components)} component(s)\t{plugin.description}")
+        if show_components:
+            for component in plugin.components:
+                _say(f"  {component.kind}\t{component.name}\t{component.description}")
+
+
+def show_components(components: Sequence[Component]) -> None:
+    """
+    Print template components, one tab-separated line each.
+
+    Args:
+        components: Components to display
+    """
+    if not components:
+        _say("No components found.")
+    for component in components:
+        _say("\t".join([
+            component.kind, component.name, component.description,
+            component.tools, component.model,
+        ]))
+
+
+def show_backups(backups: Sequence[Backup]) -> None:
+    """
+    Print the backups available in a project, newest first.
+
+    Args:
+        backups: Backups sorted newest first
+    """
+    if not backups:
+        _say("No backups found.")
+    for backup in backups:
+        _say(f"{backup.id}\t{len(backup.files)} file(s)\t{backup.agent_folder}/")
+
+
+def show_status(reports: Sequence[DriftReport]) -> None:
+    """
+    Print one line per drifted file, then a summary per agent folder.
+
+    Args:
+        reports: One drift report per agent folder
+    """
+    for report in reports:
+        folder = report.agent.folder
+        for label, paths in (("modified", report.modified), ("missing", report.missing), ("outdated", report.outdated)):
+            for path in paths:
+                _say(f"{label}\t{folder}/{path.as_posix()}")
+        _say(
+            f"{folder}/: {report.files} file(s), {len(report.modified)} modified, "
+            f"{len(report.missing)} missing, {len(report.outdated)} outdated"
+        )
+
+
+def show_restore_result(backup: Backup, restored: Sequence, undo: Backup | None) -> None:
+    """
+    Print the result of restoring a backup.
+
+    Args:
+        backup: Backup that was restored
+        restored: Relative paths that were restored
+        undo: Backup of the files that were replaced, if any
+    """
+    _say(f"Restored {len(restored)} file(s) from backup {backup.id} to {backup.agent_folder}/")
+    if undo:
+        _say(f"Replaced files saved as backup: {undo.id}")
+
+
+def show_timings(tracer: Tracer) -> None:
+    """
+    Print recorded phase timings and counters.
+
+    Args:
+        tracer: Tracer holding the recorded spans
+    """
+    for name, duration_ms, details in tracer.rows():
+        _say(f"{name:<24} {duration_ms:>9.2f} ms  {details}".rstrip())
+    for name, value in tracer.counters.items():
+        _say(f"{name}: {value}")
+
+
+def show_version(version: str) -> None:
+    """
+    Print version information.
+
+    Args:
+        version: Version string
+    """
+    _say(f"devkit {version}")
@@ -0,0 +1,249 @@
+"""Plugin marketplace catalog for DevKit CLI.
+
+A marketplace is a directory with ``.claude-plugin/marketplace.json`` listing
+plugins, each (for local plugins) a directory with its own
+``.claude-plugin/plugin.json`` and ``agents/``, ``commands/`` and ``skills/``.
+
+Parsing every manifest and markdown header on each query does not scale to
+large marketplaces, so the catalog keeps an on-disk index under the user
+cache directory. Each refresh stats the files and only re-parses the ones
+whose size or mtime changed since the index was written.
+"""
+
+import hashlib
+import json
+from dataclasses import replace
+from pathlib import Path
+from devkit_cli import __version__
+from devkit_cli.components import components_from_index, index_directory
+from devkit_cli.models import PluginInfo
+from devkit_cli.utils import DevKitError, get_cache_dir, write_text_atomic
+
+
+# Marketplace and plugin manifests, relative to their roots
+MARKETPLACE_FILE = Path(".claude-plugin") / "marketplace.json"
+PLUGIN_FILE = Path(".claude-plugin") / "plugin.json"
+
+# Bump when the on-disk index layout changes
+INDEX_FORMAT = 1
+
+
+class MarketplaceNotFoundError(DevKitError):
+    """Error when no marketplace can be found."""
+    pass
+
+
+class PluginNotFoundError(DevKitError):
+    """Error when a marketplace has no plugin by the requested name."""
+    pass
+
+
+def find_marketplace(start: Path) -> Path:
+    """
+    Find the marketplace root at or above a directory.
+
+    Args:
+        start: Directory to search from (or a marketplace root itself)
+
+    Returns:
+        Directory containing ``.claude-plugin/marketplace.json``
+
+    Raises:
+        MarketplaceNotFoundError: If no marketplace is found
+    """
+    start = start.resolve()
+    for directory in [start, *start.parents]:
+        if (directory / MARKETPLACE_FILE).is_file():
+            return directory
+    raise MarketplaceNotFoundError(f"No {MARKETPLACE_FILE.as_posix()} found at or above {start}")
+
+
+class PluginCatalog:
+    """Indexed view of the plugins in one marketplace."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize a catalog.
+
+        Args:
+            root: Marketplace root (see ``find_marketplace``)
+        """
+        self.root = root
+        self.index_file = _index_file(root)
+        self.files_parsed = 0
+        self._plugins: list[PluginInfo] | None = None
+
+    def plugins(self, refresh: bool = False) -> list[PluginInfo]:
+        """
+        List every plugin, refreshing the on-disk index as needed.
+
+        Args:
+            refresh: Ignore the index and re-parse everything
+
+        Returns:
+            Plugins in marketplace order
+
+        Raises:
+            DevKitError: If marketplace.json is unreadable
+        """
+        if self._plugins is None or refresh:
+            self._plugins = self._load(refresh)
+        return self._plugins
+
+    def get(self, name: str) -> PluginInfo:
+        """
+        Look up one plugin by name.
+
+        Raises:
+            PluginNotFoundError: If there is no such plugin
+        """
+        for plugin in self.plugins():
+            if plugin.name == name:
+                return plugin
+        raise PluginNotFoundError(f"No plugin named '{name}' in {self.root / MARKETPLACE_FILE}")
+
+    def search(self, query: str) -> list[PluginInfo]:
+        """
+        Find plugins and components matching a query.
+
+        Matching is a case-insensitive substring test on names and
+        descriptions. A plugin that matches keeps all its components;
+        otherwise only its matching components are kept.
+
+        Returns:
+            Matching plugins, in marketplace order
+        """
+        needle = query.lower()
+
+        def hit(*fields: str) -> bool:
+            return any(needle in field.lower() for field in fields)
+
+        results = []
+        for plugin in self.plugins():
+            if hit(plugin.name, plugin.description):
+                results.append(plugin)
+                continue
+            components = [c for c in plugin.components if hit(c.name, c.description)]
+            if components:
+                results.append(replace(plugin, components=components))
+        return results
+
+    def _load(self, refresh: bool) -> list[PluginInfo]:
+        """Refresh the index incrementally and build PluginInfo objects."""
+        self.files_parsed = 0
+        old = {} if refresh else _read_index(self.index_file)
+        index = {"format": INDEX_FORMAT, "version": __version__}
+
+        marketplace_path = self.root / MARKETPLACE_FILE
+        entries_stat = _stat_key(marketplace_path)
+        if old.get("marketplace", {}).get("stat") == entries_stat:
+            entries = old["marketplace"]["plugins"]
+        else:
+            entries = _read_marketplace(marketplace_path)
+            self.files_parsed += 1
+        index["marketplace"] = {"stat": entries_stat, "plugins": entries}
+
+        old_plugins = old.get("plugins", {})
+        index["plugins"] = {}
+        plugins = []
+        for entry in entries:
+            name = entry.get("name", "")
+            plugin_dir = self._plugin_dir(entry.get("source"))
+            cached = old_plugins.get(name, {}) if plugin_dir else {}
+            indexed = self._index_plugin(plugin_dir, cached) if plugin_dir else {}
+            index["plugins"][name] = indexed
+            plugins.append(_plugin_info(entry, plugin_dir, indexed))
+
+        if index != old:
+            try:
+                write_text_atomic(self.index_file, json.dumps(index))
+            except OSError:
+                # A read-only cache only costs us the next re-parse
+                pass
+        return plugins
+
+    def _plugin_dir(self, source) -> Path | None:
+        """Resolve a local plugin source inside the marketplace, or None."""
+        if not isinstance(source, str) or "://" in source:
+            return None
+        path = (self.root / source).resolve()
+        if not path.is_relative_to(self.root.resolve()) or not path.is_dir():
+            return None
+        return path
+
+    def _index_plugin(self, plugin_dir: Path, cached: dict) -> dict:
+        """Index one plugin, re-parsing only files whose stat changed."""
+        manifest_path = plugin_dir / PLUGIN_FILE
+        manifest_stat = _stat_key(manifest_path)
+        if cached.get("manifest_stat") == manifest_stat:
+            manifest = cached.get("manifest", {})
+        else:
+            manifest = _read_json(manifest_path) if manifest_stat else {}
+            self.files_parsed += 1
+
+        files, parsed = index_directory(plugin_dir, cached.get("files", {}))
+        self.files_parsed += parsed
+
+        return {"manifest_stat": manifest_stat, "manifest": manifest, "files": files}
+
+
+def _plugin_info(entry: dict, plugin_dir: Path | None, indexed: dict) -> PluginInfo:
+    """Combine a marketplace entry with the plugin's indexed data."""
+    manifest = indexed.get("manifest", {})
+    author = manifest.get("author") or entry.get("author") or {}
+    components = components_from_index(indexed.get("files", {}))
+    source = entry.get("source")
+    return PluginInfo(
+        name=entry.get("name", ""),
+        source=source if isinstance(source, str) else json.dumps(source),
+        description=entry.get("description") or manifest.get("description", ""),
+        version=manifest.get("version") or entry.get("version", ""),
+        author=author.get("name", "") if isinstance(author, dict) else str(author),
+        path=plugin_dir,
+        components=components,
+    )
+
+
+def _stat_key(path: Path) -> list[int] | None:
+    """(mtime_ns, size) of a file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_json(path: Path) -> dict:
+    """Read a JSON object, raising DevKitError if it is malformed."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise DevKitError(f"Cannot read {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise DevKitError(f"Cannot read {path}: expected a JSON object")
+    return data
+
+
+def _read_marketplace(path: Path) -> list[dict]:
+    """Plugin entries listed in marketplace.json."""
+    plugins = _read_json(path).get("plugins", [])
+    return [entry for entry in plugins if isinstance(entry, dict)]
+
+
+def _index_file(root: Path) -> Path:
+    """Index location for a marketplace root."""
+    digest = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / "plugins" / f"{digest}.json"
+
+
+def _read_index(index_file: Path) -> dict:
+    """Read a previously written index, or {} if missing or stale."""
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("format") != INDEX_FORMAT or data.get("version") != __version__:
+        return {}
+    return data
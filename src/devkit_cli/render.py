@@ -0,0 +1,183 @@
+"""Template rendering: ``{{ devkit.name }}`` placeholders in template files.
+
+Only placeholders in the ``devkit.`` namespace are touched, so other
+``{{ ... }}`` syntax in templates (GitHub Actions, Jinja, Handlebars) is
+copied through as is. Files without placeholders are flagged when the
+manifest is built and are installed by the plain copy path; the rest are
+compiled once per content hash into literal and variable segments, so a
+fleet install renders each template for every project without parsing it
+again.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Callable
+from devkit_cli.config import DEVKIT_DIR, VARIABLES_FILE
+from devkit_cli.models import Agent
+from devkit_cli.utils import DevKitError, get_config_dir
+
+
+# A placeholder: {{ devkit.name }}, whitespace optional
+PLACEHOLDER = re.compile(rb"\{\{\s*devkit\.([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Compiled templates by content hash, shared by every manager in the process
+_COMPILED_CACHE: dict[str, "CompiledTemplate"] = {}
+
+
+class RenderError(DevKitError):
+    """Error when a template cannot be rendered."""
+    pass
+
+
+class CompiledTemplate:
+    """A template split into literal byte chunks and variable names."""
+
+    __slots__ = ("literals", "names")
+
+    def __init__(self, data: bytes):
+        """
+        Compile template contents.
+
+        Args:
+            data: Raw template file contents
+        """
+        parts = PLACEHOLDER.split(data)
+        # re.split alternates literal, name, literal, ..., literal
+        self.literals: list[bytes] = parts[0::2]
+        self.names: list[str] = [name.decode("ascii") for name in parts[1::2]]
+
+    def render(self, variables: dict[str, str]) -> bytes:
+        """
+        Substitute variables into the template.
+
+        Raises:
+            KeyError: If a placeholder names an undefined variable
+        """
+        out = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            out.append(variables[name].encode("utf-8"))
+            out.append(literal)
+        return b"".join(out)
+
+
+def has_placeholders(data: bytes) -> bool:
+    """Whether template contents contain any ``{{ devkit.* }}`` placeholder."""
+    return b"devkit." in data and PLACEHOLDER.search(data) is not None
+
+
+def compile_template(sha256: str, read: Callable[[], bytes]) -> CompiledTemplate:
+    """
+    Compile a template, reusing an earlier compile of the same content.
+
+    Args:
+        sha256: Content hash of the template (from the manifest)
+        read: Returns the template contents; only called on a cache miss
+
+    Returns:
+        The compiled template
+    """
+    compiled = _COMPILED_CACHE.get(sha256)
+    if compiled is None:
+        compiled = _COMPILED_CACHE[sha256] = CompiledTemplate(read())
+    return compiled
+
+
+def render_template(compiled: CompiledTemplate, variables: dict[str, str], rel_path: Path) -> bytes:
+    """
+    Render a compiled template, naming the file if a variable is missing.
+
+    Raises:
+        RenderError: If the template uses an undefined variable
+    """
+    try:
+        return compiled.render(variables)
+    except KeyError as e:
+        raise RenderError(
+            f"Template {rel_path.as_posix()} uses undefined variable 'devkit.{e.args[0]}' "
+            f"(define it in {get_config_dir() / VARIABLES_FILE}, "
+            f"{DEVKIT_DIR / VARIABLES_FILE} or with --var)"
+        ) from None
+
+
+def render_value(value, variables: dict[str, str]):
+    """
+    Render placeholders in every string of a JSON-like value.
+
+    Used for the settings registry, whose hook commands may name the agent
+    folder.
+
+    Raises:
+        RenderError: If a string uses an undefined variable
+    """
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+        if not has_placeholders(data):
+            return value
+        try:
+            compiled = compile_template(hashlib.sha256(data).hexdigest(), lambda: data)
+            return compiled.render(variables).decode("utf-8")
+        except KeyError as e:
+            raise RenderError(f"Settings registry uses undefined variable 'devkit.{e.args[0]}'") from None
+    if isinstance(value, dict):
+        return {key: render_value(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render_value(item, variables) for item in value]
+    return value
+
+
+def load_variables_file(path: Path) -> dict[str, str]:
+    """
+    Read a variables file: a JSON object of names to scalar values.
+
+    Returns:
+        Variables as strings, or {} if the file does not exist
+
+    Raises:
+        RenderError: If the file is malformed
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        raise RenderError(f"Cannot read variables file {path}: {e}") from e
+
+    if not isinstance(data, dict):
+        raise RenderError(f"Variables file {path} must hold a JSON object")
+    variables = {}
+    for name, value in data.items():
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif not isinstance(value, (str, int, float)):
+            raise RenderError(f"Variable '{name}' in {path} must be a string or number")
+        variables[name] = str(value)
+    return variables
+
+
+def parse_variable_options(options: list[str] | None) -> dict[str, str]:
+    """
+    Parse ``--var NAME=VALUE`` command-line options.
+
+    Raises:
+        RenderError: If an option has no ``=``
+    """
+    variables = {}
+    for option in options or []:
+        name, sep, value = option.partition("=")
+        if not sep or not name.strip():
+            raise RenderError(f"Invalid --var '{option}' (expected NAME=VALUE)")
+        variables[name.strip()] = value
+    return variables
+
+
+def builtin_variables(agent: Agent, project_path: Path) -> dict[str, str]:
+    """Variables DevKit defines for every project."""
+    return {
+        "project_name": project_path.name,
+        "project_dir": str(project_path),
+        "agent_folder": agent.folder,
+        "agent_name": str(agent.name),
+    }
@@ -0,0 +1,150 @@
+"""Settings merge engine for DevKit CLI."""
+
+import copy
+import json
+from pathlib import Path
+from devkit_cli.utils import write_text_atomic
+
+
+def merge_settings(existing: dict, registry: dict) -> dict:
+    """
+    Merge registry settings into existing settings without clobbering the user.
+
+    - ``hooks``: for each event, registry hooks are added unless a hook with
+      the same matcher and command already exists (set lookup, not a scan).
+    - Other dicts are merged recursively; lists gain missing items; scalars
+      already set by the user are kept.
+
+    Args:
+        existing: Current settings (not modified)
+        registry: Settings to merge in
+
+    Returns:
+        New merged settings dict
+    """
+    merged = copy.deepcopy(existing)
+    for key, value in registry.items():
+        if key == "hooks" and isinstance(value, dict):
+            hooks = merged.setdefault("hooks", {})
+            if isinstance(hooks, dict):
+                _merge_hooks(hooks, value)
+        elif key not in merged:
+            merged[key] = copy.deepcopy(value)
+        else:
+            merged[key] = _merge_value(merged[key], value)
+    return merged
+
+
+def apply_settings(settings_file: Path, registry: dict) -> bool:
+    """
+    Merge registry settings into a settings file, writing only on change.
+
+    The file is rewritten atomically, and only when the merged result differs
+    from what is already on disk, so repeated runs perform no writes.
+
+    Args:
+        settings_file: Settings file to update (e.g., .claude/settings.local.json)
+        registry: Settings to merge in
+
+    Returns:
+        True if the file was written
+    """
+    existing = None
+    try:
+        with open(settings_file, "r", encoding="utf-8") as f:
+            existing = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, IOError):
+        # Missing, corrupted or empty files start fresh
+        pass
+
+    if not isinstance(existing, dict):
+        existing = None
+
+    merged = merge_settings(existing or {}, registry)
+    if existing is not None and merged == existing:
+        return False
+
+    write_text_atomic(settings_file, json.dumps(merged, indent=2, ensure_ascii=False) + "\n")
+    return True
+
+
+def drop_hooks_for(registry: dict, missing_paths: list[str]) -> dict:
+    """
+    Remove registry hooks whose command runs a file that is not installed.
+
+    Args:
+        registry: Settings registry (not modified)
+        missing_paths: Project-relative paths left out of the install
+            (e.g., ".claude/hooks/welcome-banner.sh")
+
+    Returns:
+        Registry without those hooks; events and groups left empty are dropped
+    """
+    hooks = registry.get("hooks")
+    if not missing_paths or not isinstance(hooks, dict):
+        return registry
+
+    def is_missing(hook: dict) -> bool:
+        command = hook.get("command", "")
+        return any(path in command for path in missing_paths)
+
+    kept_hooks = {}
+    for event, groups in hooks.items():
+        kept_groups = []
+        for group in groups:
+            kept = [hook for hook in group.get("hooks", []) if not is_missing(hook)]
+            if kept:
+                kept_groups.append({**group, "hooks": kept})
+        if kept_groups:
+            kept_hooks[event] = kept_groups
+
+    pruned = {key: value for key, value in registry.items() if key != "hooks"}
+    if kept_hooks:
+        pruned["hooks"] = kept_hooks
+    return pruned
+
+
+def _merge_hooks(hooks: dict, registry_hooks: dict) -> None:
+    """Add registry hook groups to each event, deduplicated by (matcher, command)."""
+    for event, groups in registry_hooks.items():
+        existing_groups = hooks.setdefault(event, [])
+        if not isinstance(existing_groups, list):
+            continue
+
+        index = {
+            (group.get("matcher"), hook.get("command"))
+            for group in existing_groups if isinstance(group, dict)
+            for hook in group.get("hooks", []) if isinstance(hook, dict)
+        }
+
+        for group in groups:
+            matcher = group.get("matcher")
+            missing = [
+                hook for hook in group.get("hooks", [])
+                if (matcher, hook.get("command")) not in index
+            ]
+            if not missing:
+                continue
+            new_group = copy.deepcopy(group)
+            new_group["hooks"] = copy.deepcopy(missing)
+            existing_groups.append(new_group)
+            index.update((matcher, hook.get("command")) for hook in missing)
+
+
+def _merge_value(current, incoming):
+    """Merge one non-hook settings value, preferring what the user already has."""
+    if isinstance(current, dict) and isinstance(incoming, dict):
+        for key, value in incoming.items():
+            current[key] = _merge_value(current[key], value) if key in current else copy.deepcopy(value)
+        return current
+
+    if isinstance(current, list) and isinstance(incoming, list):
+        seen = {json.dumps(item, sort_keys=True) for item in current}
+        for item in incoming:
+            key = json.dumps(item, sort_keys=True)
+            if key not in seen:
+                current.append(copy.deepcopy(item))
+                seen.add(key)
+        return current
+
+    return current
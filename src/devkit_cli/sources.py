@@ -0,0 +1,132 @@
+"""Template sources: where TemplateManager reads template files from."""
+
+import json
+from pathlib import Path
+from typing import Protocol
+from devkit_cli.config import SETTINGS_REGISTRY
+from devkit_cli.manifest import TemplateManifest, load_manifest
+from devkit_cli.utils import TemplateNotFoundError
+
+
+class TemplateSource(Protocol):
+    """Read access to a template pack (a directory or a packed bundle)."""
+
+    label: str
+
+    def get_manifest(self) -> TemplateManifest:
+        """Manifest of every template file in the pack."""
+        ...
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """Contents of one template file."""
+        ...
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """On-disk path of a template file, or None if it has none (bundles)."""
+        ...
+
+    def read_settings_registry(self) -> dict:
+        """The pack's settings registry, or an empty dict."""
+        ...
+
+
+class DirectorySource:
+    """Templates read from loose files in a directory tree."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize a directory source.
+
+        Args:
+            root: Template root directory (e.g., templates/claude-code)
+        """
+        self.root = root
+        self.label = str(root)
+
+    def get_manifest(self) -> TemplateManifest:
+        """
+        Load the manifest for the directory.
+
+        Raises:
+            TemplateNotFoundError: If the directory doesn't exist
+        """
+        if not self.root.exists():
+            raise TemplateNotFoundError(f"Template directory not found: {self.root}")
+        return load_manifest(self.root)
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """Read one template file."""
+        return (self.root / rel_path).read_bytes()
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """Template files live on disk, so they can be copied or linked directly."""
+        return self.root / rel_path
+
+    def read_settings_registry(self) -> dict:
+        """Load devkit-settings.json from the pack root."""
+        try:
+            with open(self.root / SETTINGS_REGISTRY, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+
+class CachedSource:
+    """
+    A template source whose files are read at most once.
+
+    For one pack installed for several agents in a run: every manager reads
+    the pack through the same CachedSource, so each template file is read
+    from disk (or decompressed from a bundle) only once.
+    """
+
+    def __init__(self, base: TemplateSource):
+        """
+        Initialize a cached source.
+
+        Args:
+            base: Template source to read from
+        """
+        self.base = base
+        self.label = base.label
+        self._contents: dict[Path, bytes] = {}
+
+    def get_manifest(self) -> TemplateManifest:
+        """Manifest of the base source."""
+        return self.base.get_manifest()
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """Read one template file, from memory after the first read."""
+        data = self._contents.get(rel_path)
+        if data is None:
+            data = self._contents[rel_path] = self.base.read_bytes(rel_path)
+        return data
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """On-disk path of a template file in the base source."""
+        return self.base.file_path(rel_path)
+
+    def read_settings_registry(self) -> dict:
+        """The base source's settings registry."""
+        return self.base.read_settings_registry()
+
+
+def open_template_source(path: Path) -> TemplateSource:
+    """
+    Open a template pack from a directory or a packed bundle file.
+
+    Args:
+        path: Template directory or bundle created by ``devkit pack``
+
+    Returns:
+        A template source
+
+    Raises:
+        TemplateNotFoundError: If the path does not exist
+    """
+    if path.is_dir():
+        return DirectorySource(path)
+    if path.is_file():
+        from devkit_cli.bundle import TemplateBundle
+        return TemplateBundle(path)
+    raise TemplateNotFoundError(f"Template source not found: {path}")
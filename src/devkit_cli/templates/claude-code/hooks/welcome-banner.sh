@@ -20,6 +20,8 @@ cat << 'EOF'
 ║                                                                            ║
 ╚════════════════════════════════════════════════════════════════════════════╝
 
+Project: {{ devkit.project_name }}
+
 DevKit provides pre-configured agents and workflows for AI-powered development:
 
 Happy coding! 🚀
@@ -0,0 +1,215 @@
+"""Phase timing and profiling for DevKit CLI.
+
+Code marks phases with ``get_tracer().span(name)``. By default the tracer is
+``NULL_TRACER``, whose spans are a shared no-op context, so instrumentation
+costs one method call when timing is off. ``instrument`` installs a real
+``Tracer`` for the duration of a command and writes the Chrome trace and
+cProfile dump when it ends.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+from devkit_cli.utils import write_text_atomic
+
+
+@dataclass
+class Span:
+    """One timed phase."""
+    name: str
+    start: float
+    end: float | None = None
+    depth: int = 0
+    thread_id: int = 0
+    attrs: dict = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        """Elapsed time in milliseconds (0 while the span is open)."""
+        return 0.0 if self.end is None else (self.end - self.start) * 1000
+
+    def set(self, **attrs) -> None:
+        """Attach facts to the span (file counts, bytes, ...)."""
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    """Span stand-in that records nothing."""
+
+    def set(self, **attrs) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Tracer used when timing is disabled; every call is a no-op."""
+
+    enabled = False
+
+    def span(self, name: str, **attrs) -> _NullSpan:
+        return _NULL_SPAN
+
+    def add_span(self, name: str, start: float, end: float, **attrs) -> None:
+        pass
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+class Tracer:
+    """Records nested spans and counters, from any thread."""
+
+    enabled = True
+
+    def __init__(self, origin: float | None = None):
+        """
+        Initialize a tracer.
+
+        Args:
+            origin: ``time.perf_counter()`` value treated as time zero
+                (defaults to now); pass the process start to include startup
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.spans: list[Span] = []
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Span]:
+        """
+        Time a block as a span nested under the thread's current span.
+
+        Args:
+            name: Phase name (e.g., "install.stage")
+            **attrs: Initial facts to attach
+
+        Yields:
+            The open span, so the block can attach more facts
+        """
+        depth = getattr(self._local, "depth", 0)
+        span = Span(name, time.perf_counter(), depth=depth, thread_id=threading.get_ident(), attrs=attrs)
+        with self._lock:
+            self.spans.append(span)
+        self._local.depth = depth + 1
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            self._local.depth = depth
+
+    def add_span(self, name: str, start: float, end: float, **attrs) -> None:
+        """Record a span measured elsewhere (e.g., interpreter startup)."""
+        span = Span(name, start, end, thread_id=threading.get_ident(), attrs=attrs)
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a named counter (e.g., bytes copied)."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def rows(self) -> list[tuple[str, float, str]]:
+        """
+        Summarize spans for a table, in start order.
+
+        Returns:
+            (name indented by nesting depth, duration in ms, "key=value" details)
+        """
+        return [
+            (
+                "  " * span.depth + span.name,
+                span.duration_ms,
+                " ".join(f"{key}={value}" for key, value in span.attrs.items() if value is not None),
+            )
+            for span in sorted(self.spans, key=lambda s: s.start)
+        ]
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Export spans in Chrome trace event format.
+
+        The result loads in chrome://tracing and https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": "devkit",
+                "ph": "X",
+                "ts": round((span.start - self.origin) * 1_000_000, 1),
+                "dur": round(span.duration_ms * 1000, 1),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            }
+            for span in sorted(self.spans, key=lambda s: s.start)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": dict(self.counters)}
+
+
+# Active tracer; replaced by ``instrument`` for the duration of a command
+_tracer: Tracer | NullTracer = NULL_TRACER
+
+
+def get_tracer() -> Tracer | NullTracer:
+    """Return the active tracer (``NULL_TRACER`` when timing is off)."""
+    return _tracer
+
+
+@contextmanager
+def instrument(
+    enabled: bool,
+    trace_file: Path | None = None,
+    profile_file: Path | None = None,
+    origin: float | None = None,
+) -> Iterator[Tracer | NullTracer]:
+    """
+    Activate timing and profiling for a block.
+
+    Outputs are written when the block exits, even if it raised or exited.
+
+    Args:
+        enabled: Collect spans (implied by trace_file)
+        trace_file: Write a Chrome trace JSON file here
+        profile_file: Write a cProfile dump here (view with ``python -m pstats``)
+        origin: Time zero for the trace (see ``Tracer``)
+
+    Yields:
+        The active tracer
+    """
+    global _tracer
+    tracer = Tracer(origin) if enabled or trace_file else NULL_TRACER
+    profiler = None
+    if profile_file:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    _tracer = tracer
+    if profiler:
+        profiler.enable()
+    try:
+        yield tracer
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(str(profile_file))
+        _tracer = NULL_TRACER
+        if trace_file and tracer.enabled:
+            write_text_atomic(trace_file, json.dumps(tracer.to_chrome_trace()))
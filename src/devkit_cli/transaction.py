@@ -0,0 +1,307 @@
+"""Transactional installs: stage files, then commit with atomic renames."""
+
+import fcntl
+import json
+import os
+import shutil
+import stat
+import uuid
+from pathlib import Path
+from devkit_cli.config import INSTALL_JOURNAL, INSTALL_LOCK, STAGING_DIR
+from devkit_cli.destination import DestinationScan
+from devkit_cli.utils import DevKitError, ensure_devkit_dir, ensure_directory, write_text_atomic
+
+
+# Journal states
+STATE_STAGING = "staging"
+STATE_COMMITTING = "committing"
+
+
+class InstallLockedError(DevKitError):
+    """Error when another install is running in the same project."""
+    pass
+
+
+class InstallLock:
+    """
+    Exclusive lock on a project's install state for one install.
+
+    Every install in a project shares ``.devkit/staging`` and the install
+    journal, and starts by recovering whatever journal it finds. Holding
+    this lock from planning to commit keeps a second install (another
+    ``init``, ``watch`` or the daemon) from overwriting the journal or
+    rolling back files still being staged. The lock is an ``flock`` on
+    ``.devkit/install.lock``, released by the kernel if the process dies.
+
+    Use as a context manager.
+    """
+
+    def __init__(self, project_path: Path):
+        """
+        Initialize the lock (nothing is locked until ``acquire``).
+
+        Args:
+            project_path: Project directory
+        """
+        self.project_path = project_path
+        self.path = project_path / INSTALL_LOCK
+        self._fd: int | None = None
+
+    def __enter__(self) -> "InstallLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        """
+        Take the lock without waiting.
+
+        Raises:
+            InstallLockedError: If another install holds it
+        """
+        ensure_devkit_dir(self.project_path)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise InstallLockedError(
+                f"Another DevKit install is running in {self.project_path}; try again when it finishes"
+            ) from None
+        self._fd = fd
+
+    def release(self) -> None:
+        """Release the lock, if held."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class InstallTransaction:
+    """
+    Stages an install next to the project, then swaps files in atomically.
+
+    Files are written to a staging directory under ``<project>/.devkit/``,
+    which is on the same filesystem as the agent folder, so ``commit`` only
+    has to ``os.replace`` each staged file into place. A journal records the
+    transaction; if a run dies while staging, the next run discards the
+    staged files, and if it dies while committing, the next run finishes
+    the commit (see ``recover_install``).
+
+    Use as a context manager: leaving the block without committing (for
+    example on an error or Ctrl+C) rolls the transaction back.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        agent_folder: Path,
+        rel_paths: list[Path],
+        scan: DestinationScan | None = None,
+    ):
+        """
+        Initialize an install transaction.
+
+        Args:
+            project_path: Target project directory
+            agent_folder: Agent folder files are committed into
+            rel_paths: Files the transaction will install, relative to agent_folder
+            scan: Destination scan of agent_folder; when given, commit trusts
+                it instead of checking each destination again
+        """
+        self.project_path = project_path
+        self.agent_folder = agent_folder
+        self.rel_paths = rel_paths
+        self.scan = scan
+        self.staging_dir = project_path / STAGING_DIR / uuid.uuid4().hex[:12]
+        self.journal_path = project_path / INSTALL_JOURNAL
+        self.committed = False
+
+    def __enter__(self) -> "InstallTransaction":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self.committed:
+            self.rollback()
+
+    def begin(self) -> None:
+        """Create the staging directory tree and journal the transaction."""
+        if not self.rel_paths:
+            # Nothing to install: touch nothing on disk
+            return
+        ensure_devkit_dir(self.project_path)
+        ensure_directory(self.staging_dir)
+        for directory in sorted({self.stage_path(p).parent for p in self.rel_paths}):
+            ensure_directory(directory)
+        self._write_journal(STATE_STAGING)
+
+    def stage_path(self, rel_path: Path) -> Path:
+        """
+        Where a file is written before commit.
+
+        Args:
+            rel_path: Path relative to the agent folder
+
+        Returns:
+            Path inside the staging directory
+        """
+        return self.staging_dir / rel_path
+
+    def commit(self) -> None:
+        """
+        Move every staged file into the agent folder.
+
+        Raises:
+            DevKitError: If a destination is a directory (nothing is committed)
+        """
+        if not self.rel_paths:
+            self.committed = True
+            return
+
+        for rel_path in self.rel_paths:
+            dest = self.agent_folder / rel_path
+            if self.scan is not None:
+                is_dir = self.scan.is_dir(rel_path)
+            else:
+                try:
+                    is_dir = stat.S_ISDIR(dest.lstat().st_mode)
+                except FileNotFoundError:
+                    is_dir = False
+            if is_dir:
+                raise DevKitError(f"Cannot install {rel_path}: {dest} is a directory")
+
+        existing_dirs = self.scan.existing_dirs() if self.scan is not None else set()
+        self._write_journal(STATE_COMMITTING)
+        _apply_staged(self.staging_dir, self.agent_folder, self.rel_paths, existing_dirs)
+        self._finish()
+        self.committed = True
+
+    def rollback(self) -> None:
+        """Discard staged files and the journal."""
+        self._finish()
+
+    def _write_journal(self, state: str) -> None:
+        """Record the transaction state."""
+        journal = {
+            "state": state,
+            "staging_dir": str(self.staging_dir.relative_to(self.project_path)),
+            "agent_folder": self.agent_folder.name,
+            "files": [p.as_posix() for p in self.rel_paths],
+        }
+        write_text_atomic(self.journal_path, json.dumps(journal))
+
+    def _finish(self) -> None:
+        """Remove the staging directory, then the journal."""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.journal_path.unlink(missing_ok=True)
+
+
+def recover_install(project_path: Path) -> str | None:
+    """
+    Finish or undo an install that was interrupted in a previous run.
+
+    Args:
+        project_path: Target project directory
+
+    A journal is only acted on if every path in it stays inside the
+    project: a journal shipped with a cloned repository must not make
+    DevKit delete or replace files elsewhere. A malformed journal, or one
+    pointing outside ``.devkit/staging`` and the agent folder, is discarded
+    like an unreadable one.
+
+    Returns:
+        "rolled-forward", "rolled-back", or None if there was nothing to recover
+    """
+    journal_path = project_path / INSTALL_JOURNAL
+    try:
+        with open(journal_path, "r", encoding="utf-8") as f:
+            journal = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError):
+        journal = None
+
+    paths = _journal_paths(project_path, journal)
+    if paths is None:
+        # Nothing can be rolled forward safely
+        _discard_staging(project_path)
+        journal_path.unlink(missing_ok=True)
+        return "rolled-back"
+
+    staging_dir, agent_folder, rel_paths = paths
+    action = "rolled-back"
+
+    if journal["state"] == STATE_COMMITTING:
+        _apply_staged(staging_dir, agent_folder, rel_paths)
+        action = "rolled-forward"
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    journal_path.unlink(missing_ok=True)
+    return action
+
+
+def _journal_paths(project_path: Path, journal) -> tuple[Path, Path, list[Path]] | None:
+    """
+    Staging directory, agent folder and files recorded in a journal.
+
+    Returns:
+        The paths, or None if the journal is malformed or any path in it
+        leads outside the project's staging area or agent folder
+    """
+    if not isinstance(journal, dict) or not isinstance(journal.get("state"), str):
+        return None
+    staging, agent, files = journal.get("staging_dir"), journal.get("agent_folder"), journal.get("files")
+    if not isinstance(staging, str) or not isinstance(agent, str) or not isinstance(files, list):
+        return None
+
+    # Resolved, the staging directory is one level below the project's own
+    # .devkit/staging (no "..", absolute path or symlink leading elsewhere)
+    staging_dir = (project_path / staging).resolve()
+    if staging_dir.parent != project_path.resolve() / STAGING_DIR:
+        return None
+
+    # The agent folder is a single name inside the project (".claude")
+    if not agent or agent in (".", "..") or Path(agent).name != agent:
+        return None
+
+    rel_paths = []
+    for file in files:
+        if not isinstance(file, str) or not file:
+            return None
+        rel_path = Path(file)
+        if rel_path.is_absolute() or ".." in rel_path.parts:
+            return None
+        rel_paths.append(rel_path)
+    return staging_dir, project_path / agent, rel_paths
+
+
+def _discard_staging(project_path: Path) -> None:
+    """Remove the whole staging area, unless it leads out of the project."""
+    staging_root = project_path / STAGING_DIR
+    if staging_root.resolve() == project_path.resolve() / STAGING_DIR:
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+
+def _apply_staged(
+    staging_dir: Path,
+    agent_folder: Path,
+    rel_paths: list[Path],
+    existing_dirs: set[Path] = frozenset(),
+) -> None:
+    """
+    Rename staged files into place; idempotent so it can be replayed.
+
+    Files already moved by an earlier, interrupted attempt are skipped.
+    Parent directories in ``existing_dirs`` (known from a destination scan)
+    are not created again.
+    """
+    for directory in sorted({(agent_folder / p).parent for p in rel_paths} - existing_dirs):
+        ensure_directory(directory)
+
+    for rel_path in rel_paths:
+        staged = staging_dir / rel_path
+        if os.path.lexists(staged):
+            os.replace(staged, agent_folder / rel_path)
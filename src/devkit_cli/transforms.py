@@ -0,0 +1,310 @@
+"""Agent transforms: installing the template pack for agents other than Claude Code.
+
+Template packs are written in Claude Code's layout (agents/, commands/,
+hooks/, skills/ and a settings registry). An ``AgentTransform`` says where
+each pack file belongs in another agent's folder and converts the files
+whose format differs there. ``TransformedSource`` presents a pack through a
+transform as an ordinary template source, so TemplateManager installs,
+syncs and backs up the converted files like any others.
+
+Conversions are cached by the content hash of the source file: in memory
+for the process, and in one index file per transform under the user cache
+directory. A template is only converted again once its contents change.
+"""
+
+import hashlib
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+from devkit_cli import __version__
+from devkit_cli.frontmatter import split_frontmatter
+from devkit_cli.manifest import ManifestEntry, TemplateManifest
+from devkit_cli.models import Agent, AgentType
+from devkit_cli.render import has_placeholders
+from devkit_cli.sources import TemplateSource
+from devkit_cli.timing import get_tracer
+from devkit_cli.utils import DevKitError, get_cache_dir, write_text_atomic
+
+
+# Bump when the on-disk cache layout changes
+CACHE_FORMAT = 1
+
+
+class AgentTransform(ABC):
+    """Maps template pack paths and file formats onto another agent's folder."""
+
+    name = ""
+    # Bump when the converted output changes, so cached conversions are dropped
+    version = 1
+
+    @abstractmethod
+    def target(self, rel_path: str) -> tuple[str, str | None] | None:
+        """
+        Where a pack file is installed for this agent.
+
+        Args:
+            rel_path: POSIX path relative to the pack root
+
+        Returns:
+            Tuple of (target path relative to the agent folder, conversion
+            name or None to copy the file as is), or None to leave the file out
+        """
+
+    @abstractmethod
+    def convert(self, conversion: str, text: str) -> str:
+        """
+        Convert one file.
+
+        Args:
+            conversion: Conversion name returned by ``target``
+            text: Source file contents
+
+        Returns:
+            Converted contents
+        """
+
+    def settings_registry(self, source: TemplateSource) -> dict:
+        """Settings registry to merge for this agent ({} for none)."""
+        return {}
+
+
+class CursorTransform(AgentTransform):
+    """
+    Cursor: subagents and skills become project rules, commands stay commands.
+
+    - ``agents/NAME.md`` becomes the rule ``rules/NAME.mdc``, applied when
+      its description matches the request
+    - ``skills/NAME/SKILL.md`` becomes ``rules/NAME/NAME.mdc``; the skill's
+      other files are kept beside it, so relative links still resolve
+    - ``commands/**.md`` keep their path, without Claude-specific frontmatter
+    - hooks and the settings registry are left out: Cursor configures hooks
+      in its own format
+    """
+
+    name = "cursor"
+    version = 1
+
+    def target(self, rel_path: str) -> tuple[str, str | None] | None:
+        """Map a pack path into .cursor/ (see the class docstring)."""
+        top, _, rest = rel_path.partition("/")
+        if top == "agents":
+            if not rest.endswith(".md"):
+                return None
+            return f"rules/{rest[:-3]}.mdc", "rule"
+        if top == "skills":
+            skill, _, file = rest.partition("/")
+            if file == "SKILL.md":
+                return f"rules/{skill}/{skill}.mdc", "rule"
+            return f"rules/{rest}", None
+        if top == "commands":
+            return rel_path, "command" if rest.endswith(".md") else None
+        return None
+
+    def convert(self, conversion: str, text: str) -> str:
+        """Write a rule header, or strip the frontmatter of a command."""
+        meta, body = split_frontmatter(text)
+        body = body.lstrip("\n")
+        if conversion == "command":
+            return body
+        return (
+            "---\n"
+            f"description: {json.dumps(meta.get('description', ''), ensure_ascii=False)}\n"
+            "globs:\n"
+            "alwaysApply: false\n"
+            "---\n\n"
+            f"{body}"
+        )
+
+
+# Transforms by agent; agents without one install the pack as it is
+TRANSFORMS: dict[AgentType, AgentTransform] = {
+    AgentType.CURSOR: CursorTransform(),
+}
+
+
+def get_transform(agent: Agent) -> AgentTransform | None:
+    """Transform for an agent, or None if the pack is already in its format."""
+    return TRANSFORMS.get(agent.name)
+
+
+class ConversionCache:
+    """Converted files of one transform, by conversion and source content hash."""
+
+    def __init__(self, transform: AgentTransform):
+        """
+        Initialize the cache (use ``conversion_cache``).
+
+        Args:
+            transform: Transform whose conversions are cached
+        """
+        self.transform = transform
+        self.path = get_cache_dir() / "transforms" / f"{transform.name}.json"
+        self._entries: dict[str, str] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def convert(self, conversion: str, sha256: str, read: Callable[[], bytes]) -> bytes:
+        """
+        Converted contents of a file, converting it only on a cache miss.
+
+        Args:
+            conversion: Conversion name from ``AgentTransform.target``
+            sha256: Content hash of the source file (from the manifest)
+            read: Returns the source file contents; only called on a miss
+
+        Returns:
+            Converted contents
+        """
+        key = f"{conversion}:{sha256}"
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._used.add(key)
+            text = self._entries.get(key)
+            if text is None:
+                # surrogateescape round-trips bytes that are not valid UTF-8
+                source = read().decode("utf-8", errors="surrogateescape")
+                text = self._entries[key] = self.transform.convert(conversion, source)
+                self._dirty = True
+                get_tracer().count("templates_converted")
+            else:
+                get_tracer().count("conversions_cached")
+        return text.encode("utf-8", errors="surrogateescape")
+
+    def save(self) -> None:
+        """Write new conversions to disk, keeping only the entries in use."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {key: text for key, text in self._entries.items() if key in self._used}
+            data = {
+                "format": CACHE_FORMAT,
+                "version": __version__,
+                "transform_version": self.transform.version,
+                "entries": entries,
+            }
+            try:
+                write_text_atomic(self.path, json.dumps(data))
+            except OSError:
+                # A read-only cache only costs us the next conversion
+                pass
+            self._dirty = False
+
+    def _load(self) -> dict[str, str]:
+        """Read the on-disk cache, returning {} if missing or stale."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != CACHE_FORMAT
+            or data.get("version") != __version__
+            or data.get("transform_version") != self.transform.version
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return {}
+        return data["entries"]
+
+
+# Conversion caches by transform name, shared by every source in the process
+_CACHES: dict[str, ConversionCache] = {}
+
+
+def conversion_cache(transform: AgentTransform) -> ConversionCache:
+    """Return the process-wide conversion cache for a transform."""
+    cache = _CACHES.get(transform.name)
+    if cache is None:
+        cache = _CACHES[transform.name] = ConversionCache(transform)
+    return cache
+
+
+class TransformedSource:
+    """A template source seen through an agent transform."""
+
+    def __init__(self, base: TemplateSource, transform: AgentTransform, manifest: TemplateManifest | None = None):
+        """
+        Initialize a transformed source.
+
+        Args:
+            base: Template pack to read from
+            transform: Transform to apply
+            manifest: Pack files to transform (defaults to the whole pack;
+                pass a filtered manifest so only selected files are converted)
+        """
+        self.base = base
+        self.transform = transform
+        self.label = f"{base.label} ({transform.name})"
+        self._pack_manifest = manifest
+        self._manifest: TemplateManifest | None = None
+        self._origins: dict[Path, Path] = {}
+        self._converted: dict[Path, bytes] = {}
+
+    def get_manifest(self) -> TemplateManifest:
+        """
+        Manifest of the files as installed for the agent.
+
+        Converted files are listed with the size, hash and placeholder flag
+        of their converted contents, so sync and conflict checks compare the
+        project against what would actually be installed.
+
+        Raises:
+            TemplateNotFoundError: If the base source doesn't exist
+            DevKitError: If two pack files map to the same target path
+        """
+        if self._manifest is None:
+            pack = self._pack_manifest or self.base.get_manifest()
+            cache = conversion_cache(self.transform)
+            entries = []
+            for entry in pack.entries:
+                mapped = self.transform.target(entry.path.as_posix())
+                if mapped is None:
+                    continue
+                target = Path(mapped[0])
+                if target in self._origins:
+                    raise DevKitError(
+                        f"Templates {self._origins[target]} and {entry.path} both map to "
+                        f"{target} for {self.transform.name}"
+                    )
+                self._origins[target] = entry.path
+                conversion = mapped[1]
+                if conversion is None:
+                    entries.append(replace(entry, path=target))
+                    continue
+                data = cache.convert(conversion, entry.sha256, lambda path=entry.path: self.base.read_bytes(path))
+                self._converted[target] = data
+                entries.append(ManifestEntry(
+                    path=target,
+                    size=len(data),
+                    mode=entry.mode,
+                    sha256=hashlib.sha256(data).hexdigest(),
+                    templated=has_placeholders(data),
+                ))
+            cache.save()
+            entries.sort(key=lambda entry: entry.path.as_posix())
+            self._manifest = TemplateManifest(root=pack.root, version=pack.version, entries=entries)
+        return self._manifest
+
+    def read_bytes(self, rel_path: Path) -> bytes:
+        """Converted contents, or the pack file's contents if it is copied as is."""
+        self.get_manifest()
+        data = self._converted.get(rel_path)
+        if data is not None:
+            return data
+        return self.base.read_bytes(self._origins[rel_path])
+
+    def file_path(self, rel_path: Path) -> Path | None:
+        """Pack file for files copied as is; converted files have none."""
+        self.get_manifest()
+        if rel_path in self._converted:
+            return None
+        return self.base.file_path(self._origins[rel_path])
+
+    def read_settings_registry(self) -> dict:
+        """The transform's settings registry for the agent."""
+        return self.transform.settings_registry(self.base)
@@ -1,13 +1,18 @@
 """UI components for DevKit CLI."""
 
 import sys
+import time
 from typing import Sequence
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
+from rich.table import Table
 from rich.tree import Tree
-from devkit_cli.models import Agent, InstallResult
-from devkit_cli.config import BANNER, UI_THEME
+from devkit_cli.backup import Backup
+from devkit_cli.models import Agent, Component, DriftReport, FleetResult, InstallResult, PluginInfo, WatchPush
+from devkit_cli.timing import Tracer
+from devkit_cli.config import BANNER, RESULT_FILES_PER_DIR, UI_THEME
+from devkit_cli.utils import group_by_directory, summarize_existing
 
 try:
     import readchar
@@ -53,6 +58,46 @@ def show_error(message: str, prefix: str = "Error") -> None:
     console.print(error_text)
 
 
+def show_warning(message: str) -> None:
+    """
+    Display a styled warning message.
+
+    Args:
+        message: Warning message to display
+    """
+    console.print(f"[{UI_THEME['warning']}]{message}[/{UI_THEME['warning']}]")
+
+
+def show_hint(message: str) -> None:
+    """
+    Display a de-emphasized informational message.
+
+    Args:
+        message: Message to display
+    """
+    console.print(f"[{UI_THEME['text_hint']}]{message}[/{UI_THEME['text_hint']}]")
+
+
+def show_next_steps(project_label: str) -> None:
+    """
+    Display follow-up instructions after a successful init.
+
+    Args:
+        project_label: Directory to cd into ("." for current directory)
+    """
+    next_steps_text = (
+        f"[{UI_THEME['text_secondary']}]1. Navigate to your project:[/{UI_THEME['text_secondary']}] [{UI_THEME['primary']}]cd {project_label}[/{UI_THEME['primary']}]\n"
+        f"[{UI_THEME['text_secondary']}]2. Use the installed templates in your coding agent[/{UI_THEME['text_secondary']}]"
+    )
+    next_steps_panel = Panel(
+        next_steps_text,
+        title=f"[bold {UI_THEME['text_primary']}]Next Steps[/bold {UI_THEME['text_primary']}]",
+        border_style=UI_THEME["border"],
+        padding=(1, 2)
+    )
+    console.print(next_steps_panel)
+
+
 def select_agent(agents: Sequence[Agent]) -> Agent | None:
     """
     Interactive agent selection with arrow keys.
@@ -146,12 +191,17 @@ def _select_agent_fallback(agents: Sequence[Agent]) -> Agent | None:
             return None
 
 
-def show_result(result: InstallResult) -> None:
+def show_result(result: InstallResult, verbose: bool = False) -> None:
     """
     Display installation result to user.
 
+    Copied files are summarized per directory (counts plus the first few
+    files) unless ``verbose`` is set. When output is not a terminal the file
+    list is streamed as plain lines instead of building a tree renderable.
+
     Args:
         result: Installation result to display
+        verbose: List every copied file
     """
     console.print()
 
@@ -169,13 +219,23 @@ def show_result(result: InstallResult) -> None:
     # Build details content
     details_lines = []
 
-    if result.conflicts:
-        details_lines.append(f"[{UI_THEME['warning']}]Found {len(result.conflicts)} existing file(s)[/{UI_THEME['warning']}]")
+    if result.existing:
+        details_lines.append(
+            f"[{UI_THEME['warning']}]Found {len(result.existing)} existing file(s): "
+            f"{summarize_existing(result.existing)}[/{UI_THEME['warning']}]"
+        )
 
-    if result.backup_path:
-        details_lines.append(f"[{UI_THEME['info']}]Created backup: {result.backup_path.name}[/{UI_THEME['info']}]")
+    if result.backup_id:
+        details_lines.append(f"[{UI_THEME['info']}]Created backup: {result.backup_id}[/{UI_THEME['info']}]")
+        details_lines.append(f"[{UI_THEME['text_hint']}]Undo with: devkit restore {result.backup_id}[/{UI_THEME['text_hint']}]")
 
-    details_lines.append(f"[{UI_THEME['success']}]Copied {len(result.files_copied)} file(s) to {result.agent.folder}/[/{UI_THEME['success']}]")
+    if result.sync:
+        details_lines.append(
+            f"[{UI_THEME['success']}]Added {len(result.files_added)}, updated {len(result.files_updated)} file(s) in {result.agent.folder}/[/{UI_THEME['success']}]"
+        )
+        details_lines.append(f"[{UI_THEME['text_hint']}]{len(result.files_unchanged)} file(s) unchanged[/{UI_THEME['text_hint']}]")
+    else:
+        details_lines.append(f"[{UI_THEME['success']}]Copied {len(result.files_copied)} file(s) to {result.agent.folder}/[/{UI_THEME['success']}]")
 
     # Create success panel with details
     details_text = "\n".join(details_lines)
@@ -190,41 +250,307 @@ def show_result(result: InstallResult) -> None:
     # Show file tree
     if result.files_copied:
         console.print()
-        tree = Tree(
-            f"[bold {UI_THEME['primary']}]{result.agent.folder}/[/bold {UI_THEME['primary']}]",
-            guide_style=UI_THEME["border_subtle"]
+        groups = group_by_directory(result.files_copied, limit=None if verbose else RESULT_FILES_PER_DIR)
+        if console.is_terminal:
+            console.print(_result_tree(result.agent.folder, groups))
+        else:
+            _stream_result_files(result.agent.folder, groups)
+
+    console.print()
+
+
+def _result_tree(folder: str, groups: list[tuple[str, int, list[str]]]) -> Tree:
+    """Build the copied-files tree: one branch per directory, long ones collapsed."""
+    tree = Tree(
+        f"[bold {UI_THEME['primary']}]{folder}/[/bold {UI_THEME['primary']}]",
+        guide_style=UI_THEME["border_subtle"]
+    )
+    for directory, count, names in groups:
+        if directory:
+            branch = tree.add(
+                f"[bold {UI_THEME['text_secondary']}]{directory}/[/bold {UI_THEME['text_secondary']}] "
+                f"[{UI_THEME['text_hint']}]({count} file(s))[/{UI_THEME['text_hint']}]"
+            )
+        else:
+            branch = tree
+        for name in sorted(names):
+            branch.add(f"[{UI_THEME['text_tertiary']}]{name}[/{UI_THEME['text_tertiary']}]")
+        if count > len(names):
+            branch.add(
+                f"[{UI_THEME['text_hint']}]… and {count - len(names)} more "
+                f"(--verbose lists all)[/{UI_THEME['text_hint']}]"
+            )
+    return tree
+
+
+def _stream_result_files(folder: str, groups: list[tuple[str, int, list[str]]]) -> None:
+    """Write the copied-files list as plain lines, one directory at a time."""
+    for directory, count, names in groups:
+        prefix = f"{folder}/{directory}/" if directory else f"{folder}/"
+        lines = [f"{prefix} ({count} file(s))"] if directory else []
+        lines.extend(f"  {prefix}{name}" for name in sorted(names))
+        if count > len(names):
+            lines.append(f"  … and {count - len(names)} more (--verbose lists all)")
+        console.file.write("\n".join(lines) + "\n")
+    console.file.flush()
+
+
+def show_fleet_result(fleet: FleetResult) -> None:
+    """
+    Display one aggregated report for a fleet install.
+
+    Args:
+        fleet: Fleet result to display
+    """
+    console.print()
+
+    succeeded = fleet.succeeded
+    failed = fleet.failed
+    files_copied = sum(len(r.files_copied) for r in succeeded)
+    files_unchanged = sum(len(r.files_unchanged) for r in succeeded)
+    backups = sum(1 for r in succeeded if r.backup_id)
+
+    details_lines = [
+        f"[{UI_THEME['success']}]{len(succeeded)} of {len(fleet.results)} project(s) installed in {fleet.elapsed:.2f}s[/{UI_THEME['success']}]",
+        f"[{UI_THEME['text_secondary']}]Copied {files_copied} file(s), {files_unchanged} unchanged[/{UI_THEME['text_secondary']}]",
+    ]
+    if backups:
+        details_lines.append(f"[{UI_THEME['info']}]Created {backups} backup(s)[/{UI_THEME['info']}]")
+    if failed:
+        details_lines.append(f"[{UI_THEME['error']}]{len(failed)} project(s) failed[/{UI_THEME['error']}]")
+
+    style = UI_THEME["error"] if failed else UI_THEME["success"]
+    symbol = "✗" if failed else "✓"
+    fleet_panel = Panel(
+        "\n".join(details_lines),
+        title=f"[{style}]{symbol} Fleet install for {fleet.agent.display_name}[/{style}]",
+        border_style=style,
+        padding=(1, 2)
+    )
+    console.print(fleet_panel)
+
+    for result in failed:
+        show_error(result.message, prefix=str(result.project_path))
+
+    console.print()
+
+
+def show_watch_push(push: WatchPush) -> None:
+    """
+    Display one batch of changes pushed by ``devkit watch``.
+
+    Args:
+        push: Pushed changes
+    """
+    stamp = f"[{UI_THEME['text_hint']}]{time.strftime('%H:%M:%S')}[/{UI_THEME['text_hint']}]"
+    for rel_path in push.changed:
+        console.print(f"{stamp} [{UI_THEME['primary']}]↻[/{UI_THEME['primary']}] {rel_path.as_posix()}")
+    for rel_path in push.removed:
+        console.print(
+            f"{stamp} [{UI_THEME['warning']}]−[/{UI_THEME['warning']}] {rel_path.as_posix()} "
+            f"[{UI_THEME['text_hint']}](removed from source, left in projects)[/{UI_THEME['text_hint']}]"
+        )
+    if push.settings_changed:
+        console.print(f"{stamp} [{UI_THEME['primary']}]↻[/{UI_THEME['primary']}] settings registry merged")
+    if push.fleet:
+        copied = sum(len(r.files_copied) for r in push.fleet.succeeded)
+        console.print(
+            f"{stamp} [{UI_THEME['success']}]✓[/{UI_THEME['success']}] "
+            f"[{UI_THEME['text_secondary']}]Updated {copied} file(s) across "
+            f"{len(push.fleet.succeeded)} project(s)[/{UI_THEME['text_secondary']}]"
         )
+        for result in push.fleet.failed:
+            show_error(result.message, prefix=str(result.project_path))
 
-        # Organize files by subdirectory
-        files_by_dir = {}
-        for file_path in sorted(result.files_copied):
-            parts = file_path.parts
-            if len(parts) > 1:
-                subdir = parts[0]
-                filename = "/".join(parts[1:])
-                if subdir not in files_by_dir:
-                    files_by_dir[subdir] = []
-                files_by_dir[subdir].append(filename)
-            else:
-                # File at root
-                if "." not in files_by_dir:
-                    files_by_dir["."] = []
-                files_by_dir["."].append(str(file_path))
-
-        # Build tree structure
-        for subdir in sorted(files_by_dir.keys()):
-            if subdir == ".":
-                # Root files
-                for filename in files_by_dir[subdir]:
-                    tree.add(f"[{UI_THEME['text_tertiary']}]{filename}[/{UI_THEME['text_tertiary']}]")
-            else:
-                # Subdirectory
-                branch = tree.add(f"[bold {UI_THEME['text_secondary']}]{subdir}/[/bold {UI_THEME['text_secondary']}]")
-                for filename in files_by_dir[subdir]:
-                    branch.add(f"[{UI_THEME['text_tertiary']}]{filename}[/{UI_THEME['text_tertiary']}]")
 
+def show_plugins(plugins: Sequence[PluginInfo], show_components: bool = False) -> None:
+    """
+    Display marketplace plugins as a tree.
+
+    Args:
+        plugins: Plugins to display
+        show_components: Also list each plugin's components
+    """
+    console.print()
+
+    if not plugins:
+        console.print(f"[{UI_THEME['text_hint']}]No plugins found.[/{UI_THEME['text_hint']}]\n")
+        return
+
+    tree = Tree(
+        f"[bold {UI_THEME['primary']}]Plugins[/bold {UI_THEME['primary']}]",
+        guide_style=UI_THEME["border_subtle"]
+    )
+    for plugin in plugins:
+        version = f" [{UI_THEME['text_hint']}]v{plugin.version}[/{UI_THEME['text_hint']}]" if plugin.version else ""
+        branch = tree.add(
+            f"[{UI_THEME['text_primary']}]{plugin.name}[/{UI_THEME['text_primary']}]{version} "
+            f"[{UI_THEME['text_tertiary']}]{plugin.description}[/{UI_THEME['text_tertiary']}]"
+        )
+        if not show_components:
+            counts = {}
+            for component in plugin.components:
+                counts[component.kind] = counts.get(component.kind, 0) + 1
+            summary = ", ".join(f"{count} {kind}(s)" for kind, count in counts.items()) or "no components"
+            branch.add(f"[{UI_THEME['text_hint']}]{summary}[/{UI_THEME['text_hint']}]")
+            continue
+        for component in plugin.components:
+            branch.add(
+                f"[{UI_THEME['accent']}]{component.kind}[/{UI_THEME['accent']}] "
+                f"[{UI_THEME['text_secondary']}]{component.name}[/{UI_THEME['text_secondary']}] "
+                f"[{UI_THEME['text_hint']}]{component.description}[/{UI_THEME['text_hint']}]"
+            )
+
+    console.print(tree)
+    console.print()
+
+
+def show_components(components: Sequence[Component]) -> None:
+    """
+    Display template components as a table.
+
+    Args:
+        components: Components to display
+    """
+    console.print()
+
+    if not components:
+        console.print(f"[{UI_THEME['text_hint']}]No components found.[/{UI_THEME['text_hint']}]\n")
+        return
+
+    table = Table(
+        title=f"[bold {UI_THEME['primary']}]Components[/bold {UI_THEME['primary']}]",
+        border_style=UI_THEME["border"],
+        header_style=UI_THEME["text_tertiary"],
+    )
+    table.add_column("Kind", style=UI_THEME["accent"])
+    table.add_column("Name", style=UI_THEME["text_primary"])
+    table.add_column("Description", style=UI_THEME["text_secondary"], ratio=1)
+    table.add_column("Tools", style=UI_THEME["text_hint"])
+    table.add_column("Model", style=UI_THEME["text_hint"])
+
+    for component in components:
+        table.add_row(
+            component.kind, component.name, component.description,
+            component.tools, component.model,
+        )
+
+    console.print(table)
+    console.print()
+
+
+def show_backups(backups: Sequence[Backup]) -> None:
+    """
+    Display the backups available in a project.
+
+    Args:
+        backups: Backups sorted newest first
+    """
+    console.print()
+
+    if not backups:
+        console.print(f"[{UI_THEME['text_hint']}]No backups found.[/{UI_THEME['text_hint']}]\n")
+        return
+
+    tree = Tree(
+        f"[bold {UI_THEME['primary']}]Backups[/bold {UI_THEME['primary']}]",
+        guide_style=UI_THEME["border_subtle"]
+    )
+    for backup in backups:
+        tree.add(
+            f"[{UI_THEME['text_secondary']}]{backup.id}[/{UI_THEME['text_secondary']}] "
+            f"[{UI_THEME['text_hint']}]{len(backup.files)} file(s) from {backup.agent_folder}/[/{UI_THEME['text_hint']}]"
+        )
+    console.print(tree)
+    console.print()
+
+
+def show_status(reports: Sequence[DriftReport]) -> None:
+    """
+    Display how each agent folder compares with what DevKit installed.
+
+    Args:
+        reports: One drift report per agent folder
+    """
+    console.print()
+    for report in reports:
+        folder = report.agent.folder
+        if report.clean:
+            summary = f"[{UI_THEME['success']}]✓ {folder}/: {report.files} file(s) as installed[/{UI_THEME['success']}]"
+        else:
+            summary = (
+                f"[{UI_THEME['warning']}]{folder}/: {len(report.modified)} modified, "
+                f"{len(report.missing)} missing of {report.files} file(s)[/{UI_THEME['warning']}]"
+            )
+        tree = Tree(summary, guide_style=UI_THEME["border_subtle"])
+        for label, paths, color in (
+            ("modified", report.modified, UI_THEME["warning"]),
+            ("missing", report.missing, UI_THEME["error"]),
+            ("outdated", report.outdated, UI_THEME["info"]),
+        ):
+            for path in paths:
+                tree.add(
+                    f"[{color}]{label:<9}[/{color}]"
+                    f"[{UI_THEME['text_tertiary']}]{folder}/{path.as_posix()}[/{UI_THEME['text_tertiary']}]"
+                )
         console.print(tree)
+        if report.outdated:
+            console.print(
+                f"[{UI_THEME['text_hint']}]{len(report.outdated)} file(s) have newer templates; "
+                f"update with: devkit init --here --sync[/{UI_THEME['text_hint']}]"
+            )
+    console.print()
+
+
+def show_restore_result(backup: Backup, restored: Sequence, undo: Backup | None) -> None:
+    """
+    Display the result of restoring a backup.
+
+    Args:
+        backup: Backup that was restored
+        restored: Relative paths that were restored
+        undo: Backup of the files that were replaced, if any
+    """
+    console.print()
+
+    details_lines = [
+        f"[{UI_THEME['success']}]Restored {len(restored)} file(s) to {backup.agent_folder}/[/{UI_THEME['success']}]"
+    ]
+    if undo:
+        details_lines.append(f"[{UI_THEME['info']}]Replaced files saved as backup: {undo.id}[/{UI_THEME['info']}]")
+
+    restore_panel = Panel(
+        "\n".join(details_lines),
+        title=f"[{UI_THEME['success']}]✓ Restored backup {backup.id}[/{UI_THEME['success']}]",
+        border_style=UI_THEME["success"],
+        padding=(1, 2)
+    )
+    console.print(restore_panel)
+    console.print()
+
+
+def show_timings(tracer: Tracer) -> None:
+    """
+    Display recorded phase timings and counters as a table.
+
+    Args:
+        tracer: Tracer holding the recorded spans
+    """
+    table = Table(
+        title=f"[bold {UI_THEME['primary']}]Timings[/bold {UI_THEME['primary']}]",
+        border_style=UI_THEME["border"],
+        header_style=UI_THEME["text_tertiary"],
+    )
+    table.add_column("Phase", style=UI_THEME["text_secondary"])
+    table.add_column("ms", justify="right", style=UI_THEME["accent"])
+    table.add_column("Details", style=UI_THEME["text_hint"])
+
+    for name, duration_ms, details in tracer.rows():
+        table.add_row(name, f"{duration_ms:.2f}", details)
 
+    console.print(table)
+    for name, value in tracer.counters.items():
+        console.print(f"[{UI_THEME['text_hint']}]{name}: {value}[/{UI_THEME['text_hint']}]")
     console.print()
 
 
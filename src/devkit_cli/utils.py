@@ -1,8 +1,33 @@
 """Utility functions for DevKit CLI."""
 
+import errno
+import hashlib
+import os
 import shutil
-from datetime import datetime
+import stat
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Sequence, TypeVar
+from devkit_cli.config import DEVKIT_DIR
+from devkit_cli.models import ConflictKind, LinkMode
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+T = TypeVar("T")
+
+# ioctl request number for FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+# Link mode chosen by LinkMode.AUTO, probed once per target device
+_AUTO_LINK_MODES: dict[int, LinkMode] = {}
+_LINK_PROBE_LOCK = threading.Lock()
 
 
 class DevKitError(Exception):
@@ -20,6 +45,11 @@ class TemplateNotFoundError(DevKitError):
     pass
 
 
+class PromptUnavailableError(DevKitError):
+    """Error when input is missing and interactive prompts are disabled."""
+    pass
+
+
 def get_project_path(project_name: str | None, here: bool) -> Path:
     """
     Resolve project path from arguments.
@@ -59,35 +89,299 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def create_backup(source: Path) -> Path:
+def ensure_devkit_dir(project_path: Path) -> Path:
     """
-    Create a timestamped backup of a directory.
+    Create the project's .devkit/ state directory, ignored by git.
 
     Args:
-        source: Directory to backup
+        project_path: Project directory
 
     Returns:
-        Path to backup directory
+        Path to the .devkit/ directory
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    backup_path = source.parent / f"{source.name}.backup-{timestamp}"
-    shutil.copytree(source, backup_path)
-    return backup_path
+    devkit_dir = project_path / DEVKIT_DIR
+    if not devkit_dir.exists():
+        ensure_directory(devkit_dir)
+        (devkit_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+    return devkit_dir
 
 
-def copy_file(source: Path, dest: Path) -> None:
+def copy_file(
+    source: Path,
+    dest: Path,
+    make_parents: bool = True,
+    link_mode: LinkMode = LinkMode.COPY,
+) -> None:
     """
     Copy a file, creating parent directories if needed.
 
+    Non-copy link modes share data with the source instead of duplicating it.
+    ``auto`` uses a reflink where the target filesystem supports it and a
+    plain copy otherwise. An existing destination that is a symlink or a
+    hardlink is always replaced, never written through, so the shared
+    template file is left untouched.
+
     Args:
         source: Source file path
         dest: Destination file path
+        make_parents: Create the destination's parent directory first
+        link_mode: How to materialize the file (copy, hardlink, reflink, symlink, auto)
 
     Raises:
         DevKitError: If file copy fails
     """
-    ensure_directory(dest.parent)
+    if make_parents:
+        ensure_directory(dest.parent)
+    if link_mode is LinkMode.AUTO:
+        link_mode = resolve_auto_link_mode(source, dest.parent)
+
     try:
-        shutil.copy2(source, dest)
+        if link_mode is LinkMode.COPY:
+            _break_link(dest)
+            shutil.copy2(source, dest)
+        else:
+            dest.unlink(missing_ok=True)
+            if link_mode is LinkMode.HARDLINK:
+                os.link(source, dest)
+            elif link_mode is LinkMode.SYMLINK:
+                os.symlink(source.resolve(), dest)
+            else:
+                _reflink(source, dest)
     except (OSError, IOError) as e:
-        raise DevKitError(f"Failed to copy {source.name} to {dest}: {e}") from e
+        raise DevKitError(f"Failed to {link_mode} {source.name} to {dest}: {e}") from e
+
+
+def resolve_auto_link_mode(source: Path, dest_dir: Path) -> LinkMode:
+    """
+    Pick the cheapest safe link mode for a destination directory.
+
+    The filesystem is probed once per target device by attempting a reflink;
+    the answer is cached for the rest of the process.
+
+    Args:
+        source: A template file to probe with
+        dest_dir: Existing directory on the target filesystem
+
+    Returns:
+        LinkMode.REFLINK if supported, otherwise LinkMode.COPY
+    """
+    device = dest_dir.stat().st_dev
+    with _LINK_PROBE_LOCK:
+        if device not in _AUTO_LINK_MODES:
+            probe = dest_dir / f".devkit-reflink-probe-{os.getpid()}"
+            try:
+                _reflink(source, probe)
+                _AUTO_LINK_MODES[device] = LinkMode.REFLINK
+            except OSError:
+                _AUTO_LINK_MODES[device] = LinkMode.COPY
+            finally:
+                probe.unlink(missing_ok=True)
+        return _AUTO_LINK_MODES[device]
+
+
+def _reflink(source: Path, dest: Path) -> None:
+    """Clone a file's extents (copy-on-write) with the Linux FICLONE ioctl."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is only supported on Linux")
+
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            dest.unlink(missing_ok=True)
+            raise
+    shutil.copystat(source, dest)
+
+
+def _break_link(dest: Path) -> None:
+    """Unlink a destination that shares its data with another path."""
+    try:
+        st = dest.lstat()
+    except FileNotFoundError:
+        return
+    if stat.S_ISLNK(st.st_mode) or (stat.S_ISREG(st.st_mode) and st.st_nlink > 1):
+        dest.unlink()
+
+
+def write_file(dest: Path, data: bytes, mode: int, make_parents: bool = True) -> None:
+    """
+    Write file contents from memory, creating parent directories if needed.
+
+    Args:
+        dest: Destination file path
+        data: File contents
+        mode: Permission bits to apply
+        make_parents: Create the destination's parent directory first
+
+    Raises:
+        DevKitError: If the write fails
+    """
+    if make_parents:
+        ensure_directory(dest.parent)
+    try:
+        _break_link(dest)
+        dest.write_bytes(data)
+        os.chmod(dest, mode)
+    except (OSError, IOError) as e:
+        raise DevKitError(f"Failed to write {dest}: {e}") from e
+
+
+def run_file_jobs(
+    jobs: Sequence[T],
+    func: Callable[[T], None],
+    workers: int = 1,
+    on_done: Callable[[T], None] | None = None,
+) -> None:
+    """
+    Run one function per file, optionally on a thread pool.
+
+    ``on_done`` is always called from the calling thread, so it is safe to
+    update progress displays from it. With several workers every job runs to
+    completion and the failure of the earliest job (in input order) is raised,
+    so the reported error does not depend on thread scheduling.
+
+    Args:
+        jobs: Items to process (e.g., relative template paths)
+        func: Function applied to each item
+        workers: Maximum number of concurrent jobs (1 runs sequentially)
+        on_done: Callback invoked after each successful job
+
+    Raises:
+        Exception: The exception raised by the earliest failing job
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            func(job)
+            if on_done:
+                on_done(job)
+        return
+
+    errors: dict[int, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        futures = {executor.submit(func, job): idx for idx, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            error = future.exception()
+            if error is not None:
+                errors[idx] = error
+            elif on_done:
+                on_done(jobs[idx])
+
+    if errors:
+        raise errors[min(errors)]
+
+
+def group_by_directory(
+    paths: Sequence[Path],
+    limit: int | None = None,
+) -> list[tuple[str, int, list[str]]]:
+    """
+    Group relative paths by their top-level directory in one pass.
+
+    Used by the install result views, which show per-directory counts and
+    only the first few files of each directory unless asked for all of them.
+
+    Args:
+        paths: Relative paths (e.g., files copied by an install)
+        limit: Keep at most this many names per directory (None keeps all)
+
+    Returns:
+        (directory, file count, names below the directory) tuples, sorted by
+        directory; files at the top level are grouped under ""
+    """
+    groups: dict[str, list] = {}
+    for path in paths:
+        parts = path.parts
+        directory, name = (parts[0], "/".join(parts[1:])) if len(parts) > 1 else ("", parts[0])
+        group = groups.get(directory)
+        if group is None:
+            group = groups[directory] = [0, []]
+        group[0] += 1
+        if limit is None or len(group[1]) < limit:
+            group[1].append(name)
+    return [(directory, count, names) for directory, (count, names) in sorted(groups.items())]
+
+
+def summarize_existing(existing: dict[Path, ConflictKind]) -> str:
+    """
+    Count existing files by kind, e.g. "3 modified, 12 identical".
+
+    Args:
+        existing: ConflictKind by path (``InstallResult.existing``)
+
+    Returns:
+        Comma-separated counts, most actionable kind first
+    """
+    counts = {
+        kind: 0
+        for kind in (ConflictKind.TYPE_MISMATCH, ConflictKind.MODIFIED, ConflictKind.OUTDATED, ConflictKind.IDENTICAL)
+    }
+    for kind in existing.values():
+        counts[kind] += 1
+    return ", ".join(f"{count} {kind}" for kind, count in counts.items() if count)
+
+
+def hash_file(path: Path | str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def get_cache_dir() -> Path:
+    """
+    Resolve the user cache directory for DevKit.
+
+    Honors DEVKIT_CACHE_DIR, then XDG_CACHE_HOME, then ~/.cache.
+
+    Returns:
+        Path to the DevKit cache directory (may not exist yet)
+    """
+    override = os.environ.get("DEVKIT_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "devkit"
+
+
+def get_config_dir() -> Path:
+    """
+    Resolve the user configuration directory for DevKit.
+
+    Honors DEVKIT_CONFIG_DIR, then XDG_CONFIG_HOME, then ~/.config.
+
+    Returns:
+        Path to the DevKit config directory (may not exist)
+    """
+    override = os.environ.get("DEVKIT_CONFIG_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(base) / "devkit"
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """
+    Write a text file atomically via a temp file and rename.
+
+    Args:
+        path: Destination file path
+        text: File contents
+    """
+    ensure_directory(path.parent)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
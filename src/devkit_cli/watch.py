@@ -0,0 +1,389 @@
+"""Watch a template directory and push changed files into projects."""
+
+import ctypes
+import ctypes.util
+import errno
+import glob
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+from devkit_cli.config import DEFAULT_WATCH_DEBOUNCE, SETTINGS_REGISTRY
+from devkit_cli.core import TemplateManager
+from devkit_cli.fleet import DEFAULT_FLEET_WORKERS, run_fleet
+from devkit_cli.manifest import FileFilter, load_manifest, update_manifest
+from devkit_cli.models import Agent, LinkMode, WatchPush
+from devkit_cli.sources import DirectorySource
+
+
+# Longest a burst of changes may grow before it is pushed anyway
+MAX_BATCH_WAIT = 5.0
+
+# Polling interval when inotify is unavailable
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """
+    Recursive inotify watch on a template root, through ctypes.
+
+    ``read`` returns paths relative to the root. When the kernel queue
+    overflows it returns None, meaning "rescan everything".
+    """
+
+    def __init__(self, root: Path):
+        """
+        Start watching a template root.
+
+        Raises:
+            OSError: If inotify is unavailable on this system, or a
+                directory cannot be watched
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 failed: {os.strerror(error)}")
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+    def read(self, timeout: float) -> set[Path] | None:
+        """
+        Wait up to ``timeout`` seconds for changes.
+
+        Returns:
+            Changed paths relative to the root (empty on timeout), or None
+            if events were lost and the whole tree must be rescanned
+
+        Raises:
+            OSError: If a new directory cannot be watched (its changes
+                would be missed)
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        # Files may land before the new watch exists: report them all
+                        self._add_tree(path)
+                        changed.update(_walk_files(self.root, path))
+                    elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                        changed.add(path.relative_to(self.root))
+                    continue
+                changed.add(path.relative_to(self.root))
+
+    def _add_tree(self, top: Path) -> None:
+        """
+        Watch a directory and every directory below it.
+
+        Raises:
+            OSError: If a directory cannot be watched, e.g. ENOSPC once the
+                user's inotify watch limit is reached
+        """
+        for dirpath, _dirnames, _filenames in os.walk(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = Path(dirpath)
+                continue
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                # Removed while walking: its deletion is reported by the parent
+                continue
+            hint = " (raise fs.inotify.max_user_watches)" if error == errno.ENOSPC else ""
+            raise OSError(error, f"inotify_add_watch failed for {dirpath}: {os.strerror(error)}{hint}")
+
+
+class PollingWatcher:
+    """Fallback watcher that rescans the tree's stat data every interval."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Start watching a template root.
+
+        Args:
+            root: Template root directory
+            interval: Seconds between rescans
+        """
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def read(self, timeout: float) -> set[Path] | None:
+        """
+        Sleep up to ``timeout`` seconds (at most one interval), then rescan.
+
+        Returns:
+            Paths relative to the root whose stat data changed
+        """
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = {
+            path for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        """Map each file to its (mtime_ns, size, mode)."""
+        snapshot = {}
+        for rel_path in _walk_files(self.root, self.root):
+            try:
+                st = (self.root / rel_path).stat()
+            except FileNotFoundError:
+                continue
+            snapshot[rel_path] = (st.st_mtime_ns, st.st_size, st.st_mode)
+        return snapshot
+
+
+def open_watcher(
+    root: Path,
+    polling: bool = False,
+    on_fallback: Callable[[OSError], None] | None = None,
+) -> InotifyWatcher | PollingWatcher:
+    """
+    Watch a template root with inotify, falling back to polling.
+
+    Args:
+        root: Template root directory
+        polling: Force the polling watcher
+        on_fallback: Called with the error when inotify is available but
+            fails (e.g. the watch limit is reached) and polling is used instead
+
+    Returns:
+        A watcher for the root
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except AttributeError:
+            # A libc without the inotify symbols
+            pass
+        except OSError as e:
+            if on_fallback:
+                on_fallback(e)
+    return PollingWatcher(root)
+
+
+def wait_for_changes(
+    watcher: InotifyWatcher | PollingWatcher,
+    debounce: float = DEFAULT_WATCH_DEBOUNCE,
+    timeout: float = 1.0,
+) -> set[Path] | None:
+    """
+    Wait for a burst of changes and return it once the tree goes quiet.
+
+    Editors often write a file several times (truncate, write, chmod, rename);
+    collecting events until ``debounce`` seconds pass without any turns that
+    burst into a single push. A burst is cut off after MAX_BATCH_WAIT.
+
+    Returns:
+        Changed paths (empty if nothing happened within ``timeout``), or None
+        if the whole tree must be rescanned
+    """
+    changed = watcher.read(timeout)
+    if not changed:
+        return changed
+
+    deadline = time.monotonic() + MAX_BATCH_WAIT
+    while time.monotonic() < deadline:
+        more = watcher.read(debounce)
+        if more is None:
+            return None
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+def push_changes(
+    agent: Agent,
+    root: Path,
+    project_paths: list[Path],
+    changed: set[Path] | None,
+    file_filter: FileFilter | None = None,
+    variables: dict[str, str] | None = None,
+    workers: int = DEFAULT_FLEET_WORKERS,
+    link_mode: LinkMode = LinkMode.COPY,
+) -> WatchPush:
+    """
+    Push changed template files into every project.
+
+    The manifest is patched for just the changed paths, then the changed
+    files go through the normal install (sync mode, so a project whose copy
+    already matches is left alone, and only files that differ are backed
+    up). Templates deleted from the source are left in the projects.
+
+    Args:
+        agent: Agent whose folder the projects use
+        root: Template root directory being watched
+        project_paths: Projects to keep in sync
+        changed: Changed paths relative to root, or None to resync everything
+        file_filter: Profile/include/exclude selection for the projects
+        variables: Template variables from the command line
+        workers: Maximum number of projects updated concurrently
+        link_mode: How files are materialized
+
+    Returns:
+        What was pushed
+    """
+    file_filter = file_filter or FileFilter()
+    source = DirectorySource(root)
+    previous = set(load_manifest(root).paths)
+
+    if changed is None:
+        manifest = load_manifest(root, refresh=True)
+        changed = set(manifest.paths) | {Path(SETTINGS_REGISTRY)}
+    else:
+        manifest = update_manifest(root, changed)
+
+    present = set(manifest.paths)
+    selected = sorted(p for p in changed if p in present and file_filter.matches(p))
+    # Files, including those under a directory that was moved away
+    removed = sorted(previous - present)
+    settings_changed = Path(SETTINGS_REGISTRY) in changed
+
+    fleet = None
+    if selected:
+        # Install only the changed files (as literal patterns, not globs)
+        changed_only = FileFilter(include=tuple(glob.escape(p.as_posix()) for p in selected))
+        fleet = run_fleet(
+            TemplateManager(agent, source, changed_only, variables), project_paths,
+            workers=workers, sync=True, show_progress=False, link_mode=link_mode,
+        )
+    if settings_changed:
+        # The changed-only install above skips hooks for scripts it did not
+        # copy, so merge the registry against the full selection here
+        template_manager = TemplateManager(agent, source, file_filter, variables)
+        for project_path in project_paths:
+            template_manager._configure_hooks(project_path / agent.folder)
+
+    return WatchPush(changed=selected, removed=removed, settings_changed=settings_changed, fleet=fleet)
+
+
+def watch_templates(
+    agent: Agent,
+    root: Path,
+    project_paths: list[Path],
+    on_push: Callable[[WatchPush], None],
+    file_filter: FileFilter | None = None,
+    variables: dict[str, str] | None = None,
+    polling: bool = False,
+    debounce: float = DEFAULT_WATCH_DEBOUNCE,
+    link_mode: LinkMode = LinkMode.COPY,
+    on_fallback: Callable[[OSError], None] | None = None,
+) -> None:
+    """
+    Keep projects in sync with a template directory until interrupted.
+
+    If inotify fails, at start or when a new directory cannot be watched,
+    the polling watcher takes over (after a full resync) rather than
+    letting changes go unnoticed.
+
+    Args:
+        agent: Agent whose folder the projects use
+        root: Template root directory to watch
+        project_paths: Projects to keep in sync
+        on_push: Called after each batch of changes is pushed
+        file_filter: Profile/include/exclude selection for the projects
+        variables: Template variables from the command line
+        polling: Use the polling watcher even where inotify is available
+        debounce: Quiet period (seconds) that ends a burst of changes
+        link_mode: How files are materialized
+        on_fallback: Called with the error when inotify fails and polling
+            is used instead
+    """
+    watcher = open_watcher(root, polling=polling, on_fallback=on_fallback)
+    try:
+        while True:
+            try:
+                changed = wait_for_changes(watcher, debounce=debounce)
+            except OSError as e:
+                if not isinstance(watcher, InotifyWatcher):
+                    raise
+                if on_fallback:
+                    on_fallback(e)
+                watcher.close()
+                watcher = PollingWatcher(root)
+                changed = None
+            if changed is not None and not changed:
+                continue
+            push = push_changes(
+                agent, root, project_paths, changed,
+                file_filter=file_filter, variables=variables, link_mode=link_mode,
+            )
+            if push.changed or push.removed or push.settings_changed:
+                on_push(push)
+    finally:
+        watcher.close()
+
+
+def _walk_files(root: Path, top: Path) -> set[Path]:
+    """All files below ``top``, relative to ``root``."""
+    files = set()
+    for dirpath, _dirnames, filenames in os.walk(top):
+        for filename in filenames:
+            files.add((Path(dirpath) / filename).relative_to(root))
+    return files
@@ -0,0 +1,13 @@
+"""Shared fixtures: keep DevKit's user state out of the real home directory."""
+
+import pytest
+
+from devkit_cli import manifest
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEVKIT_CACHE_DIR", str(tmp_path / "devkit-cache"))
+    monkeypatch.setenv("DEVKIT_CONFIG_DIR", str(tmp_path / "devkit-config"))
+    monkeypatch.setenv("DEVKIT_NO_DAEMON", "1")
+    monkeypatch.setattr(manifest, "_MANIFEST_CACHE", {})
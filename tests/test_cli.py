@@ -0,0 +1,19 @@
+"""Tests for command-line error handling."""
+
+import pytest
+from typer.testing import CliRunner
+
+from devkit_cli import cli
+
+
+@pytest.mark.parametrize("args", [["plugins", "list"], ["plugins", "search", "review"]])
+def test_plugins_commands_report_unexpected_errors(monkeypatch, args):
+    def broken_catalog(marketplace):
+        raise ValueError("catalog entry is not an object")
+
+    monkeypatch.setattr(cli, "_open_catalog", broken_catalog)
+    result = CliRunner().invoke(cli.app, ["--plain", *args])
+
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, ValueError)
+    assert "catalog entry is not an object" in result.output
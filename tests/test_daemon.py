@@ -0,0 +1,69 @@
+"""Tests for the daemon's cached template manifests."""
+
+import os
+import shutil
+from pathlib import Path
+
+from devkit_cli import daemon, manifest
+from devkit_cli.daemon import DaemonServer
+
+
+class _FakeWatcher:
+    """Reports one batch of changes, then nothing."""
+
+    def __init__(self, changed: set[Path]):
+        self.changed = changed
+
+    def read(self, timeout: float) -> set[Path]:
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def test_refresh_drops_files_of_moved_skill_directory(tmp_path, monkeypatch):
+    templates = tmp_path / "templates"
+    root = templates / "claude-code"
+    for rel_path in ["agents/a.md", "skills/foo/SKILL.md", "skills/foo/x.md"]:
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(rel_path)
+    monkeypatch.setattr(daemon, "TEMPLATES_DIR", templates)
+    manifest.load_manifest(root)
+
+    # The daemon's watcher reports a directory moved away as a single path
+    shutil.move(root / "skills/foo", tmp_path / "foo")
+    server = DaemonServer.__new__(DaemonServer)
+    server._on_warning = None
+    server._watcher = _FakeWatcher({Path("claude-code/skills/foo")})
+    server._refresh_manifests()
+
+    assert manifest.load_manifest(root).paths == [Path("agents/a.md")]
+
+
+def test_run_command_uses_only_the_client_environment(tmp_path, monkeypatch):
+    from devkit_cli import cli
+
+    seen = {}
+
+    def fake_app(args, prog_name):
+        seen.update({name: os.environ.get(name) for name in ("DEVKIT_CACHE_DIR", "DEVKIT_VAR", "HOME", "PATH")})
+
+    monkeypatch.setattr(cli, "app", fake_app)
+    monkeypatch.setenv("DEVKIT_CACHE_DIR", "/daemon/cache")
+    monkeypatch.setenv("HOME", "/daemon/home")
+    server = DaemonServer.__new__(DaemonServer)
+    server._watcher = None
+
+    response = server.run_command({
+        "argv": ["version"],
+        "cwd": str(tmp_path),
+        "env": {"DEVKIT_VAR": "client", "HOME": "/client/home"},
+    })
+
+    assert response["exit"] == 0
+    assert seen["DEVKIT_CACHE_DIR"] is None
+    assert seen["DEVKIT_VAR"] == "client"
+    assert seen["HOME"] == "/client/home"
+    assert seen["PATH"] == os.environ["PATH"]
+    assert os.environ["DEVKIT_CACHE_DIR"] == "/daemon/cache"
@@ -0,0 +1,33 @@
+"""Tests for installing into many projects at once."""
+
+from pathlib import Path
+
+from devkit_cli.config import AGENT_CONFIG
+from devkit_cli.core import TemplateManager
+from devkit_cli.fleet import run_fleet
+from devkit_cli.models import AgentType
+from devkit_cli.sources import DirectorySource
+
+
+def test_unexpected_error_in_one_project_does_not_stop_the_others(tmp_path, monkeypatch):
+    pack = tmp_path / "pack"
+    (pack / "commands").mkdir(parents=True)
+    (pack / "commands/a.md").write_text("a")
+    projects = [tmp_path / name for name in ("good", "bad", "other")]
+    for project in projects:
+        project.mkdir()
+    manager = TemplateManager(AGENT_CONFIG[AgentType.CLAUDE_CODE], DirectorySource(pack))
+
+    install = manager.install_templates
+
+    def failing_install(project_path: Path, **kwargs):
+        if project_path.name == "bad":
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+        return install(project_path, **kwargs)
+
+    monkeypatch.setattr(manager, "install_templates", failing_install)
+    fleet = run_fleet(manager, projects, workers=2, show_progress=False)
+
+    assert [result.success for result in fleet.results] == [True, False, True]
+    assert "UnicodeDecodeError" in fleet.results[1].message
+    assert (tmp_path / "other/.claude/commands/a.md").read_text() == "a"
@@ -0,0 +1,121 @@
+"""Tests for template manifests and their incremental updates."""
+
+import os
+import shutil
+from pathlib import Path
+
+from devkit_cli import manifest as manifest_module
+from devkit_cli.manifest import TemplateManifest, load_manifest, update_manifest
+
+
+def _pack(root: Path) -> Path:
+    for rel_path, text in {
+        "agents/a.md": "a",
+        "skills/foo/SKILL.md": "foo",
+        "skills/foo/x.md": "x",
+        "skills/foobar/SKILL.md": "foobar",
+    }.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return root
+
+
+def test_update_manifest_hashes_changed_files(tmp_path):
+    root = _pack(tmp_path)
+    load_manifest(root, refresh=True)
+    (root / "agents/a.md").write_text("changed")
+    (root / "agents/b.md").write_text("b")
+
+    manifest = update_manifest(root, [Path("agents/a.md"), Path("agents/b.md")])
+
+    assert manifest.entries == load_manifest(root, refresh=True).entries
+
+
+def test_update_manifest_drops_directory_moved_away(tmp_path):
+    root = _pack(tmp_path)
+    load_manifest(root, refresh=True)
+    shutil.move(root / "skills/foo", tmp_path / "elsewhere")
+
+    manifest = update_manifest(root, [Path("skills/foo")])
+
+    assert [p.as_posix() for p in manifest.paths] == ["agents/a.md", "skills/foobar/SKILL.md"]
+
+
+def test_update_manifest_replaces_directory_in_one_batch(tmp_path):
+    root = _pack(tmp_path)
+    load_manifest(root, refresh=True)
+    shutil.rmtree(root / "skills/foo")
+    (root / "skills/foo").mkdir()
+    (root / "skills/foo/SKILL.md").write_text("new")
+
+    manifest = update_manifest(root, [Path("skills/foo/SKILL.md"), Path("skills/foo")])
+
+    assert manifest.entries == load_manifest(root, refresh=True).entries
+
+
+def test_update_manifest_keeps_entries_sorted(tmp_path):
+    root = _pack(tmp_path)
+    load_manifest(root, refresh=True)
+    (root / "agents/0.md").write_text("0")
+    (root / "skills/foo/a").mkdir()
+    (root / "skills/foo/a/b.md").write_text("b")
+
+    manifest = update_manifest(root, [Path("agents/0.md"), Path("skills/foo/a/b.md")])
+
+    rebuilt = load_manifest(root, refresh=True)
+    assert manifest.paths == sorted(rebuilt.paths, key=Path.as_posix)
+    assert manifest.paths == rebuilt.paths
+    assert manifest.digest() == rebuilt.digest()
+
+
+def _count_hashes(monkeypatch) -> list[Path]:
+    hashed = []
+    scan_entry = manifest_module._scan_entry
+
+    def counting(file_path, rel_path, st):
+        hashed.append(rel_path)
+        return scan_entry(file_path, rel_path, st)
+
+    monkeypatch.setattr(manifest_module, "_scan_entry", counting)
+    return hashed
+
+
+def _settle(root: Path) -> None:
+    """Backdate every file past the racy window."""
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.utime(path, (1_600_000_000, 1_600_000_000))
+
+
+def test_load_manifest_rehashes_only_changed_files(tmp_path, monkeypatch):
+    root = _pack(tmp_path / "pack")
+    _settle(root)
+    first = load_manifest(root)
+
+    # A new process: nothing in memory, the disk cache is trusted per file
+    manifest_module._MANIFEST_CACHE.clear()
+    hashed = _count_hashes(monkeypatch)
+    assert load_manifest(root).entries == first.entries
+    assert hashed == []
+
+    (root / "agents/a.md").write_text("changed")
+    (root / "skills/foo/x.md").unlink()
+    _settle(root)
+    manifest_module._MANIFEST_CACHE.clear()
+    manifest = load_manifest(root)
+
+    assert hashed == [Path("agents/a.md")]
+    assert manifest.entries == TemplateManifest.build(root).entries
+
+
+def test_load_manifest_rehashes_recently_modified_files(tmp_path, monkeypatch):
+    root = _pack(tmp_path / "pack")
+    load_manifest(root)
+
+    manifest_module._MANIFEST_CACHE.clear()
+    hashed = _count_hashes(monkeypatch)
+    load_manifest(root)
+
+    # Just written: an edit within the same mtime tick would go unnoticed
+    assert len(hashed) == 4
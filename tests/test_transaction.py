@@ -0,0 +1,194 @@
+"""Tests for transactional installs and recovery of interrupted ones."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from devkit_cli.config import AGENT_CONFIG, INSTALL_JOURNAL, STAGING_DIR
+from devkit_cli.core import TemplateManager
+from devkit_cli.models import AgentType
+from devkit_cli.sources import DirectorySource
+from devkit_cli.transaction import (
+    STATE_COMMITTING,
+    InstallLock,
+    InstallLockedError,
+    InstallTransaction,
+    recover_install,
+)
+
+
+def _stage(project: Path, files: dict[str, str]) -> InstallTransaction:
+    """Begin a transaction for a .claude folder and stage the given files."""
+    transaction = InstallTransaction(project, project / ".claude", [Path(p) for p in files])
+    transaction.begin()
+    for rel_path, text in files.items():
+        transaction.stage_path(Path(rel_path)).write_text(text)
+    return transaction
+
+
+def _write_journal(project: Path, journal: dict) -> None:
+    path = project / INSTALL_JOURNAL
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(journal))
+
+
+def test_commit_moves_staged_files(tmp_path):
+    transaction = _stage(tmp_path, {"commands/a.md": "a"})
+    transaction.commit()
+
+    assert (tmp_path / ".claude/commands/a.md").read_text() == "a"
+    assert not (tmp_path / INSTALL_JOURNAL).exists()
+    assert not transaction.staging_dir.exists()
+
+
+def test_recover_without_journal(tmp_path):
+    assert recover_install(tmp_path) is None
+
+
+def test_recover_rolls_forward_interrupted_commit(tmp_path):
+    transaction = _stage(tmp_path, {"commands/a.md": "a", "agents/b.md": "b"})
+    transaction._write_journal(STATE_COMMITTING)
+
+    assert recover_install(tmp_path) == "rolled-forward"
+    assert (tmp_path / ".claude/commands/a.md").read_text() == "a"
+    assert (tmp_path / ".claude/agents/b.md").read_text() == "b"
+    assert not transaction.staging_dir.exists()
+    assert not (tmp_path / INSTALL_JOURNAL).exists()
+
+
+def test_recover_rolls_back_interrupted_staging(tmp_path):
+    transaction = _stage(tmp_path, {"commands/a.md": "a"})
+
+    assert recover_install(tmp_path) == "rolled-back"
+    assert not (tmp_path / ".claude").exists()
+    assert not transaction.staging_dir.exists()
+    assert not (tmp_path / INSTALL_JOURNAL).exists()
+
+
+def test_recover_discards_unreadable_journal(tmp_path):
+    _stage(tmp_path, {"commands/a.md": "a"})
+    (tmp_path / INSTALL_JOURNAL).write_text("{not json")
+
+    assert recover_install(tmp_path) == "rolled-back"
+    assert not (tmp_path / STAGING_DIR).exists()
+    assert not (tmp_path / INSTALL_JOURNAL).exists()
+
+
+@pytest.mark.parametrize("journal", [
+    {"state": "x"},
+    {"state": STATE_COMMITTING, "staging_dir": 1, "agent_folder": ".claude", "files": []},
+    {"state": STATE_COMMITTING, "staging_dir": ".devkit/staging/x", "agent_folder": ".claude", "files": "a"},
+    [],
+])
+def test_recover_discards_malformed_journal(tmp_path, journal):
+    _write_journal(tmp_path, journal)
+
+    assert recover_install(tmp_path) == "rolled-back"
+    assert not (tmp_path / INSTALL_JOURNAL).exists()
+
+
+def _victim(tmp_path: Path) -> Path:
+    victim = tmp_path / "victim"
+    victim.mkdir()
+    (victim / "keep.txt").write_text("keep")
+    return victim
+
+
+@pytest.mark.parametrize("state", ["staging", STATE_COMMITTING])
+@pytest.mark.parametrize("staging_dir", ["{victim}", "../victim", ".devkit/staging/../../../victim", ".devkit"])
+def test_recover_refuses_staging_dir_outside_project(tmp_path, state, staging_dir):
+    project = tmp_path / "project"
+    project.mkdir()
+    victim = _victim(tmp_path)
+    _write_journal(project, {
+        "state": state,
+        "staging_dir": staging_dir.format(victim=victim),
+        "agent_folder": ".claude",
+        "files": ["keep.txt"],
+    })
+
+    assert recover_install(project) == "rolled-back"
+    assert (victim / "keep.txt").read_text() == "keep"
+    assert not (project / ".claude").exists()
+    assert (project / ".devkit").is_dir()
+
+
+def test_recover_refuses_symlinked_staging_dir(tmp_path):
+    project = tmp_path / "project"
+    victim = _victim(tmp_path)
+    (project / STAGING_DIR).mkdir(parents=True)
+    (project / STAGING_DIR / "abc").symlink_to(victim)
+    _write_journal(project, {
+        "state": "staging", "staging_dir": ".devkit/staging/abc", "agent_folder": ".claude", "files": [],
+    })
+
+    assert recover_install(project) == "rolled-back"
+    assert (victim / "keep.txt").read_text() == "keep"
+
+
+def test_recover_refuses_symlinked_staging_area(tmp_path):
+    project = tmp_path / "project"
+    victim = _victim(tmp_path)
+    (project / ".devkit").mkdir(parents=True)
+    (project / STAGING_DIR).symlink_to(victim)
+    (project / INSTALL_JOURNAL).write_text("{not json")
+
+    assert recover_install(project) == "rolled-back"
+    assert (victim / "keep.txt").read_text() == "keep"
+
+
+@pytest.mark.parametrize("agent_folder, files", [
+    ("../outside", ["a.md"]),
+    ("{outside}", ["a.md"]),
+    ("..", ["outside/a.md"]),
+    (".claude", ["../../outside/a.md"]),
+    (".claude", ["{outside}/a.md"]),
+])
+def test_recover_refuses_commit_outside_agent_folder(tmp_path, agent_folder, files):
+    project = tmp_path / "project"
+    project.mkdir()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    transaction = _stage(project, {"a.md": "payload"})
+    _write_journal(project, {
+        "state": STATE_COMMITTING,
+        "staging_dir": transaction.staging_dir.relative_to(project).as_posix(),
+        "agent_folder": agent_folder.format(outside=outside),
+        "files": [f.format(outside=outside) for f in files],
+    })
+
+    assert recover_install(project) == "rolled-back"
+    assert not (outside / "a.md").exists()
+    assert not (project / ".claude").exists()
+    assert not transaction.staging_dir.exists()
+
+
+def test_install_lock_is_exclusive(tmp_path):
+    with InstallLock(tmp_path):
+        with pytest.raises(InstallLockedError):
+            InstallLock(tmp_path).acquire()
+    with InstallLock(tmp_path):
+        pass
+
+
+def test_install_fails_fast_while_another_holds_the_lock(tmp_path):
+    pack = tmp_path / "pack"
+    (pack / "commands").mkdir(parents=True)
+    (pack / "commands/a.md").write_text("a")
+    project = tmp_path / "project"
+    project.mkdir()
+    manager = TemplateManager(AGENT_CONFIG[AgentType.CLAUDE_CODE], DirectorySource(pack))
+
+    with InstallLock(project):
+        # A second run must not recover (roll back) the first run's journal
+        transaction = _stage(project, {"commands/a.md": "staged"})
+        with pytest.raises(InstallLockedError):
+            manager.install_templates(project, show_progress=False)
+        assert transaction.staging_dir.exists()
+        assert (project / INSTALL_JOURNAL).exists()
+        transaction.rollback()
+
+    result = manager.install_templates(project, show_progress=False)
+    assert result.success
+    assert (project / ".claude/commands/a.md").read_text() == "a"
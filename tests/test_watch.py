@@ -0,0 +1,23 @@
+"""Tests for pushing template changes into projects."""
+
+import shutil
+from pathlib import Path
+
+from devkit_cli.config import AGENT_CONFIG
+from devkit_cli.manifest import load_manifest
+from devkit_cli.models import AgentType
+from devkit_cli.watch import push_changes
+
+
+def test_push_reports_files_of_moved_directory_as_removed(tmp_path):
+    root = tmp_path / "templates"
+    for rel_path in ["agents/a.md", "skills/foo/SKILL.md", "skills/foo/x.md"]:
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(rel_path)
+    load_manifest(root, refresh=True)
+    shutil.move(root / "skills/foo", tmp_path / "foo")
+
+    push = push_changes(AGENT_CONFIG[AgentType.CLAUDE_CODE], root, [], {Path("skills/foo")})
+
+    assert push.removed == [Path("skills/foo/SKILL.md"), Path("skills/foo/x.md")]
+    assert push.changed == []